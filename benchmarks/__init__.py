@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""btclib benchmarks.
+
+Each module is a stand-alone script to be run from the repository root,
+e.g.:
+
+    python -m benchmarks.bench_mult
+"""
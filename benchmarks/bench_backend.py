@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Benchmark of the big integer backends.
+
+Compare the available backends (see btclib.ecc.backend)
+on modular inversion and square root, scalar multiplication,
+and ECDSA/BIP340 signature and verification.
+gmpy2 must be installed for its backend to be available.
+"""
+
+import secrets
+from timeit import timeit
+
+from btclib.ecc import backend, dsa, ssa
+from btclib.ecc.curve import CURVES, mult
+from btclib.ecc.number_theory import mod_inv, mod_sqrt
+
+ec = CURVES["secp256k1"]
+NUMBER = 100
+
+
+def main() -> None:
+
+    q = secrets.randbelow(ec.n - 1) + 1
+    a = secrets.randbelow(ec.p - 1) + 1
+    a2 = a * a % ec.p
+    Q = mult(q)
+    msg = "Satoshi Nakamoto".encode()
+    dsa_sig = dsa.sign(msg, q)
+    ssa_sig = ssa.sign(msg, q)
+    Q_ssa = ssa.gen_keys(q)[1]
+    r1 = CURVES["secp256r1"]
+    Q_r1 = mult(q, ec=r1)
+
+    benchmarks = {
+        "mod_inv": lambda: mod_inv(a, ec.p),
+        "mod_sqrt": lambda: mod_sqrt(a2, ec.p),
+        "mult G": lambda: mult(q),
+        "mult Q": lambda: mult(q, Q),
+        "mult Q (secp256r1)": lambda: mult(q, Q_r1, r1),
+        "dsa.sign": lambda: dsa.sign(msg, q),
+        "dsa.verify": lambda: dsa.verify(msg, Q, dsa_sig),
+        "ssa.sign": lambda: ssa.sign(msg, q),
+        "ssa.verify": lambda: ssa.verify(msg, Q_ssa, ssa_sig),
+    }
+
+    default = backend.get_backend()
+    print(f"{NUMBER} runs each, times in ms per run")
+    print(f"{'':20}" + "".join(f"{name:>10}" for name in backend.BACKENDS))
+    try:
+        for label, func in benchmarks.items():
+            line = f"{label:20}"
+            for name in backend.BACKENDS:
+                backend.set_backend(name)
+                func()  # warm up, e.g. generator precomputed table
+                line += f"{timeit(func, number=NUMBER) * 1000 / NUMBER:10.3f}"
+            print(line)
+    finally:
+        backend.set_backend(default)
+
+
+if __name__ == "__main__":
+    main()
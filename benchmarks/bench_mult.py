@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Benchmark of the secp256k1 scalar multiplication algorithms.
+
+Compare the generic algorithms (fixed window and Shamir-Strauss)
+with the ones based on the efficient endomorphism,
+which are the default for secp256k1,
+and with the generator fixed-base precomputed table;
+compare also the constant-time and variable-time dispatchers
+used for signing and verification respectively.
+"""
+
+import secrets
+from timeit import timeit
+
+from btclib.ecc.curve import (
+    _double_mult_vartime,
+    _mult,
+    _mult_vartime,
+    secp256k1,
+)
+from btclib.ecc.curve_group import (
+    _double_mult,
+    jac_from_aff,
+    mult_fixed_base,
+    mult_fixed_window,
+)
+from btclib.ecc.curve_group_2 import (
+    double_mult_endomorphism_secp256k1,
+    mult_endomorphism_secp256k1,
+    mult_fixed_window_endomorphism_secp256k1,
+)
+from btclib.ecc.pedersen import second_generator
+
+ec = secp256k1
+HJ = jac_from_aff(second_generator(ec))
+NUMBER = 100
+
+
+def main() -> None:
+
+    u = secrets.randbelow(ec.n)
+    v = secrets.randbelow(ec.n)
+
+    print(f"secp256k1, {NUMBER} runs each")
+
+    generic = timeit(lambda: mult_fixed_window(u, HJ, ec), number=NUMBER)
+    glv = timeit(lambda: mult_endomorphism_secp256k1(u, HJ, ec), number=NUMBER)
+    glv_ct = timeit(
+        lambda: mult_fixed_window_endomorphism_secp256k1(u, HJ, ec), number=NUMBER
+    )
+    print(f"mult        fixed window : {generic:.3f}s")
+    print(f"mult        endomorphism : {glv:.3f}s ({generic / glv:.2f}x)")
+    print(f"mult        endom. fixw. : {glv_ct:.3f}s ({generic / glv_ct:.2f}x)")
+
+    generic = timeit(lambda: mult_fixed_window(u, ec.GJ, ec), number=NUMBER)
+    # table built at first use
+    fixed_base = timeit(lambda: mult_fixed_base(u, ec.GJ_table, ec), number=NUMBER)
+    print(f"mult G      fixed window : {generic:.3f}s")
+    print(f"mult G      fixed base   : {fixed_base:.3f}s ({generic / fixed_base:.2f}x)")
+
+    generic = timeit(lambda: _double_mult(u, HJ, v, ec.GJ, ec), number=NUMBER)
+    glv = timeit(
+        lambda: double_mult_endomorphism_secp256k1(u, HJ, v, ec.GJ, ec),
+        number=NUMBER,
+    )
+    print(f"double_mult Shamir       : {generic:.3f}s")
+    print(f"double_mult endomorphism : {glv:.3f}s ({generic / glv:.2f}x)")
+
+    # signing uses secret scalars, verification only public data
+    ct = timeit(
+        lambda: ec.add_jac(_mult(u, HJ, ec), _mult(v, ec.GJ, ec)), number=NUMBER
+    )
+    vartime = timeit(lambda: _double_mult_vartime(u, HJ, v, ec.GJ, ec), number=NUMBER)
+    print(f"u*H + v*G   constant time: {ct:.3f}s")
+    print(f"u*H + v*G   variable time: {vartime:.3f}s ({ct / vartime:.2f}x)")
+    ct = timeit(lambda: _mult(u, HJ, ec), number=NUMBER)
+    vartime = timeit(lambda: _mult_vartime(u, HJ, ec), number=NUMBER)
+    print(f"u*H         constant time: {ct:.3f}s")
+    print(f"u*H         variable time: {vartime:.3f}s ({ct / vartime:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Benchmark of the secp256k1 multi scalar multiplication algorithms.
+
+Compare Bos-Coster's and Pippenger's algorithms
+across batch sizes, using random scalars and affine (Z=1) points
+as in BIP340 batch verification.
+"""
+
+import secrets
+from timeit import timeit
+from typing import List
+
+from btclib.alias import JacPoint
+from btclib.ecc.curve import secp256k1
+from btclib.ecc.curve_group import (
+    PIPPENGER_THRESHOLD,
+    _multi_mult_bos_coster,
+    _multi_mult_pippenger,
+    _pippenger_window,
+)
+from btclib.exceptions import BTClibValueError
+
+ec = secp256k1
+SIZES = (2, 4, 16, 64, 256, 1000, 4000, 10000)
+
+
+def main() -> None:
+
+    print(f"secp256k1, Pippenger threshold: {PIPPENGER_THRESHOLD}")
+    print("    size  w  Bos-Coster   Pippenger  speedup")
+    points: List[JacPoint] = []
+    while len(points) < max(SIZES):
+        x = secrets.randbelow(ec.p)
+        try:
+            points.append((x, ec.y(x), 1))
+        except BTClibValueError:  # not a valid x-coordinate
+            pass
+
+    for size in SIZES:
+        scalars = [secrets.randbelow(ec.n) for _ in range(size)]
+        jac_points = points[:size]
+        w = _pippenger_window(size, ec.nlen)
+        bos_coster = timeit(
+            lambda: _multi_mult_bos_coster(scalars, jac_points, ec), number=1
+        )
+        pippenger = timeit(
+            lambda: _multi_mult_pippenger(scalars, jac_points, ec), number=1
+        )
+        print(
+            f"{size:8} {w:2} {bos_coster:10.3f}s {pippenger:10.3f}s"
+            f" {bos_coster / pippenger:7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Benchmark of the multi-process signature verification.
+
+Verify the same set of ECDSA and BIP340 signatures
+with verify_many (see btclib.ecc.parallel),
+using from one worker up to the number of available CPUs
+(at least two, to show the process pool overhead on single-core machines).
+"""
+
+import os
+from time import perf_counter
+
+from btclib.ecc import dsa, ssa
+from btclib.ecc.parallel import verify_many
+
+NUMBER = 1000
+
+
+def main() -> None:
+
+    dsa_items = []
+    ssa_items = []
+    for i in range(1, NUMBER + 1):
+        msg = i.to_bytes(4, byteorder="big", signed=False)
+        dsa_items.append((msg, dsa.gen_keys(i)[1], dsa.sign(msg, i)))
+        ssa_items.append((msg, ssa.gen_keys(i)[1], ssa.sign(msg, i)))
+
+    max_workers = max(os.cpu_count() or 1, 2)
+    # powers of two, and max_workers
+    counts = sorted(
+        {min(2 ** i, max_workers) for i in range(max_workers.bit_length() + 1)}
+    )
+    print(f"{NUMBER} signatures, times in s, speedup over 1 worker")
+    for scheme, items in (("dsa", dsa_items), ("ssa", ssa_items)):
+        base = 0.0
+        for workers in counts:
+            start = perf_counter()
+            assert all(verify_many(items, workers, scheme))
+            elapsed = perf_counter() - start
+            base = base or elapsed
+            speedup = base / elapsed
+            print(f"{scheme} {workers:3} workers: {elapsed:7.3f} {speedup:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
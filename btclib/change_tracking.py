@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Change tracking of mutable objects.
+
+Each in-place change of a ChangeTracked object, i.e. the reassignment
+of one of its attributes or the modification of one of its
+tracked list attributes (stored as ChangeTrackedList),
+stamps the object with a new change number,
+greater than all the previously issued ones.
+
+The latest change of an object is the greatest stamp among
+the object and its components (e.g. for a Tx: its TxIn, OutPoint,
+Witness, TxOut, and ScriptPubKey objects, and its vin and vout lists):
+any change of the object or of its components increases it,
+while changes of unrelated objects do not affect it.
+The values derived from an object (e.g. the Tx id) are memoized
+until its latest change increases.
+"""
+
+from itertools import count
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# increasing change stamps; next() is atomic, i.e. thread-safe
+_STAMPS = count(1)
+
+
+class ChangeTracked:
+    "Mixin tracking the in-place changes of its instances."
+
+    # stamp of the latest in-place change, 0 if never changed
+    _change = 0
+
+    # list attributes whose in-place changes are tracked too
+    _tracked_lists: Tuple[str, ...] = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self._tracked_lists and not isinstance(value, ChangeTrackedList):
+            value = ChangeTrackedList(value)
+        # the first assignment (i.e. the initialization) is not a change
+        if name in self.__dict__:
+            object.__setattr__(self, "_change", next(_STAMPS))
+        super().__setattr__(name, value)
+
+    def _latest_change(self) -> int:
+        "Return the latest change of the object and of its components."
+        return max(
+            [self._change]
+            + [getattr(self, name)._change for name in self._tracked_lists]
+        )
+
+    def _memo(self) -> Dict[str, Any]:
+        "Return the memoized values, valid up to the latest change."
+        latest_change = self._latest_change()
+        memo = self.__dict__.get("_memo_")
+        if memo is None or memo["_change"] != latest_change:
+            memo = {"_change": latest_change}
+            self.__dict__["_memo_"] = memo
+        return memo
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # change stamps are meaningful only in the current process
+        state = self.__dict__.copy()
+        state.pop("_change", None)
+        state.pop("_memo_", None)
+        return state
+
+
+class ChangeTrackedList(List[T]):
+    "List tracking its in-place changes."
+
+    _change = 0
+
+    def __reduce_ex__(self, protocol: Any) -> Tuple[Any, ...]:
+        # change stamps are meaningful only in the current process
+        return type(self), (list(self),)
+
+
+def _tracked(method: Callable[..., Any]) -> Callable[..., Any]:
+    def tracked_method(self: ChangeTrackedList, *args: Any, **kwargs: Any) -> Any:
+        self._change = next(_STAMPS)
+        return method(self, *args, **kwargs)
+
+    return tracked_method
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(ChangeTrackedList, _name, _tracked(getattr(list, _name)))
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Big integer backend for the elliptic curve arithmetic.
+
+Modular inversion and exponentiation are delegated to the backend,
+as well as the integer type used for the point coordinates
+inside scalar multiplications:
+
+* "gmpy2": gmpy2.mpz, gmpy2.invert, and gmpy2.powmod;
+  it is the default if gmpy2 is installed
+* "python": builtin int and pow (with -1 exponent for the inversion,
+  falling back to the extended Euclidean algorithm before python 3.8)
+
+Results are always returned as python int:
+the backends give identical results and can be switched
+at any time with set_backend.
+"""
+
+import sys
+from typing import Callable, Dict, Tuple
+
+from btclib.alias import JacPoint
+from btclib.exceptions import BTClibValueError
+
+try:
+    import gmpy2  # type: ignore  # pylint: disable=import-error
+except ImportError:  # pragma: no cover
+    gmpy2 = None
+
+
+def _invert_xgcd(a: int, m: int) -> int:  # pragma: no cover
+    "Return the inverse of a (mod m) using the extended Euclidean algorithm."
+
+    b, x0, x1 = m, 0, 1
+    while a != 0:
+        q, b, a = b // a, a, b % a
+        x0, x1 = x1, x0 - q * x1
+    if b != 1:
+        raise ValueError("base is not invertible for the given modulus")
+    return x0 % m
+
+
+def _invert_python(a: int, m: int) -> int:
+    return pow(a, -1, m)
+
+
+def _powmod_python(a: int, e: int, m: int) -> int:
+    return pow(a, e, m)
+
+
+def _jac_python(Q: JacPoint) -> JacPoint:
+    return Q
+
+
+def _invert_gmpy2(a: int, m: int) -> int:
+    try:
+        return int(gmpy2.invert(a, m))
+    except ZeroDivisionError as e:
+        raise ValueError("base is not invertible for the given modulus") from e
+
+
+def _powmod_gmpy2(a: int, e: int, m: int) -> int:
+    return int(gmpy2.powmod(a, e, m))
+
+
+def _jac_gmpy2(Q: JacPoint) -> JacPoint:
+    return gmpy2.mpz(Q[0]), gmpy2.mpz(Q[1]), gmpy2.mpz(Q[2])
+
+
+def _int_jac_gmpy2(Q: JacPoint) -> JacPoint:
+    return int(Q[0]), int(Q[1]), int(Q[2])
+
+
+_Backend = Tuple[
+    Callable[[int, int], int],
+    Callable[[int, int, int], int],
+    Callable[[JacPoint], JacPoint],
+    Callable[[JacPoint], JacPoint],
+]
+_BACKENDS: Dict[str, _Backend] = {
+    "python": (
+        _invert_python if sys.version_info >= (3, 8) else _invert_xgcd,
+        _powmod_python,
+        _jac_python,
+        _jac_python,
+    ),
+}
+if gmpy2 is not None:
+    _BACKENDS["gmpy2"] = (_invert_gmpy2, _powmod_gmpy2, _jac_gmpy2, _int_jac_gmpy2)
+
+BACKENDS: Tuple[str, ...] = tuple(_BACKENDS)
+
+# the following functions are set by set_backend:
+# always access them as module attributes, e.g. backend.invert(a, m)
+
+# the inverse of a (mod m), ValueError if it does not exist
+invert: Callable[[int, int], int]
+# a^e (mod m), with e non-negative
+powmod: Callable[[int, int, int], int]
+# Jacobian point with coordinates converted to the backend integer type
+jac: Callable[[JacPoint], JacPoint]
+# Jacobian point with coordinates converted to python int
+int_jac: Callable[[JacPoint], JacPoint]
+
+_backend = ""
+
+
+def get_backend() -> str:
+    "Return the name of the big integer backend in use."
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    "Set the big integer backend, see BACKENDS for the available ones."
+
+    global invert, powmod, jac, int_jac, _backend  # pylint: disable=global-statement
+
+    if name not in _BACKENDS:
+        raise BTClibValueError(f"unknown or unavailable backend: {name}")
+    invert, powmod, jac, int_jac = _BACKENDS[name]
+    _backend = name
+
+
+set_backend("gmpy2" if gmpy2 is not None else "python")
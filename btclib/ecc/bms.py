@@ -140,8 +140,9 @@ from typing import Optional, Tuple, Type, Union
 from btclib.alias import BinaryData, Octets, String
 from btclib.b32 import has_segwit_prefix, p2wpkh, witness_from_address
 from btclib.b58 import h160_from_address, p2pkh, p2wpkh_p2sh, wif_from_prv_key
-from btclib.ecc import dsa
+from btclib.ecc import dsa, sigcache
 from btclib.ecc.curve import mult, secp256k1
+from btclib.ecc.key_pair import KeyPair
 from btclib.ecc.sec_point import bytes_from_point
 from btclib.exceptions import BTClibValueError
 from btclib.hashes import hash160, magic_message
@@ -253,18 +254,25 @@ def gen_keys(
     return wif, p2pkh(wif)
 
 
-def sign(msg: Octets, prv_key: PrvKey, addr: Optional[String] = None) -> Sig:
+def sign(
+    msg: Octets, prv_key: Union[PrvKey, KeyPair], addr: Optional[String] = None
+) -> Sig:
     "Generate address-based compact signature for the provided message."
 
     # first sign the message
     magic_msg = magic_message(msg)
-    q, network, compressed = prv_keyinfo_from_prv_key(prv_key)
+    if isinstance(prv_key, KeyPair):
+        prv_key.assert_curve(secp256k1)
+        q, network, compressed = prv_key.q, prv_key.network, prv_key.compressed
+        Q = prv_key.Q
+    else:
+        q, network, compressed = prv_keyinfo_from_prv_key(prv_key)
+        Q = mult(q)
     dsa_sig = dsa.sign(magic_msg, q)
 
     # now calculate the key_id
     # TODO do the match in Jacobian coordinates avoiding mod_inv
     pub_keys = dsa.recover_pub_keys(magic_msg, dsa_sig)
-    Q = mult(q)
     # key_id is in [0, 3]
     # first two bits in rf are reserved for it
     key_id = pub_keys.index(Q)
@@ -345,12 +353,31 @@ def assert_as_valid(
 def verify(
     msg: Octets, addr: String, sig: Union[Sig, String], lower_s: bool = True
 ) -> bool:
-    "Verify address-based compact signature for the provided message."
+    """Verify address-based compact signature for the provided message.
+
+    The signature verification cache is used, if enabled
+    (see btclib.ecc.sigcache).
+    """
 
     # all kind of Exceptions are catched because
     # verify must always return a bool
     try:
-        assert_as_valid(msg, addr, sig, lower_s)
+        cache = sigcache.get_cache()
+        if cache is None:
+            assert_as_valid(msg, addr, sig, lower_s)
+            return True
+        if not isinstance(sig, Sig):
+            sig = Sig.b64decode(sig)
+        entry = cache.entry(
+            b"bms",
+            magic_message(msg),
+            addr.encode() if isinstance(addr, str) else bytes(addr),
+            sig.serialize(check_validity=False),
+            b"\x01" if lower_s else b"\x00",
+        )
+        if entry not in cache:
+            assert_as_valid(msg, addr, sig, lower_s)
+            cache.add(entry)
     except Exception:  # pylint: disable=broad-except
         return False
     else:
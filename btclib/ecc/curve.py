@@ -13,20 +13,36 @@
 import json
 from math import sqrt
 from os import path
-from typing import Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from btclib.alias import Integer, JacPoint, Point
+from btclib.ecc import backend
 from btclib.ecc.curve_group import (
     HEX_THRESHOLD,
     CurveGroup,
-    _double_mult,
-    _mult,
+)
+from btclib.ecc.curve_group import _double_mult as _double_mult_shamir
+from btclib.ecc.curve_group import (
     _multi_mult,
     jac_from_aff,
+    mult_fixed_base,
+    mult_fixed_window,
+    multiples_fixed_base,
+)
+from btclib.ecc.curve_group_2 import (
+    double_mult_endomorphism_secp256k1,
+    has_secp256k1_endomorphism,
+    mult_endomorphism_secp256k1,
+    mult_fixed_window_endomorphism_secp256k1,
+    multi_mult_w_NAF,
 )
 from btclib.exceptions import BTClibValueError
 from btclib.utils import hex_string, int_from_integer
 
+# window size of the generator fixed-base precomputed table:
+# 2^w points for each of the ceil(nlen/w) windows
+FIXED_BASE_W = 6
+
 
 class CurveSubGroup(CurveGroup):
     "Subgroup of the points of an elliptic curve over Fp generated by G."
@@ -109,7 +125,9 @@ class Curve(CurveSubGroup):
         if self.G[1] == 0:
             err_msg = "INF point cannot be a generator"
             raise BTClibValueError(err_msg)
-        jac_inf = _mult(n, self.GJ, self)
+        # the generic algorithm is used here, as the ones based
+        # on efficient endomorphism would reduce n mod n
+        jac_inf = mult_fixed_window(n, self.GJ, self)
         if jac_inf[2] != 0:
             err_msg = "n is not the group order: "
             err_msg += f"{hex_string(n)}" if n > HEX_THRESHOLD else f"{n}"
@@ -136,6 +154,25 @@ class Curve(CurveSubGroup):
 
         self.name = name
 
+        # efficient endomorphism (Gallant-Lambert-Vanstone method)
+        # available for scalar multiplication
+        self.glv = has_secp256k1_endomorphism(self)
+
+        # generator fixed-base precomputed tables, built at first use
+        # for each big integer backend
+        self._GJ_tables: Dict[str, List[List[Point]]] = {}
+
+    @property
+    def GJ_table(self) -> List[List[Point]]:
+        "Return the generator fixed-base precomputed table."
+
+        name = backend.get_backend()
+        if name not in self._GJ_tables:
+            self._GJ_tables[name] = multiples_fixed_base(
+                backend.jac(self.GJ), self.nlen, self, FIXED_BASE_W
+            )
+        return self._GJ_tables[name]
+
     def __str__(self) -> str:
         result = super().__str__()
         if self.n > HEX_THRESHOLD:
@@ -155,6 +192,124 @@ class Curve(CurveSubGroup):
         result += ")"
         return result
 
+    def __reduce_ex__(self, protocol: Any) -> Union[str, Tuple[Any, ...]]:
+        # standard curves are pickled by name: unpickling
+        # (e.g. in a worker process) returns the local instance,
+        # together with its already built precomputed tables
+        if self.name is not None and CURVES.get(self.name) is self:
+            return _curve_from_name, (self.name,)
+        return super().__reduce_ex__(protocol)
+
+
+def _mult(m: int, Q: JacPoint, ec: Curve) -> JacPoint:
+    """Scalar multiplication of a curve point in Jacobian coordinates.
+
+    The most efficient algorithm available for the curve is used
+    among those whose sequence of operations
+    does not depend on the (possibly secret) m coefficient:
+    the fixed-base precomputed table for the generator,
+    the fixed window with efficient endomorphism for secp256k1,
+    the generic fixed window otherwise.
+
+    The input point is assumed to be on curve.
+    """
+
+    if m < 0:
+        raise BTClibValueError(f"negative m: {hex(m)}")
+
+    if Q == ec.GJ:
+        R = mult_fixed_base(m % ec.n, ec.GJ_table, ec)
+    elif ec.glv:
+        R = mult_fixed_window_endomorphism_secp256k1(m, backend.jac(Q), ec)
+    else:
+        R = mult_fixed_window(m, backend.jac(Q), ec)
+    return backend.int_jac(R)
+
+
+def _double_mult(u: int, HJ: JacPoint, v: int, QJ: JacPoint, ec: Curve) -> JacPoint:
+    """Double scalar multiplication (u*H + v*Q) in Jacobian coordinates.
+
+    The most efficient algorithm available for the curve is used
+    among those whose sequence of operations
+    does not depend on the (possibly secret) u and v coefficients:
+    two _mult for the generator or for secp256k1,
+    the generic Shamir-Strauss otherwise.
+
+    The input points are assumed to be on curve.
+    """
+
+    if u < 0:
+        raise BTClibValueError(f"negative first coefficient: {hex(u)}")
+    if v < 0:
+        raise BTClibValueError(f"negative second coefficient: {hex(v)}")
+
+    if ec.glv or ec.GJ in (HJ, QJ):
+        return ec.add_jac(_mult(u, HJ, ec), _mult(v, QJ, ec))
+    R = _double_mult_shamir(u, backend.jac(HJ), v, backend.jac(QJ), ec)
+    return backend.int_jac(R)
+
+
+# Variable-time engine.
+#
+# The following functions skip zero digits and avoid useless additions,
+# so that their execution time depends on the scalar coefficients:
+# they must be used with public data only, e.g. for signature verification
+# and public key recovery, never with private keys or nonces.
+
+
+def _mult_vartime(m: int, Q: JacPoint, ec: Curve) -> JacPoint:
+    """Variable-time scalar multiplication in Jacobian coordinates.
+
+    The most efficient algorithm available for the curve is used:
+    the fixed-base precomputed table for the generator,
+    the interleaved wNAF with efficient endomorphism for secp256k1,
+    the generic wNAF otherwise.
+
+    It is not constant time: use it with public data only.
+    The input point is assumed to be on curve.
+    """
+
+    if m < 0:
+        raise BTClibValueError(f"negative m: {hex(m)}")
+
+    if Q == ec.GJ:
+        R = mult_fixed_base(m % ec.n, ec.GJ_table, ec)
+    elif ec.glv:
+        R = mult_endomorphism_secp256k1(m, backend.jac(Q), ec)
+    else:
+        R = multi_mult_w_NAF([m], [backend.jac(Q)], ec)
+    return backend.int_jac(R)
+
+
+def _double_mult_vartime(
+    u: int, HJ: JacPoint, v: int, QJ: JacPoint, ec: Curve
+) -> JacPoint:
+    """Variable-time double scalar multiplication (u*H + v*Q).
+
+    The most efficient algorithm available for the curve is used:
+    two _mult_vartime for the generator,
+    the interleaved wNAF with efficient endomorphism for secp256k1,
+    the generic interleaved wNAF otherwise.
+
+    It is not constant time: use it with public data only.
+    The input points are assumed to be on curve.
+    """
+
+    if u < 0:
+        raise BTClibValueError(f"negative first coefficient: {hex(u)}")
+    if v < 0:
+        raise BTClibValueError(f"negative second coefficient: {hex(v)}")
+
+    if ec.GJ in (HJ, QJ):
+        return ec.add_jac(_mult_vartime(u, HJ, ec), _mult_vartime(v, QJ, ec))
+    HJ = backend.jac(HJ)
+    QJ = backend.jac(QJ)
+    if ec.glv:
+        R = double_mult_endomorphism_secp256k1(u, HJ, v, QJ, ec)
+    else:
+        R = multi_mult_w_NAF([u, v], [HJ, QJ], ec)
+    return backend.int_jac(R)
+
 
 datadir = path.join(path.dirname(__file__), "_data")
 
@@ -208,6 +363,10 @@ CURVES.update(Brainpool)
 secp256k1 = CURVES["secp256k1"]
 
 
+def _curve_from_name(name: str) -> Curve:
+    return CURVES[name]
+
+
 def mult(m: Integer, Q: Optional[Point] = None, ec: Curve = secp256k1) -> Point:
     "Elliptic curve scalar multiplication."
     if Q is None:
@@ -243,7 +402,8 @@ def multi_mult(
 ) -> Point:
     """Return the multi scalar multiplication u1*Q1 + ... + un*Qn.
 
-    Use Bos-Coster's algorithm for efficient computation.
+    Use Bos-Coster's algorithm for small batches,
+    Pippenger's algorithm for large ones.
     """
 
     if len(scalars) != len(points):
@@ -259,7 +419,7 @@ def multi_mult(
             continue
         ints.append(i)
         ec.require_on_curve(Q)
-        jac_points.append(jac_from_aff(Q))
+        jac_points.append(backend.jac(jac_from_aff(Q)))
 
     R = _multi_mult(ints, jac_points, ec)
-    return ec.aff_from_jac(R)
+    return ec.aff_from_jac(backend.int_jac(R))
@@ -19,10 +19,10 @@ see the btclib.curve module.
 import functools
 import heapq
 from math import ceil
-from typing import List, Sequence, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from btclib.alias import INF, INFJ, Integer, JacPoint, Point
-from btclib.ecc.number_theory import legendre_symbol, mod_inv, mod_sqrt
+from btclib.ecc.number_theory import legendre_symbol, mod_inv, mod_inv_batch, mod_sqrt
 from btclib.exceptions import BTClibTypeError, BTClibValueError
 from btclib.utils import hex_string, int_from_integer
 
@@ -154,10 +154,30 @@ class CurveGroup:
         if Q[2] == 0:  # Infinity point in Jacobian coordinates
             return INF
 
-        Z2 = Q[2] * Q[2]
-        x = Q[0] * mod_inv(Z2, self.p)
-        y = Q[1] * mod_inv(Z2 * Q[2], self.p)
-        return x % self.p, y % self.p
+        Z_1 = mod_inv(Q[2], self.p)
+        Z_2 = Z_1 * Z_1 % self.p
+        return Q[0] * Z_2 % self.p, Q[1] * Z_2 * Z_1 % self.p
+
+    def aff_from_jac_batch(self, points: Sequence[JacPoint]) -> List[Point]:
+        """Return the affine representation of the Jacobian points.
+
+        Montgomery's simultaneous inversion trick is used:
+        a single modular inversion for all the points,
+        instead of one for each point.
+        """
+        # points are assumed to be on curve
+
+        # Z=0 for the infinity point in Jacobian coordinates
+        Z_1s = iter(mod_inv_batch([Q[2] for Q in points if Q[2] != 0], self.p))
+        result: List[Point] = []
+        for Q in points:
+            if Q[2] == 0:
+                result.append(INF)
+                continue
+            Z_1 = next(Z_1s)
+            Z_2 = Z_1 * Z_1 % self.p
+            result.append((Q[0] * Z_2 % self.p, Q[1] * Z_2 * Z_1 % self.p))
+        return result
 
     def x_aff_from_jac(self, Q: JacPoint) -> int:
         # point is assumed to be on curve
@@ -203,7 +223,34 @@ class CurveGroup:
         # while add_aff costs only one mod_inv
         return self.add_aff(Q1, Q2)
 
+    # the group law uses dedicated faster formulas for a=0 curves
+    # (e.g. secp256k1), selected from the curve parameters
+
     def add_jac(self, Q: JacPoint, R: JacPoint) -> JacPoint:
+        if self._a == 0:
+            return self._add_jac_a0(Q, R)
+        return self._add_jac(Q, R)
+
+    def add_mixed(self, Q: JacPoint, R: Point) -> JacPoint:
+        """Return the sum of a Jacobian point and an affine point.
+
+        Mixed coordinates addition (8M+3S) is cheaper than
+        Jacobian addition (12M+4S), as R is a Jacobian point with Z=1:
+        useful whenever the added point is known in affine coordinates,
+        e.g. precomputed tables or input points.
+        """
+        if self._a == 0:
+            return self._add_mixed_a0(Q, R)
+        return self._add_mixed(Q, R)
+
+    def double_jac(self, Q: JacPoint) -> JacPoint:
+        if self._a == 0:
+            return self._double_jac_a0(Q)
+        return self._double_jac(Q)
+
+    # generic group law
+
+    def _add_jac(self, Q: JacPoint, R: JacPoint) -> JacPoint:
         # points are assumed to be on curve
 
         # to have this funtion constant time,
@@ -258,7 +305,33 @@ class CurveGroup:
         i = (Q[2] == 0) + (R[2] == 0) * 2
         return ret_values[i]
 
-    def double_jac(self, Q: JacPoint) -> JacPoint:
+    def _add_mixed(self, Q: JacPoint, R: Point) -> JacPoint:
+        # points are assumed to be on curve
+
+        # Q equal to INFJ or R equal to INF are handled at the end, as in add_jac
+
+        QZ2 = Q[2] * Q[2] % self.p
+        H = (R[0] * QZ2 - Q[0]) % self.p
+        W = (R[1] * QZ2 * Q[2] - Q[1]) % self.p
+
+        if H == 0 and W == 0:  # point doubling
+            return self._double_jac(Q)
+
+        # if H == 0 (opposite points) then Z is zero, i.e. INFJ
+        H2 = H * H % self.p
+        H3 = H2 * H % self.p
+        V = Q[0] * H2
+        X = (W * W - H3 - 2 * V) % self.p
+        Y = (W * (V - X) - Q[1] * H3) % self.p
+        Z = Q[2] * H % self.p
+
+        # possible return values are:
+        ret_values = [(X, Y, Z), (R[0], R[1], 1), Q, INFJ]
+        #      Q==INFJ  +    R==INF   * 2
+        i = (Q[2] == 0) + (R[1] == 0) * 2
+        return ret_values[i]
+
+    def _double_jac(self, Q: JacPoint) -> JacPoint:
         # point is assumed to be on curve
 
         QZ2 = Q[2] * Q[2]
@@ -270,6 +343,79 @@ class CurveGroup:
         Z = 2 * Q[1] * Q[2]
         return X % self.p, Y % self.p, Z % self.p
 
+    # a=0 group law, see https://hyperelliptic.org/EFD/g1p/auto-shortw-jacobian-0.html
+    # INF(J) inputs are handled at the end, as in add_jac
+
+    def _add_jac_a0(self, Q: JacPoint, R: JacPoint) -> JacPoint:
+        "Return the sum of two Jacobian points (add-2007-bl, 11M+5S)."
+
+        p = self.p
+        QZ2 = Q[2] * Q[2] % p
+        RZ2 = R[2] * R[2] % p
+        U1 = Q[0] * RZ2 % p
+        U2 = R[0] * QZ2 % p
+        S1 = Q[1] * R[2] * RZ2 % p
+        S2 = R[1] * Q[2] * QZ2 % p
+        H = (U2 - U1) % p
+        W = 2 * (S2 - S1) % p
+
+        if H == 0 and W == 0:  # point doubling
+            return self._double_jac_a0(Q)
+
+        # if H == 0 (opposite points) then Z is zero, i.e. INFJ
+        HH4 = 4 * H * H % p
+        J = H * HH4 % p
+        V = U1 * HH4 % p
+        X = (W * W - J - 2 * V) % p
+        Y = (W * (V - X) - 2 * S1 * J) % p
+        Z = ((Q[2] + R[2]) ** 2 - QZ2 - RZ2) * H % p
+
+        if Q[2] == 0:
+            return R
+        if R[2] == 0:
+            return Q
+        return X, Y, Z
+
+    def _add_mixed_a0(self, Q: JacPoint, R: Point) -> JacPoint:
+        "Return the sum of a Jacobian and an affine point (madd-2007-bl, 7M+4S)."
+
+        p = self.p
+        QZ2 = Q[2] * Q[2] % p
+        H = (R[0] * QZ2 - Q[0]) % p
+        W = 2 * (R[1] * Q[2] * QZ2 - Q[1]) % p
+
+        if H == 0 and W == 0:  # point doubling
+            return self._double_jac_a0(Q)
+
+        # if H == 0 (opposite points) then Z is zero, i.e. INFJ
+        HH = H * H % p
+        HH4 = 4 * HH
+        J = H * HH4 % p
+        V = Q[0] * HH4 % p
+        X = (W * W - J - 2 * V) % p
+        Y = (W * (V - X) - 2 * Q[1] * J) % p
+        Z = ((Q[2] + H) ** 2 - QZ2 - HH) % p
+
+        if R[1] == 0:
+            return Q
+        if Q[2] == 0:
+            return R[0], R[1], 1
+        return X, Y, Z
+
+    def _double_jac_a0(self, Q: JacPoint) -> JacPoint:
+        "Return the double of a Jacobian point (dbl-2009-l, 2M+5S)."
+
+        p = self.p
+        A = Q[0] * Q[0] % p
+        B = Q[1] * Q[1] % p
+        C = B * B % p
+        D = 2 * ((Q[0] + B) ** 2 - A - C) % p
+        E = 3 * A
+        X = (E * E - 2 * D) % p
+        Y = (E * (D - X) - 8 * C) % p
+        Z = 2 * Q[1] * Q[2] % p
+        return X, Y, Z
+
     def add_aff(self, Q: Point, R: Point) -> Point:
         # points are assumed to be on curve
 
@@ -533,6 +679,65 @@ def cached_multiples_fixwind(
     return T
 
 
+def multiples_fixed_base(
+    Q: JacPoint, bits: int, ec: CurveGroup, w: int = 4
+) -> List[List[Point]]:
+    """Return the fixed-base precomputed table for Q.
+
+    T[k][d] = d * 2^(k*w) * Q for d in {0, ..., 2^w-1},
+    with enough k values to cover bits-long coefficients.
+    See mult_fixed_base.
+
+    The table is normalized to affine coordinates
+    (with a single batch inversion),
+    so that mixed addition can be used.
+    """
+
+    if w <= 0:
+        raise BTClibValueError(f"non positive w: {w}")
+
+    TJ: List[JacPoint] = []
+    K = Q
+    for _ in range(ceil(bits / w)):
+        sublist = multiples(K, 2 ** w, ec) if w > 1 else [INFJ, K]
+        TJ.extend(sublist)
+        K = ec.double_jac(sublist[2 ** (w - 1)])
+    T = ec.aff_from_jac_batch(TJ)
+    return [T[i : i + 2 ** w] for i in range(0, len(T), 2 ** w)]
+
+
+def mult_fixed_base(m: int, T: List[List[Point]], ec: CurveGroup) -> JacPoint:
+    """Scalar multiplication using a fixed-base precomputed table.
+
+    This implementation uses
+    'right-to-left' window decomposition of the m coefficient,
+    Jacobian coordinates.
+
+    Thanks to the precomputed affine table T (see multiples_fixed_base),
+    it just needs one mixed addition for each window:
+    it is well suited for the multiplication of a fixed point,
+    e.g. the curve generator.
+
+    The m coefficient is assumed to have been reduced mod n
+    if appropriate (e.g. cyclic groups of order n).
+    """
+
+    if m < 0:
+        raise BTClibValueError(f"negative m: {hex(m)}")
+
+    w = len(T[0]).bit_length() - 1
+    if m >> (w * len(T)):
+        raise BTClibValueError(f"m too big for the precomputed table: {hex(m)}")
+
+    mask = 2 ** w - 1
+    R = INFJ
+    for sublist in T:
+        # always perform the 'add', even if useless, to be constant-time
+        R = ec.add_mixed(R, sublist[m & mask])
+        m >>= w
+    return R
+
+
 def convert_number_to_base(i: int, base: int) -> List[int]:
     "Return the digits of an integer in the requested base."
 
@@ -632,17 +837,19 @@ def mult_fixed_window(
     # T = cached_multiples(Q, ec)
     # T = multiples(Q, 2 ** w, ec)
 
-    T = cached_multiples(Q, ec) if cached else multiples(Q, 2 ** w, ec)
+    TJ = cached_multiples(Q, ec) if cached else multiples(Q, 2 ** w, ec)
+    # affine normalization allows the cheaper mixed addition
+    T = ec.aff_from_jac_batch(TJ)
 
     digits = convert_number_to_base(m, 2 ** w)
 
-    R = T[digits[0]]
+    R = jac_from_aff(T[digits[0]])
     for i in digits[1:]:
         # multiple 'double'
         for _ in range(w):
             R = ec.double_jac(R)
         # and 'add'
-        R = ec.add_jac(R, T[i])
+        R = ec.add_mixed(R, T[i])
     return R
 
 
@@ -717,29 +924,58 @@ def _double_mult(
     if v < 0:
         raise BTClibValueError(f"negative second coefficient: {hex(v)}")
 
-    # at each step one of the following points will be added
-    T = [INFJ, HJ, QJ, ec.add_jac(HJ, QJ)]
+    # at each step one of the following points will be added;
+    # affine normalization allows the cheaper mixed addition
+    T = ec.aff_from_jac_batch([INFJ, HJ, QJ, ec.add_jac(HJ, QJ)])
     # which one depends on binary digit for that step
     ui = bin(u)[2:]
     vi = bin(v)[2:].zfill(len(ui))
     ui = ui.zfill(len(vi))
     digits = [int(j) + 2 * int(k) for j, k in zip(ui, vi)]
     # R[0] is the running result, R[1] = R[0] + T[*] is an ancillary variable
-    R = T[digits[0]]
+    R = jac_from_aff(T[digits[0]])
     for i in digits[1:]:
         # the doubling part of 'double & add'
         R = ec.double_jac(R)
         # always perform the 'add', even if useless, to be constant-time
         # 'add' it to R[0] only if appropriate
-        R = ec.add_jac(R, T[i])
+        R = ec.add_mixed(R, T[i])
     return R
 
 
+# minimum number of points for the Pippenger multi scalar multiplication:
+# below it Bos-Coster's algorithm is faster
+PIPPENGER_THRESHOLD = 16
+
+
 def _multi_mult(
     scalars: Sequence[int], jac_points: Sequence[JacPoint], ec: CurveGroup
 ) -> JacPoint:
     """Return the multi scalar multiplication u1*Q1 + ... + un*Qn.
 
+    Use Bos-Coster's algorithm for small batches,
+    Pippenger's algorithm for large ones.
+
+    The input points are assumed to be on curve,
+    the scalar coefficients are assumed to have been reduced mod n
+    if appropriate (e.g. cyclic groups of order n).
+    """
+
+    if len(scalars) != len(jac_points):
+        err_msg = "mismatch between number of scalars and points: "
+        err_msg += f"{len(scalars)} vs {len(jac_points)}"
+        raise BTClibValueError(err_msg)
+
+    if len(scalars) < PIPPENGER_THRESHOLD:
+        return _multi_mult_bos_coster(scalars, jac_points, ec)
+    return _multi_mult_pippenger(scalars, jac_points, ec)
+
+
+def _multi_mult_bos_coster(
+    scalars: Sequence[int], jac_points: Sequence[JacPoint], ec: CurveGroup
+) -> JacPoint:
+    """Return the multi scalar multiplication u1*Q1 + ... + un*Qn.
+
     Use Bos-Coster's algorithm for efficient computation.
 
     The input points are assumed to be on curve,
@@ -771,8 +1007,11 @@ def _multi_mult(
         np2 = heapq.heappop(x)
         n_1, p_1 = -np1[0], np1[1]
         n_2, p_2 = -np2[0], np2[1]
-        p_2 = ec.add_jac(p_1, p_2)
-        n_1 -= n_2
+        # n_1*p_1 + n_2*p_2 = (n_1 - q*n_2)*p_1 + n_2*(p_2 + q*p_1)
+        q, n_1 = divmod(n_1, n_2)
+        # q > 1 only for unbalanced coefficients:
+        # avoid q successive additions (i.e. a never-ending loop)
+        p_2 = ec.add_jac(p_1 if q == 1 else _mult(q, p_1, ec), p_2)
         if n_1 > 0:
             heapq.heappush(x, (-n_1, p_1))
         heapq.heappush(x, (-n_2, p_2))
@@ -781,3 +1020,89 @@ def _multi_mult(
     # assert n_1 < ec.n, "better to take the mod n"
     # n_1 %= ec.n
     return _mult(n_1, p_1, ec)
+
+
+def _pippenger_window(size: int, bits: int) -> int:
+    "Return the window size minimizing the Pippenger's algorithm cost."
+
+    # each window costs one (mixed) addition per point
+    # and two (Jacobian, i.e. about twice as expensive) additions
+    # per bucket (running sums)
+    def cost(w: int) -> int:
+        return ceil(bits / w) * (size + 2 ** (w + 2))
+
+    return min(range(1, 21), key=cost)
+
+
+def _multi_mult_pippenger(
+    scalars: Sequence[int], jac_points: Sequence[JacPoint], ec: CurveGroup
+) -> JacPoint:
+    """Return the multi scalar multiplication u1*Q1 + ... + un*Qn.
+
+    Use Pippenger's (bucket) algorithm for efficient computation
+    of large batches, with window size tuned to the batch size.
+
+    For each w-bit window of the scalars, each point is added
+    to the bucket selected by its window digit; the buckets are
+    then summed up, each one weighted by its digit, using running sums.
+    Buckets are finally combined with 'multiple-double & add'.
+
+    It is not constant time.
+
+    The input points are assumed to be on curve,
+    the scalar coefficients are assumed to have been reduced mod n
+    if appropriate (e.g. cyclic groups of order n).
+    """
+
+    if len(scalars) != len(jac_points):
+        err_msg = "mismatch between number of scalars and points: "
+        err_msg += f"{len(scalars)} vs {len(jac_points)}"
+        raise BTClibValueError(err_msg)
+
+    ints: List[int] = []
+    points: List[JacPoint] = []
+    for n, PJ in zip(scalars, jac_points):
+        if n == 0:
+            continue
+        if n < 0:
+            raise BTClibValueError(f"negative coefficient: {hex(n)}")
+        ints.append(n)
+        points.append(PJ)
+
+    # points are normalized to affine coordinates with a single inversion,
+    # so that the bucket accumulation uses mixed coordinates addition
+    pairs = [(n, P) for n, P in zip(ints, ec.aff_from_jac_batch(points)) if P[1] != 0]
+
+    if not pairs:
+        return INFJ
+
+    bits = max(n for n, _ in pairs).bit_length()
+    w = _pippenger_window(len(pairs), bits)
+    mask = 2 ** w - 1
+
+    R = INFJ
+    for shift in range(w * ceil(bits / w) - w, -1, -w):
+        for _ in range(w):
+            R = ec.double_jac(R)
+
+        # empty buckets are None, avoiding useless additions of INFJ
+        buckets: List[Optional[JacPoint]] = [None] * (mask + 1)
+        for n, P in pairs:
+            d = (n >> shift) & mask
+            if d:
+                B = buckets[d]
+                buckets[d] = (P[0], P[1], 1) if B is None else ec.add_mixed(B, P)
+
+        # sum_d d * B_d = sum_d (B_mask + ... + B_d)
+        running: Optional[JacPoint] = None
+        window_sum: Optional[JacPoint] = None
+        for B in reversed(buckets[1:]):
+            if B is not None:
+                running = B if running is None else ec.add_jac(running, B)
+            if running is not None:
+                window_sum = (
+                    running if window_sum is None else ec.add_jac(window_sum, running)
+                )
+        if window_sum is not None:
+            R = ec.add_jac(R, window_sum)
+    return R
@@ -16,6 +16,9 @@ The implemented algorithms are:
     - Fixed window
     - Sliding window
     - w-ary non-adjacent form (wNAF)
+    - Interleaved wNAF
+    - Interleaved wNAF with efficient endomorphism (secp256k1 only)
+    - Fixed window with efficient endomorphism (secp256k1 only)
 
 References:
     - https://en.wikipedia.org/wiki/Elliptic_curve_point_multiplication
@@ -37,15 +40,14 @@ TODO:
     - Peter Dettman's field inverses and square roots using a sliding window over blocks of 1s
         -https://briansmith.org/ecc-inversion-addition-chains-01
     - Joint sparse form (JSF) for double mult
-    -  Interleaving with NAFs
 """
 
 
 from math import ceil
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
-from btclib.alias import INFJ, JacPoint
-from btclib.ecc.curve_group import CurveGroup, _double_mult, convert_number_to_base
+from btclib.alias import INFJ, JacPoint, Point
+from btclib.ecc.curve_group import CurveGroup, convert_number_to_base, multiples
 from btclib.exceptions import BTClibValueError
 
 
@@ -206,10 +208,38 @@ def mult_w_NAF(m: int, Q: JacPoint, ec: CurveGroup, w: int = 4) -> JacPoint:
     return R
 
 
+# secp256k1 efficient endomorphism parameters,
+# see D. Hankerson, 'Guide to Elliptic Curve Cryptography' chapter 3.5
+# and https://github.com/bitcoin-core/secp256k1/blob/master/src/scalar_impl.h
+SECP256K1_P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+# beta is a cube root of unity in Fp, lambda is a cube root of unity in Fn:
+# lambda*(x, y) = (beta*x, y) for every point of the curve
+BETA = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+LAMBDA = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+# short basis of the lattice {(x, y) | x + y*lambda = 0 mod n}
+A1 = 0x3086D221A7D46BCDE86C90E49284EB15
+B1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+A2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+B2 = A1
+
+# wNAF width for the half-length scalars of the endomorphism multiplication
+GLV_W = 5
+
+
+def has_secp256k1_endomorphism(ec: CurveGroup) -> bool:
+    "Return True if the curve group is the secp256k1 one."
+
+    # cofactor is one: lambda*Q = (beta*x, y) holds for every point
+    # pylint: disable=protected-access
+    return (ec.p, ec._a, ec._b) == (SECP256K1_P, 0, 7)
+
+
 def multiplier_decomposer(m: int, ec: CurveGroup) -> Tuple[int, int]:
     """Decompose m in two integers m1 e m2 so that mP = m1*P + m2*lambda*P.
 
     Used for point multiplication with efficiently computable endomorphisms.
+    m1 and m2 are signed integers of about half the bit-length of m.
 
     Based on alghoritm 3.74 of
     D. Hankerson, 'Guide to Elliptic Curve Cryptography'.
@@ -217,38 +247,214 @@ def multiplier_decomposer(m: int, ec: CurveGroup) -> Tuple[int, int]:
     """
 
     if m < 0:
-        raise ValueError(f"negative m: {hex(m)}")
+        raise BTClibValueError(f"negative m: {hex(m)}")
 
-    m %= ec.p
+    if not has_secp256k1_endomorphism(ec):
+        raise BTClibValueError("not the secp256k1 curve group")
+
+    n = SECP256K1_N
+    m %= n
 
     # balanced length-two representation of a multiplier m.
-    # values for secp256k1.
     # https://medium.com/@CoinExChain/acceleration-of-ecdsa-verification-with-endomorphism-mapping-of-secp256k1-126e77a51dba
-    a1 = 0x3086D221A7D46BCDE86C90E49284EB15 % ec.p
-    b1 = -0xE4437ED6010E88286F547FA90ABFE4C3 % ec.p
-    a2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8 % ec.p
-    b2 = 0x3086D221A7D46BCDE86C90E49284EB15 % ec.p
+    # c1 = round(b2 * m / n), c2 = round(-b1 * m / n)
+    c1 = (B2 * m + n // 2) // n
+    c2 = (-B1 * m + n // 2) // n
 
-    c1 = ceil(b2 * m / ec.p)
-    c2 = ceil((-1) * b1 * m / ec.p)
+    m1 = m - c1 * A1 - c2 * A2
+    m2 = -c1 * B1 - c2 * B2
 
-    m1 = m - (a1 * c1) - (a2 * c2)
-    m2 = -(c1 * b1) - (c2 * b2)
+    return m1, m2
 
-    return m1 % ec.p, m2 % ec.p
 
+def _odd_multiples(Q: JacPoint, w: int, ec: CurveGroup) -> List[JacPoint]:
+    "Return [Q, 3Q, 5Q, ..., (2^(w-1)-1)Q], i.e. the wNAF table."
+
+    Q2 = ec.double_jac(Q)
+    T = [Q]
+    for _ in range(1, 2 ** (w - 2)):
+        T.append(ec.add_jac(T[-1], Q2))
+    return T
+
+
+def _interleaved_w_NAF(
+    scalars: Sequence[int], tables: Sequence[List[Point]], ec: CurveGroup, w: int
+) -> JacPoint:
+    """Return the multi scalar multiplication using interleaved wNAFs.
+
+    The i-th table must be the affine odd multiples table of the i-th point.
+    A single 'double' loop is shared by all the scalars,
+    while the (mixed) 'add' is performed only for non-zero digits.
+
+    It is not constant time.
+
+    Based on alghoritm 3.51 of
+    D. Hankerson, 'Guide to Elliptic Curve Cryptography'.
+    """
+
+    nafs = [wNAF_of_m(m, w) for m in scalars]
+    R = INFJ
+    for i in range(max((len(naf) for naf in nafs), default=0) - 1, -1, -1):
+        R = ec.double_jac(R)
+        for naf, T in zip(nafs, tables):
+            if i < len(naf) and naf[i]:
+                d = naf[i]
+                R = ec.add_mixed(R, T[d >> 1] if d > 0 else ec.negate(T[-d >> 1]))
+    return R
+
+
+def multi_mult_w_NAF(
+    scalars: Sequence[int], jac_points: Sequence[JacPoint], ec: CurveGroup, w: int = 5
+) -> JacPoint:
+    """Return the multi scalar multiplication u1*Q1 + ... + un*Qn.
+
+    This implementation uses interleaved wNAFs:
+    the odd multiples tables of all the points are normalized
+    to affine coordinates with a single batch inversion,
+    then a single 'double' loop is shared by all the scalars.
+
+    It is not constant time: use it with public data only.
+    For 256-bit scalars it is suggested to choose w=5.
+
+    The input points are assumed to be on curve,
+    the scalar coefficients are assumed to have been reduced mod n
+    if appropriate (e.g. cyclic groups of order n).
+    """
+
+    if len(scalars) != len(jac_points):
+        err_msg = "mismatch between number of scalars and points: "
+        err_msg += f"{len(scalars)} vs {len(jac_points)}"
+        raise BTClibValueError(err_msg)
+
+    if any(m < 0 for m in scalars):
+        raise BTClibValueError("negative coefficient")
+
+    # a number cannot be written in basis 1 (ie w=0)
+    if w <= 1:
+        raise BTClibValueError(f"w too low: {w}")
+
+    size = 2 ** (w - 2)
+    TJ: List[JacPoint] = []
+    for QJ in jac_points:
+        TJ.extend(_odd_multiples(QJ, w, ec))
+    T = ec.aff_from_jac_batch(TJ)
+    tables = [T[i : i + size] for i in range(0, len(T), size)]
+    return _interleaved_w_NAF(scalars, tables, ec, w)
 
-def mult_endomorphism_secp256k1(m: int, Q: JacPoint, ec: CurveGroup) -> JacPoint:
-    "Scalar multiplication in Jacobian coordinates using efficient endomorphism."
+
+def _endomorphism_split(
+    m: int, T: List[Point], ec: CurveGroup
+) -> Tuple[int, List[Point], int, List[Point]]:
+    """Return |m1|, table(±Q), |m2|, table(±lambda*Q) with mQ = m1*Q + m2*lambda*Q.
+
+    T must be the affine odd multiples table of Q.
+    """
 
     m1, m2 = multiplier_decomposer(m, ec)
+    # lambda*(kQ) = k*(lambda*Q): the second table costs only multiplications
+    T_lam = [((BETA * P[0]) % ec.p, P[1]) for P in T]
+    if m1 < 0:
+        m1 = -m1
+        T = [ec.negate(P) for P in T]
+    if m2 < 0:
+        m2 = -m2
+        T_lam = [ec.negate(P) for P in T_lam]
+    return m1, T, m2, T_lam
+
+
+def mult_endomorphism_secp256k1(m: int, Q: JacPoint, ec: CurveGroup) -> JacPoint:
+    """Scalar multiplication in Jacobian coordinates using efficient endomorphism.
+
+    The m coefficient is split in two half-length scalars
+    (Gallant-Lambert-Vanstone method) which are then multiplied
+    using interleaved wNAFs: the number of 'double' is halved.
+
+    It is not constant time.
 
-    # Values for the efficient endomorphism multiplication
-    # see D. Hankerson, 'Guide to Elliptic Curve Cryptography' chapter 3.5
-    # lam = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
-    beta = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
+    The input point is assumed to be on the secp256k1 curve.
+    """
+
+    if m < 0:
+        raise BTClibValueError(f"negative m: {hex(m)}")
+
+    T = ec.aff_from_jac_batch(_odd_multiples(Q, GLV_W, ec))
+    m1, T, m2, T_lam = _endomorphism_split(m, T, ec)
+    return _interleaved_w_NAF([m1, m2], [T, T_lam], ec, GLV_W)
 
-    K = ((Q[0] * beta) % ec.p), Q[1], Q[2]  # K = lambda*Q, direct calculation
 
-    # FIXME: Change double mult (?) with alghoritm 3.77
-    return _double_mult(m1, Q, m2, K, ec)
+def double_mult_endomorphism_secp256k1(
+    u: int, HJ: JacPoint, v: int, QJ: JacPoint, ec: CurveGroup
+) -> JacPoint:
+    """Double scalar multiplication (u*H + v*Q) using efficient endomorphism.
+
+    Both u and v are split in two half-length scalars
+    (Gallant-Lambert-Vanstone method) and the resulting
+    four scalar multiplications share a single 'double' loop
+    using interleaved wNAFs.
+
+    It is not constant time.
+
+    The input points are assumed to be on the secp256k1 curve.
+    """
+
+    if u < 0:
+        raise BTClibValueError(f"negative first coefficient: {hex(u)}")
+    if v < 0:
+        raise BTClibValueError(f"negative second coefficient: {hex(v)}")
+
+    # a single batch inversion normalizes both tables
+    T = ec.aff_from_jac_batch(
+        _odd_multiples(HJ, GLV_W, ec) + _odd_multiples(QJ, GLV_W, ec)
+    )
+    size = len(T) // 2
+    u1, TH, u2, TH_lam = _endomorphism_split(u, T[:size], ec)
+    v1, TQ, v2, TQ_lam = _endomorphism_split(v, T[size:], ec)
+    return _interleaved_w_NAF([u1, u2, v1, v2], [TH, TH_lam, TQ, TQ_lam], ec, GLV_W)
+
+
+def mult_fixed_window_endomorphism_secp256k1(
+    m: int, Q: JacPoint, ec: CurveGroup, w: int = 4
+) -> JacPoint:
+    """Scalar multiplication using "fixed window" and efficient endomorphism.
+
+    The m coefficient is split in two half-length scalars
+    (Gallant-Lambert-Vanstone method) which are then multiplied
+    sharing a single 'multiple-double & add' loop:
+    the number of 'double' is halved.
+
+    Differently from mult_endomorphism_secp256k1,
+    the sequence of operations does not depend on the m coefficient:
+    the number of windows is fixed and
+    the 'add' is always performed, even if useless.
+
+    The input point is assumed to be on the secp256k1 curve.
+    """
+
+    if m < 0:
+        raise BTClibValueError(f"negative m: {hex(m)}")
+
+    # a number cannot be written in basis 1 (ie w=0)
+    if w <= 0:
+        raise BTClibValueError(f"non positive w: {w}")
+
+    m1, m2 = multiplier_decomposer(m, ec)
+
+    # at each step one of the points in T and one in T_lam will be added
+    T = ec.aff_from_jac_batch(multiples(Q, 2 ** w, ec))
+    T_lam = [((BETA * P[0]) % ec.p, P[1]) for P in T]
+    # the sign of m1 (m2) selects the table of Q (-Q) multiples
+    T = [T, [ec.negate(P) for P in T]][m1 < 0]
+    T_lam = [T_lam, [ec.negate(P) for P in T_lam]][m2 < 0]
+    m1, m2 = abs(m1), abs(m2)
+
+    mask = 2 ** w - 1
+    # half-length scalars are at most 129 bits
+    R = INFJ
+    for k in range(ceil(129 / w) - 1, -1, -1):
+        # multiple 'double'
+        for _ in range(w):
+            R = ec.double_jac(R)
+        # and 'add'
+        R = ec.add_mixed(R, T[(m1 >> (k * w)) & mask])
+        R = ec.add_mixed(R, T_lam[(m2 >> (k * w)) & mask])
+    return R
@@ -20,16 +20,25 @@
 
 import secrets
 from hashlib import sha256
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 from btclib.alias import HashF, JacPoint, Octets, Point
-from btclib.ecc.curve import Curve, secp256k1
-from btclib.ecc.curve_group import _double_mult, _mult
+from btclib.ecc import backend, sigcache
+from btclib.ecc.curve import (
+    Curve,
+    _double_mult_vartime,
+    _mult,
+    _multi_mult,
+    secp256k1,
+)
 from btclib.ecc.der import Sig
+from btclib.ecc.key_pair import KeyPair
 from btclib.ecc.number_theory import mod_inv
-from btclib.ecc.rfc6979 import _rfc6979_
+from btclib.ecc.rfc6979 import _rfc6979_, _rfc6979_midstate
+from btclib.ecc.sec_point import bytes_from_point
 from btclib.exceptions import BTClibRuntimeError, BTClibValueError
 from btclib.hashes import challenge_, reduce_to_hlen
+from btclib.pool import map_shards
 from btclib.to_prv_key import PrvKey, int_from_prv_key
 from btclib.to_pub_key import Key, point_from_key
 from btclib.utils import bytes_from_octets
@@ -82,7 +91,7 @@ def _sign_(c: int, q: int, nonce: int, lower_s: bool, ec: Curve) -> Sig:
 
 def sign_(
     msg_hash: Octets,
-    prv_key: PrvKey,
+    prv_key: Union[PrvKey, KeyPair],
     nonce: Optional[PrvKey] = None,
     lower_s: bool = True,
     ec: Curve = secp256k1,
@@ -100,7 +109,11 @@ def sign_(
 
     # the secret key q: an integer in the range 1..n-1.
     # SEC 1 v.2 section 3.2.1
-    q = int_from_prv_key(prv_key, ec)
+    if isinstance(prv_key, KeyPair):
+        prv_key.assert_curve(ec)
+        q = prv_key.q
+    else:
+        q = int_from_prv_key(prv_key, ec)
 
     # the challenge
     c = challenge_(msg_hash, ec, hf)  # 4, 5
@@ -117,7 +130,7 @@ def sign_(
 
 def sign(
     msg: Octets,
-    prv_key: PrvKey,
+    prv_key: Union[PrvKey, KeyPair],
     nonce: Optional[PrvKey] = None,
     lower_s: bool = True,
     ec: Curve = secp256k1,
@@ -147,6 +160,65 @@ def sign(
     return sign_(msg_hash, prv_key, nonce, lower_s, ec, hf)
 
 
+def _sign_batch_(
+    q: int, lower_s: bool, ec: Curve, hf: HashF, m_hashes: Sequence[bytes]
+) -> List[Sig]:
+    # sign all messages in-process, sharing the RFC6979 HMAC midstate
+
+    midstate = _rfc6979_midstate(q, ec, hf)
+    sigs: List[Sig] = []
+    for msg_hash in m_hashes:
+        c = challenge_(msg_hash, ec, hf)
+        nonce = _rfc6979_(c, q, ec, hf, midstate)
+        sigs.append(_sign_(c, q, nonce, lower_s, ec))
+    return sigs
+
+
+def sign_batch_(
+    m_hashes: Sequence[Octets],
+    prv_key: Union[PrvKey, KeyPair],
+    lower_s: bool = True,
+    ec: Curve = secp256k1,
+    hf: HashF = sha256,
+    workers: int = 1,
+) -> List[Sig]:
+    """Sign many hf_len bytes messages with the same private key.
+
+    The RFC6979 deterministic nonce is used: signatures are
+    the same as sign_ ones, returned in the order of the messages.
+    The private key is parsed only once and the RFC6979 HMAC state
+    after the private key is shared among messages.
+    With more than one worker, the messages are signed
+    by a process pool (see btclib.pool).
+    """
+
+    # the messages msg_hash: hf_len arrays
+    hf_len = hf().digest_size
+    m_hashes = [bytes_from_octets(msg_hash, hf_len) for msg_hash in m_hashes]
+
+    if isinstance(prv_key, KeyPair):
+        prv_key.assert_curve(ec)
+        q = prv_key.q
+    else:
+        q = int_from_prv_key(prv_key, ec)
+
+    return map_shards(_sign_batch_, m_hashes, (q, lower_s, ec, hf), workers)
+
+
+def sign_batch(
+    msgs: Sequence[Octets],
+    prv_key: Union[PrvKey, KeyPair],
+    lower_s: bool = True,
+    ec: Curve = secp256k1,
+    hf: HashF = sha256,
+    workers: int = 1,
+) -> List[Sig]:
+    "Sign many messages with the same private key, see sign_batch_."
+
+    m_hashes = [reduce_to_hlen(msg, hf) for msg in msgs]
+    return sign_batch_(m_hashes, prv_key, lower_s, ec, hf, workers)
+
+
 def _assert_as_valid_(
     c: int, QJ: JacPoint, r: int, s: int, lower_s: bool, ec: Curve
 ) -> None:
@@ -159,7 +231,7 @@ def _assert_as_valid_(
     u = c * w % ec.n
     v = r * w % ec.n  # 4
     # Let K = u*G + v*Q.
-    KJ = _double_mult(v, QJ, u, ec.GJ, ec)  # 5
+    KJ = _double_mult_vartime(v, QJ, u, ec.GJ, ec)  # 5
 
     # Fail if infinite(K).
     # edge case that cannot be reproduced in the test suite
@@ -167,11 +239,18 @@ def _assert_as_valid_(
         err_msg = "invalid (INF) key"  # pragma: no cover
         raise BTClibRuntimeError(err_msg)  # pragma: no cover
 
-    # affine x_K-coordinate of K
-    x_K = (KJ[0] * mod_inv(KJ[2] * KJ[2], ec.p)) % ec.p
     # Fail if r ≠ x_K %n.
-    if r != x_K % ec.n:  # 6, 7, 8
-        raise BTClibRuntimeError("signature verification failed")
+    # The affine x_K-coordinate of K is X/Z^2 (mod p): instead of
+    # performing an inversion, each candidate x_K (r, r+n, ... less than p)
+    # is checked in Jacobian coordinates as x_K*Z^2 = X (mod p)
+    Z2 = KJ[2] * KJ[2] % ec.p
+    X = KJ[0] % ec.p
+    x_K = r
+    while x_K < ec.p:  # 6, 7, 8
+        if x_K * Z2 % ec.p == X:
+            return
+        x_K += ec.n
+    raise BTClibRuntimeError("signature verification failed")
 
 
 def assert_as_valid_(
@@ -219,12 +298,34 @@ def verify_(
     lower_s: bool = True,
     hf: HashF = sha256,
 ) -> bool:
-    """ECDSA signature verification (SEC 1 v.2 section 4.1.4)."""
+    """ECDSA signature verification (SEC 1 v.2 section 4.1.4).
+
+    The signature verification cache is used, if enabled
+    (see btclib.ecc.sigcache).
+    """
 
     # all kind of Exceptions are catched because
     # verify must always return a bool
     try:
-        assert_as_valid_(msg_hash, key, sig, lower_s, hf)
+        cache = sigcache.get_cache()
+        if cache is None:
+            assert_as_valid_(msg_hash, key, sig, lower_s, hf)
+            return True
+        if not isinstance(sig, Sig):
+            sig = Sig.parse(sig)
+        Q = point_from_key(key, sig.ec)
+        entry = cache.entry(
+            b"dsa",
+            sigcache.curve_id(sig.ec),
+            sigcache.hf_id(hf),
+            bytes_from_octets(msg_hash),
+            bytes_from_point(Q, sig.ec, compressed=False),
+            sig.serialize(check_validity=False),
+            b"\x01" if lower_s else b"\x00",
+        )
+        if entry not in cache:
+            assert_as_valid_(msg_hash, Q, sig, lower_s, hf)
+            cache.add(entry)
     except Exception:  # pylint: disable=broad-except
         return False
     else:
@@ -267,7 +368,7 @@ def _recover_pub_keys_(
             yodd = ec.y_even(x_K)
             KJ = x_K, yodd, 1  # 1.2, 1.3, and 1.4
             # 1.5 has been performed in the recover_pub_keys calling function
-            QJ = _double_mult(r1s, KJ, r1e, ec.GJ, ec)  # 1.6.1
+            QJ = _double_mult_vartime(r1s, KJ, r1e, ec.GJ, ec)  # 1.6.1
             try:
                 _assert_as_valid_(c, QJ, r, s, lower_s, ec)  # 1.6.2
             except (BTClibValueError, BTClibRuntimeError):
@@ -275,7 +376,7 @@ def _recover_pub_keys_(
             else:
                 keys.append(QJ)  # 1.6.2
             KJ = x_K, ec.p - yodd, 1  # 1.6.3
-            QJ = _double_mult(r1s, KJ, r1e, ec.GJ, ec)
+            QJ = _double_mult_vartime(r1s, KJ, r1e, ec.GJ, ec)
             try:
                 _assert_as_valid_(c, QJ, r, s, lower_s, ec)  # 1.6.2
             except (BTClibValueError, BTClibRuntimeError):
@@ -308,7 +409,7 @@ def recover_pub_keys_(
     c = challenge_(msg_hash, sig.ec, hf)  # 1.5
 
     QJs = _recover_pub_keys_(c, sig.r, sig.s, lower_s, sig.ec)
-    return [sig.ec.aff_from_jac(QJ) for QJ in QJs]
+    return sig.ec.aff_from_jac_batch(QJs)
 
 
 def recover_pub_keys(
@@ -345,7 +446,7 @@ def _recover_pub_key_(
     y_K = ec.p - y_even if i else y_even
     KJ = x_K, y_K, 1  # 1.2, 1.3, and 1.4
     # 1.5 has been performed in the recover_pub_keys calling function
-    QJ = _double_mult(r1s, KJ, r1e, ec.GJ, ec)  # 1.6.1
+    QJ = _double_mult_vartime(r1s, KJ, r1e, ec.GJ, ec)  # 1.6.1
     _assert_as_valid_(c, QJ, r, s, lower_s, ec)  # 1.6.2
     return QJ
 
@@ -441,3 +542,179 @@ def crack_prv_key(
     msg_hash2 = reduce_to_hlen(msg2, hf)
 
     return crack_prv_key_(msg_hash1, sig1, msg_hash2, sig2, hf)
+
+
+def _batch_term_(
+    msg_hash: Octets,
+    key: Key,
+    sig: Union[Sig, Octets],
+    recid: int,
+    lower_s: bool,
+    ec: Curve,
+    hf: HashF,
+) -> Tuple[bytes, int, int, JacPoint, JacPoint]:
+    # Return the batch verification term of a signature
+    # as (seed data, u, v, Q, K) for the K = u*G + v*Q equation
+
+    if isinstance(sig, Sig):
+        sig.assert_valid()
+    else:
+        sig = Sig.parse(sig)
+    if sig.ec != ec:
+        raise BTClibValueError("not the same curve for all signatures")
+    if lower_s and sig.s > ec.n / 2:
+        raise BTClibValueError("not a low s")
+
+    c = challenge_(msg_hash, ec, hf)
+    Q = point_from_key(key, ec)
+
+    # lift K from r using the recovery id, see _recover_pub_key_
+    x_K = sig.r + (recid >> 1) * ec.n if recid >= 0 else ec.p
+    if recid >= 2 * (ec.cofactor + 1) or x_K >= ec.p:
+        raise BTClibValueError(f"invalid recovery id: {recid}")
+    y_K = ec.y_even(x_K)
+    if recid & 1:
+        y_K = ec.p - y_K
+
+    w = mod_inv(sig.s, ec.n)
+    data = bytes_from_octets(msg_hash)
+    data += bytes_from_point(Q, ec, compressed=False)
+    data += sig.serialize(check_validity=False)
+    data += recid.to_bytes(1, byteorder="big", signed=False)
+    return data, c * w % ec.n, sig.r * w % ec.n, (Q[0], Q[1], 1), (x_K, y_K, 1)
+
+
+def assert_batch_as_valid_(
+    m_hashes: Sequence[Octets],
+    keys: Sequence[Key],
+    sigs: Sequence[Union[Sig, Octets]],
+    recids: Optional[Sequence[Optional[int]]] = None,
+    lower_s: bool = True,
+    hf: HashF = sha256,
+) -> None:
+    """Batch verification of ECDSA signatures.
+
+    The recovery id (key_id) of a signature, e.g. as available
+    in a bms.Sig, identifies the ephemeral key K from its r value:
+    the signatures with a recovery id are then verified together,
+    checking with a single multi scalar multiplication that
+    sum(a_i*(u_i*G + v_i*Q_i - K_i)) is the infinity point,
+    with a_i randomizers deterministically derived from all inputs.
+    Signatures without (or with an invalid) recovery id
+    are verified individually; if the batch equation does not hold,
+    e.g. because of a wrong recovery id, the batched signatures
+    are verified individually too: the batch is valid
+    if and only if all its signatures are valid.
+    """
+
+    batch_size = len(keys)
+    if batch_size == 0:
+        raise BTClibValueError("no signatures provided")
+
+    if len(m_hashes) != batch_size:
+        err_msg = f"mismatch between number of pub_keys ({batch_size}) "
+        err_msg += f"and number of messages ({len(m_hashes)})"
+        raise BTClibValueError(err_msg)
+    if len(sigs) != batch_size:
+        err_msg = f"mismatch between number of pub_keys ({batch_size}) "
+        err_msg += f"and number of signatures ({len(sigs)})"
+        raise BTClibValueError(err_msg)
+    if recids is None:
+        recids = [None] * batch_size
+    elif len(recids) != batch_size:
+        err_msg = f"mismatch between number of pub_keys ({batch_size}) "
+        err_msg += f"and number of recovery ids ({len(recids)})"
+        raise BTClibValueError(err_msg)
+
+    terms: List[Tuple[bytes, int, int, JacPoint, JacPoint]] = []
+    batched: List[Tuple[Octets, Key, Union[Sig, Octets]]] = []
+    ec: Optional[Curve] = None
+    for msg_hash, key, sig, recid in zip(m_hashes, keys, sigs, recids):
+        if recid is not None:
+            try:
+                if ec is None:
+                    ec = sig.ec if isinstance(sig, Sig) else Sig.parse(sig).ec
+                terms.append(_batch_term_(msg_hash, key, sig, recid, lower_s, ec, hf))
+                batched.append((msg_hash, key, sig))
+                continue
+            except BTClibValueError:
+                pass
+        assert_as_valid_(msg_hash, key, sig, lower_s, hf)
+    if ec is None or not terms:
+        return
+
+    # a_i in [1, n-1]
+    # deterministically generated using a CSPRNG seeded by a
+    # cryptographic hash (SHA256) of all inputs of the algorithm
+    seed = sha256()
+    for data, *_ in terms:
+        seed.update(data)
+    u = 0
+    scalars: List[int] = []
+    points: List[JacPoint] = []
+    for i, (_, u_i, v_i, QJ, KJ) in enumerate(terms):
+        if i == 0:
+            a = 1
+        else:
+            rng = seed.copy()
+            rng.update(i.to_bytes(4, byteorder="big", signed=False))
+            a = 1 + int.from_bytes(rng.digest(), byteorder="big") % (ec.n - 1)
+        u += a * u_i
+        scalars.append(a * v_i % ec.n)
+        points.append(backend.jac(QJ))
+        scalars.append(ec.n - a)
+        points.append(backend.jac(KJ))
+    scalars.append(u % ec.n)
+    points.append(backend.jac(ec.GJ))
+
+    if _multi_mult(scalars, points, ec)[2] != 0:
+        # find the invalid signature, if any
+        for msg_hash, key, sig in batched:
+            assert_as_valid_(msg_hash, key, sig, lower_s, hf)
+
+
+def assert_batch_as_valid(
+    ms: Sequence[Octets],
+    keys: Sequence[Key],
+    sigs: Sequence[Union[Sig, Octets]],
+    recids: Optional[Sequence[Optional[int]]] = None,
+    lower_s: bool = True,
+    hf: HashF = sha256,
+) -> None:
+
+    m_hashes = [reduce_to_hlen(msg, hf) for msg in ms]
+    assert_batch_as_valid_(m_hashes, keys, sigs, recids, lower_s, hf)
+
+
+def batch_verify_(
+    m_hashes: Sequence[Octets],
+    keys: Sequence[Key],
+    sigs: Sequence[Union[Sig, Octets]],
+    recids: Optional[Sequence[Optional[int]]] = None,
+    lower_s: bool = True,
+    hf: HashF = sha256,
+) -> bool:
+    "Batch verification of ECDSA signatures, see assert_batch_as_valid_."
+
+    # all kind of Exceptions are catched because
+    # verify must always return a bool
+    try:
+        assert_batch_as_valid_(m_hashes, keys, sigs, recids, lower_s, hf)
+    except Exception:  # pylint: disable=broad-except
+        return False
+    else:
+        return True
+
+
+def batch_verify(
+    ms: Sequence[Octets],
+    keys: Sequence[Key],
+    sigs: Sequence[Union[Sig, Octets]],
+    recids: Optional[Sequence[Optional[int]]] = None,
+    lower_s: bool = True,
+    hf: HashF = sha256,
+) -> bool:
+    "Batch verification of ECDSA signatures, see assert_batch_as_valid_."
+
+    m_hashes = [reduce_to_hlen(msg, hf) for msg in ms]
+    return batch_verify_(m_hashes, keys, sigs, recids, lower_s, hf)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Private/public key pair, for repeated signing with the same key.
+
+Signing functions accepting a generic private key have to parse it
+and, in the BIP340 and message signing cases, to derive the public key
+at every call.
+A KeyPair does it once and is accepted by dsa.sign(_),
+ssa.sign(_), and bms.sign:
+
+    >>> from btclib.ecc import dsa, ssa
+    >>> from btclib.ecc.key_pair import KeyPair
+    >>> key_pair = KeyPair(1)
+    >>> dsa_sig = dsa.sign(b"Satoshi Nakamoto", key_pair)
+    >>> ssa_sig = ssa.sign(b"Satoshi Nakamoto", key_pair)
+"""
+
+import secrets
+from typing import Optional
+
+from btclib.alias import Point
+from btclib.ecc.curve import Curve, _mult, secp256k1
+from btclib.exceptions import BTClibValueError
+from btclib.to_prv_key import PrvKey, int_from_prv_key, prv_keyinfo_from_prv_key
+
+
+class KeyPair:
+    """Private/public key pair with cached derived data.
+
+    - q is the private key, 0 < q < ec.n
+    - Q is the affine public key
+    - odd_y is the parity of the public key y-coordinate
+    - q_bip340 is the BIP340 private key, i.e. n - q if odd_y
+    - x_Q is the BIP340 x-only public key, x_only its bytes
+
+    network and compressed are taken from the private key
+    (e.g. WIF or BIP32 extended key), if available:
+    otherwise they default to mainnet and compressed.
+    """
+
+    def __init__(self, prv_key: Optional[PrvKey] = None, ec: Curve = secp256k1):
+
+        if prv_key is None:
+            # q in the range [1, ec.n-1]
+            prv_key = 1 + secrets.randbelow(ec.n - 1)
+        self.q = int_from_prv_key(prv_key, ec)
+        self.ec = ec
+
+        self.network = "mainnet"
+        self.compressed = True
+        if not isinstance(prv_key, int):
+            try:
+                _, self.network, self.compressed = prv_keyinfo_from_prv_key(prv_key)
+            # e.g. octets for a curve not used by any network
+            except BTClibValueError:
+                pass
+
+        self.Q: Point = ec.aff_from_jac(_mult(self.q, ec.GJ, ec))
+
+        self.odd_y = self.Q[1] % 2 == 1
+        self.q_bip340 = ec.n - self.q if self.odd_y else self.q
+        self.x_Q = self.Q[0]
+        self.x_only = self.x_Q.to_bytes(ec.p_size, byteorder="big", signed=False)
+
+    def __repr__(self) -> str:
+        # the private key is not disclosed
+        return f"KeyPair(Q={self.Q}, ec={self.ec.name})"
+
+    def assert_curve(self, ec: Curve) -> None:
+        if self.ec != ec:
+            raise BTClibValueError(f"ec / key pair ({self.ec.name}) mismatch")
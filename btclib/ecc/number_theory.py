@@ -21,8 +21,9 @@ with the following modifications:
 * added extensive unit test
 """
 
-from typing import Tuple
+from typing import List, Sequence, Tuple
 
+from btclib.ecc import backend
 from btclib.exceptions import BTClibValueError
 from btclib.utils import hex_string
 
@@ -45,19 +46,56 @@ def xgcd(a: int, b: int) -> Tuple[int, int, int]:
 def mod_inv(a: int, m: int) -> int:
     """Return the inverse of a (mod m). m does not have to be a prime.
 
-    Based on Extended Euclidean Algorithm, see:
+    The inversion is delegated to the big integer backend
+    (see btclib.ecc.backend), equivalent to the
+    Extended Euclidean Algorithm, see:
     https://en.wikibooks.org/wiki/Algorithm_Implementation/Mathematics/Extended_Euclidean_algorithm
     """
 
     a %= m
-    g, x, _ = xgcd(a, m)
-    if g == 1:
-        return x % m
-    err_msg = "No inverse for "
-    err_msg += f"{hex_string(a)}" if a > 0xFFFFFFFF else f"{a}"
-    err_msg += " mod "
-    err_msg += f"{hex_string(m)}" if m > 0xFFFFFFFF else f"{m}"
-    raise BTClibValueError(err_msg)
+    try:
+        return backend.invert(a, m)
+    except ValueError as e:
+        err_msg = "No inverse for "
+        err_msg += f"{hex_string(a)}" if a > 0xFFFFFFFF else f"{a}"
+        err_msg += " mod "
+        err_msg += f"{hex_string(m)}" if m > 0xFFFFFFFF else f"{m}"
+        raise BTClibValueError(err_msg) from e
+
+
+def mod_inv_batch(a: Sequence[int], m: int) -> List[int]:
+    """Return the inverses of the a elements (mod m).
+
+    Montgomery's simultaneous inversion trick is used:
+    a single inversion and 3(n-1) multiplications
+    instead of n inversions.
+    """
+
+    if not a:
+        return []
+
+    # prefix products: a[0], a[0]*a[1], ..., a[0]*...*a[n-1]
+    prefix: List[int] = []
+    acc = 1
+    for x in a:
+        acc = acc * x % m
+        prefix.append(acc)
+
+    try:
+        inv = mod_inv(acc, m)
+    except BTClibValueError:
+        # report the first element without inverse
+        for x in a:
+            mod_inv(x, m)
+        raise  # pragma: no cover
+
+    invs = [0] * len(a)
+    for i in range(len(a) - 1, 0, -1):
+        # inv is the inverse of a[0]*...*a[i]
+        invs[i] = inv * prefix[i - 1] % m
+        inv = inv * a[i] % m
+    invs[0] = inv
+    return invs
 
 
 def legendre_symbol(a: int, p: int) -> int:
@@ -70,7 +108,7 @@ def legendre_symbol(a: int, p: int) -> int:
     https://codereview.stackexchange.com/questions/43210/tonelli-shanks-algorithm-implementation-of-prime-modular-square-root/43267
     """
 
-    ls = pow(a, p >> 1, p)
+    ls = backend.powmod(a, p >> 1, p)
     return -1 if ls == p - 1 else ls
 
 
@@ -92,14 +130,14 @@ def mod_sqrt(a: int, p: int) -> int:
 
     if p % 4 == 3:  # secp256k1 case
         # inverse candidate is pow(a, (p + 1) // 4, p)
-        r = pow(a, (p >> 2) + 1, p)
+        r = backend.powmod(a, (p >> 2) + 1, p)
     elif p % 8 == 5:
         # inverse candidate is pow(a, (p + 3) // 8, p)
-        r = pow(a, (p >> 3) + 1, p)
+        r = backend.powmod(a, (p >> 3) + 1, p)
         if r * r % p == a:
             return r
         # another inverse candidate
-        r = r * pow(2, p >> 2, p) % p
+        r = r * backend.powmod(2, p >> 2, p) % p
     else:
         return tonelli(a, p)
 
@@ -144,9 +182,9 @@ def tonelli(a: int, p: int) -> int:
     z = 1
     while legendre_symbol(z, p) != -1:
         z += 1
-    c = pow(z, q, p)
-    r = pow(a, (q + 1) // 2, p)
-    t = pow(a, q, p)
+    c = backend.powmod(z, q, p)
+    r = backend.powmod(a, (q + 1) // 2, p)
+    t = backend.powmod(a, q, p)
     while t != 1:
         # Find the lowest i such that t^(2^i) = 1
         t2i = t
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Multi-process signature verification.
+
+Large sets of (msg, key, sig) items are verified
+by a pool of worker processes (see btclib.pool),
+the per-item results being returned in the original order.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from btclib.ecc import bms, dsa, ssa
+from btclib.exceptions import BTClibValueError
+from btclib.pool import map_shards
+
+# (msg, key, sig) tuple, where key is an address for bms
+Item = Tuple[Any, Any, Any]
+
+_VERIFY: Dict[str, Callable[[Any, Any, Any], bool]] = {
+    "dsa": dsa.verify,
+    "ssa": ssa.verify,
+    "bms": bms.verify,
+}
+
+
+def _verify_shard(scheme: str, items: Sequence[Item]) -> List[bool]:
+    verify = _VERIFY[scheme]
+    return [verify(msg, key, sig) for msg, key, sig in items]
+
+
+def verify_many(
+    items: Sequence[Item],
+    workers: Optional[int] = None,
+    scheme: str = "dsa",
+    shard_size: Optional[int] = None,
+) -> List[bool]:
+    """Verify many (msg, key, sig) items using multiple processes.
+
+    scheme selects the verification function among
+    "dsa" (dsa.verify), "ssa" (ssa.verify), and "bms" (bms.verify,
+    with the address as key).
+    workers defaults to the number of CPUs:
+    with a single worker the items are verified in-process.
+    The results are in the same order of the items.
+    """
+
+    if scheme not in _VERIFY:
+        raise BTClibValueError(f"unknown signature scheme: {scheme}")
+
+    return map_shards(_verify_shard, items, (scheme,), workers, shard_size)
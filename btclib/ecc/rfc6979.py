@@ -37,6 +37,7 @@ messages to the set of possible nonce values) would return.
 
 import hmac
 from hashlib import sha256
+from typing import Optional
 
 from btclib.alias import HashF, Octets
 from btclib.ecc.curve import Curve, secp256k1
@@ -45,7 +46,22 @@ from btclib.to_prv_key import PrvKey, int_from_prv_key
 from btclib.utils import int_from_bits
 
 
-def _rfc6979_(c: int, q: int, ec: Curve, hf: HashF) -> int:
+def _rfc6979_midstate(q: int, ec: Curve, hf: HashF) -> hmac.HMAC:
+    # Return the 3.2.d HMAC state after the private key q,
+    # shared by all messages signed with the same private key
+
+    hf_size = hf().digest_size
+    v = b"\x01" * hf_size  # 3.2.b
+    k = b"\x00" * hf_size  # 3.2.c
+
+    # convert the private key q to an octet sequence of size n_size
+    q_bytes = q.to_bytes(ec.n_size, byteorder="big", signed=False)
+    return hmac.new(k, v + b"\x00" + q_bytes, hf)
+
+
+def _rfc6979_(
+    c: int, q: int, ec: Curve, hf: HashF, midstate: Optional[hmac.HMAC] = None
+) -> int:
     # https://tools.ietf.org/html/rfc6979 section 3.2
 
     # convert the private key q to an octet sequence of size n_size
@@ -56,9 +72,12 @@ def _rfc6979_(c: int, q: int, ec: Curve, hf: HashF) -> int:
 
     hf_size = hf().digest_size
     v = b"\x01" * hf_size  # 3.2.b
-    k = b"\x00" * hf_size  # 3.2.c
 
-    k = hmac.new(k, v + b"\x00" + bprvbm, hf).digest()  # 3.2.d
+    if midstate is None:
+        midstate = _rfc6979_midstate(q, ec, hf)
+    hmac_ = midstate.copy()
+    hmac_.update(c_bytes)
+    k = hmac_.digest()  # 3.2.d
     v = hmac.new(k, v, hf).digest()  # 3.2.e
     k = hmac.new(k, v + b"\x01" + bprvbm, hf).digest()  # 3.2.f
     v = hmac.new(k, v, hf).digest()  # 3.2.g
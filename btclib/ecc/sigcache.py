@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Signature verification cache.
+
+Validators often verify the same signature more than once,
+e.g. when accepting a transaction in the mempool
+and then again when connecting the block including it.
+
+Similarly to Bitcoin Core's CSignatureCache,
+the cache stores the salted hashes of the successfully verified
+(message hash, public key, signature) entries:
+the random salt prevents an attacker from predicting
+the cache entries (e.g. to craft collisions),
+while only storing the hashes bounds the memory usage.
+Least recently used entries are evicted when the memory limit is reached.
+
+The cache is opt-in: it is used by dsa.verify_, ssa.verify_,
+ssa.batch_verify_, and bms.verify only after having been enabled:
+
+    >>> from btclib.ecc import sigcache
+    >>> cache = sigcache.enable(max_size=32 * 2**20)
+    >>> sigcache.disable()
+"""
+
+import functools
+import secrets
+from collections import OrderedDict
+from hashlib import sha256
+from typing import Dict, Optional
+
+from btclib.alias import HashF
+from btclib.ecc.curve import Curve
+from btclib.exceptions import BTClibValueError
+
+# default memory limit, as in Bitcoin Core
+DEFAULT_MAX_SIZE = 32 * 2 ** 20
+# approximate memory usage of a cache entry:
+# 32-byte hash plus the OrderedDict overhead
+ENTRY_SIZE = 170
+
+
+class SigCache:
+    """Bounded, salted-hash, LRU signature verification cache.
+
+    max_size is the memory limit in bytes.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._entries: "OrderedDict[bytes, None]" = OrderedDict()
+        self._max_entries = 0
+        self.max_size = max_size
+        # the salted hasher is copied for each new entry
+        self._hasher = sha256(secrets.token_bytes(32))
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        return self._max_entries * ENTRY_SIZE
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        if max_size < ENTRY_SIZE:
+            raise BTClibValueError(f"too small cache size: {max_size}")
+        self._max_entries = max_size // ENTRY_SIZE
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def entry(self, *data: bytes) -> bytes:
+        "Return the salted hash of the data."
+
+        hasher = self._hasher.copy()
+        for item in data:
+            # length prefix to avoid ambiguous concatenations
+            hasher.update(len(item).to_bytes(4, byteorder="big", signed=False))
+            hasher.update(item)
+        return hasher.digest()
+
+    def __contains__(self, entry: bytes) -> bool:
+        if entry in self._entries:
+            self._entries.move_to_end(entry)
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def add(self, entry: bytes) -> None:
+        "Add the (valid) entry, evicting the least recently used if needed."
+
+        self._entries[entry] = None
+        self._entries.move_to_end(entry)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        "Remove all the entries and reset the statistics."
+
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        "Return the cache statistics."
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "max_size": self.max_size,
+        }
+
+
+_cache: Optional[SigCache] = None
+
+
+def enable(max_size: int = DEFAULT_MAX_SIZE) -> SigCache:
+    "Enable a new signature verification cache and return it."
+
+    global _cache  # pylint: disable=global-statement
+    _cache = SigCache(max_size)
+    return _cache
+
+
+def disable() -> None:
+    "Disable the signature verification cache."
+
+    global _cache  # pylint: disable=global-statement
+    _cache = None
+
+
+def get_cache() -> Optional[SigCache]:
+    "Return the signature verification cache, None if disabled."
+    return _cache
+
+
+@functools.lru_cache()
+def curve_id(ec: Curve) -> bytes:
+    "Return the bytes identifying the curve in cache entries."
+    return repr(ec).encode()
+
+
+def hf_id(hf: HashF) -> bytes:
+    "Return the bytes identifying the hash function in cache entries."
+    return hf().name.encode()
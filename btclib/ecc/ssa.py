@@ -56,11 +56,19 @@ from typing import List, Optional, Sequence, Tuple, Type, Union
 
 from btclib.alias import BinaryData, HashF, Integer, JacPoint, Octets, Point
 from btclib.bip32.bip32 import BIP32Key
-from btclib.ecc.curve import Curve, secp256k1
-from btclib.ecc.curve_group import _double_mult, _mult, _multi_mult
+from btclib.ecc import sigcache
+from btclib.ecc.curve import (
+    Curve,
+    _double_mult_vartime,
+    _mult,
+    _multi_mult,
+    secp256k1,
+)
+from btclib.ecc.key_pair import KeyPair
 from btclib.ecc.number_theory import mod_inv
 from btclib.exceptions import BTClibRuntimeError, BTClibTypeError, BTClibValueError
-from btclib.hashes import reduce_to_hlen, tagged_hash
+from btclib.hashes import reduce_to_hlen, tagged_hasher
+from btclib.pool import map_shards
 from btclib.to_prv_key import PrvKey, int_from_prv_key
 from btclib.to_pub_key import point_from_pub_key
 from btclib.utils import (
@@ -203,7 +211,7 @@ def _det_nonce_(
     # the unbiased implementation is provided here,
     # which works also for very-low-cardinality test curves
 
-    randomizer = tagged_hash("BIP0340/aux".encode(), aux, hf)
+    randomizer = tagged_hasher(b"BIP0340/aux", hf).hash(aux)
     xor = q ^ int.from_bytes(randomizer, "big", signed=False)
     max_len = max(ec.n_size, hf().digest_size)
     t = b"".join(
@@ -214,9 +222,9 @@ def _det_nonce_(
         ]
     )
 
-    nonce_tag = "BIP0340/nonce".encode()
+    nonce_hasher = tagged_hasher(b"BIP0340/nonce", hf)
     while True:
-        t = tagged_hash(nonce_tag, t, hf)
+        t = nonce_hasher.hash(t)
         # The following lines would introduce a bias
         # nonce = int.from_bytes(t, 'big') % ec.n
         # nonce = int_from_bits(t, ec.nlen) % ec.n
@@ -265,7 +273,7 @@ def challenge_(msg_hash: Octets, x_Q: int, x_K: int, ec: Curve, hf: HashF) -> in
             msg_hash,
         ]
     )
-    t = tagged_hash("BIP0340/challenge".encode(), t, hf)
+    t = tagged_hasher(b"BIP0340/challenge", hf).hash(t)
 
     c = int_from_bits(t, ec.nlen) % ec.n
     if c == 0:
@@ -289,7 +297,7 @@ def _sign_(c: int, q: int, nonce: int, r: int, ec: Curve) -> Sig:
 
 def sign_(
     msg_hash: Octets,
-    prv_key: PrvKey,
+    prv_key: Union[PrvKey, KeyPair],
     nonce: Optional[PrvKey] = None,
     ec: Curve = secp256k1,
     hf: HashF = sha256,
@@ -305,7 +313,11 @@ def sign_(
     msg_hash = bytes_from_octets(msg_hash, hf_len)
 
     # private and public keys
-    q, x_Q = gen_keys(prv_key, ec)
+    if isinstance(prv_key, KeyPair):
+        prv_key.assert_curve(ec)
+        q, x_Q = prv_key.q_bip340, prv_key.x_Q
+    else:
+        q, x_Q = gen_keys(prv_key, ec)
 
     # nonce: an integer in the range 1..n-1.
     if nonce is None:
@@ -321,7 +333,7 @@ def sign_(
 
 def sign(
     msg: Octets,
-    prv_key: PrvKey,
+    prv_key: Union[PrvKey, KeyPair],
     nonce: Optional[PrvKey] = None,
     ec: Curve = secp256k1,
     hf: HashF = sha256,
@@ -347,23 +359,89 @@ def sign(
     return sign_(msg_hash, prv_key, nonce, ec, hf)
 
 
+def _sign_batch_(
+    q: int, x_Q: int, ec: Curve, hf: HashF, m_hashes: Sequence[bytes]
+) -> List[Sig]:
+    # sign all messages in-process
+
+    hf_len = hf().digest_size
+    sigs: List[Sig] = []
+    for msg_hash in m_hashes:
+        aux = secrets.token_bytes(hf_len)
+        nonce = _det_nonce_(msg_hash, q, x_Q, aux, ec, hf)
+        nonce, x_K = gen_keys(nonce, ec)
+        c = challenge_(msg_hash, x_Q, x_K, ec, hf)
+        sigs.append(_sign_(c, q, nonce, x_K, ec))
+    return sigs
+
+
+def sign_batch_(
+    m_hashes: Sequence[Octets],
+    prv_key: Union[PrvKey, KeyPair],
+    ec: Curve = secp256k1,
+    hf: HashF = sha256,
+    workers: int = 1,
+) -> List[Sig]:
+    """Sign many hf_len bytes messages with the same private key.
+
+    The BIP340 deterministic nonce is used, with fresh auxiliary
+    randomness for each message; signatures are returned
+    in the order of the messages.
+    The public key is derived only once,
+    while the tagged hash midstates are always shared (see tagged_hasher).
+    With more than one worker, the messages are signed
+    by a process pool (see btclib.pool).
+    """
+
+    # the messages msg_hash: hf_len arrays
+    hf_len = hf().digest_size
+    m_hashes = [bytes_from_octets(msg_hash, hf_len) for msg_hash in m_hashes]
+
+    if isinstance(prv_key, KeyPair):
+        prv_key.assert_curve(ec)
+        q, x_Q = prv_key.q_bip340, prv_key.x_Q
+    else:
+        q, x_Q = gen_keys(prv_key, ec)
+
+    return map_shards(_sign_batch_, m_hashes, (q, x_Q, ec, hf), workers)
+
+
+def sign_batch(
+    msgs: Sequence[Octets],
+    prv_key: Union[PrvKey, KeyPair],
+    ec: Curve = secp256k1,
+    hf: HashF = sha256,
+    workers: int = 1,
+) -> List[Sig]:
+    "Sign many messages with the same private key, see sign_batch_."
+
+    m_hashes = [reduce_to_hlen(msg, hf) for msg in msgs]
+    return sign_batch_(m_hashes, prv_key, ec, hf, workers)
+
+
 def _assert_as_valid_(c: int, QJ: JacPoint, r: int, s: int, ec: Curve) -> None:
     # Private function for test/dev purposes
     # It raises Errors, while verify should always return True or False
 
     # Let K = sG - eQ.
     # in Jacobian coordinates
-    KJ = _double_mult(ec.n - c, QJ, s, ec.GJ, ec)
+    KJ = _double_mult_vartime(ec.n - c, QJ, s, ec.GJ, ec)
 
     # Fail if infinite(KJ).
-    # Fail if y_K is odd.
-    if ec.y_aff_from_jac(KJ) % 2:
-        raise BTClibRuntimeError("y_K is odd")
+    if KJ[2] == 0:
+        raise BTClibRuntimeError("signature verification failed")
 
     # Fail if x_K ≠ r
-    if KJ[0] != KJ[2] * KJ[2] * r % ec.p:
+    # inversion-free check in Jacobian coordinates: x_K = X/Z^2 (mod p)
+    if KJ[0] % ec.p != KJ[2] * KJ[2] * r % ec.p:
         raise BTClibRuntimeError("signature verification failed")
 
+    # Fail if y_K is odd.
+    # the parity of y_K = Y/Z^3 (mod p) requires the affine coordinate:
+    # the only inversion, performed only if x_K = r
+    if ec.y_aff_from_jac(KJ) % 2:
+        raise BTClibRuntimeError("y_K is odd")
+
 
 def assert_as_valid_(
     msg_hash: Octets, Q: BIP340PubKey, sig: Union[Sig, Octets], hf: HashF = sha256
@@ -392,15 +470,44 @@ def assert_as_valid(
     assert_as_valid_(msg_hash, Q, sig, hf)
 
 
+def _sigcache_entry(
+    cache: sigcache.SigCache, msg_hash: Octets, Q: BIP340PubKey, sig: Sig, hf: HashF
+) -> bytes:
+    "Return the signature verification cache entry."
+
+    x_Q = point_from_bip340pub_key(Q, sig.ec)[0]
+    return cache.entry(
+        b"ssa",
+        sigcache.curve_id(sig.ec),
+        sigcache.hf_id(hf),
+        bytes_from_octets(msg_hash),
+        x_Q.to_bytes(sig.ec.p_size, byteorder="big", signed=False),
+        sig.serialize(check_validity=False),
+    )
+
+
 def verify_(
     msg_hash: Octets, Q: BIP340PubKey, sig: Union[Sig, Octets], hf: HashF = sha256
 ) -> bool:
-    "Verify the BIP340 signature of the provided message."
+    """Verify the BIP340 signature of the provided message.
+
+    The signature verification cache is used, if enabled
+    (see btclib.ecc.sigcache).
+    """
 
     # all kind of Exceptions are catched because
     # verify must always return a bool
     try:
-        assert_as_valid_(msg_hash, Q, sig, hf)
+        cache = sigcache.get_cache()
+        if cache is None:
+            assert_as_valid_(msg_hash, Q, sig, hf)
+            return True
+        if not isinstance(sig, Sig):
+            sig = Sig.parse(sig)
+        entry = _sigcache_entry(cache, msg_hash, Q, sig, hf)
+        if entry not in cache:
+            assert_as_valid_(msg_hash, Q, sig, hf)
+            cache.add(entry)
     except Exception:  # pylint: disable=broad-except
         return False
     else:
@@ -425,7 +532,7 @@ def _recover_pub_key_(c: int, r: int, s: int, ec: Curve) -> int:
     KJ = r, ec.y_even(r), 1
 
     e1 = mod_inv(c, ec.n)
-    QJ = _double_mult(ec.n - e1, KJ, e1 * s, ec.GJ, ec)
+    QJ = _double_mult_vartime(ec.n - e1, KJ, e1 * s, ec.GJ, ec)
     # edge case that cannot be reproduced in the test suite
     if QJ[2] == 0:
         err_msg = "invalid (INF) key"  # pragma: no cover
@@ -486,12 +593,67 @@ def crack_prv_key(
     return crack_prv_key_(msg_hash1, sig1, msg_hash2, sig2, Q, hf)
 
 
-def assert_batch_as_valid_(
-    m_hashes: Sequence[Octets],
-    Qs: Sequence[BIP340PubKey],
-    sigs: Sequence[Sig],
-    hf: HashF = sha256,
-) -> None:
+# (msg_hash, x_Q, K, Q, challenge, s) batch verification term
+_BatchTerm = Tuple[bytes, int, JacPoint, JacPoint, int, int]
+
+
+def _batch_term_(msg_hash: Octets, Q: BIP340PubKey, sig: Sig, hf: HashF) -> _BatchTerm:
+
+    ec = sig.ec
+    msg_hash = bytes_from_octets(msg_hash, hf().digest_size)
+
+    KJ = sig.r, ec.y_even(sig.r), 1
+
+    x_Q, y_Q = point_from_bip340pub_key(Q, ec)
+    QJ = x_Q, y_Q, 1
+
+    c = challenge_(msg_hash, x_Q, sig.r, ec, hf)
+
+    return msg_hash, x_Q, KJ, QJ, c, sig.s
+
+
+def _batch_check(terms: Sequence[_BatchTerm], ec: Curve) -> bool:
+
+    # rand in [1, n-1]
+    # deterministically generated using a CSPRNG seeded by a
+    # cryptographic hash (SHA256) of all inputs of the algorithm
+    seed = sha256()
+    for msg_hash, x_Q, KJ, _, _, s in terms:
+        seed.update(msg_hash)
+        seed.update(x_Q.to_bytes(ec.p_size, byteorder="big", signed=False))
+        seed.update(KJ[0].to_bytes(ec.p_size, byteorder="big", signed=False))
+        seed.update(s.to_bytes(ec.n_size, byteorder="big", signed=False))
+
+    t = 0
+    scalars: List[int] = []
+    points: List[JacPoint] = []
+    for i, (_, _, KJ, QJ, c, s) in enumerate(terms):
+        if i == 0:
+            rand = 1
+        else:
+            rng = seed.copy()
+            rng.update(i.to_bytes(4, byteorder="big", signed=False))
+            rand = 1 + int.from_bytes(rng.digest(), byteorder="big") % (ec.n - 1)
+        scalars.append(rand)
+        points.append(KJ)
+        scalars.append(rand * c % ec.n)
+        points.append(QJ)
+        t += rand * s
+
+    TJ = _mult(t, ec.GJ, ec)
+    RHSJ = _multi_mult(scalars, points, ec)
+
+    # return T == RHS, checked in Jacobian coordinates
+    RHSZ2 = RHSJ[2] * RHSJ[2]
+    TZ2 = TJ[2] * TJ[2]
+    return (TJ[0] * RHSZ2 % ec.p == RHSJ[0] * TZ2 % ec.p) and (
+        TJ[1] * RHSZ2 * RHSJ[2] % ec.p == RHSJ[1] * TZ2 * TJ[2] % ec.p
+    )
+
+
+def _assert_batch_args(
+    m_hashes: Sequence[Octets], Qs: Sequence[BIP340PubKey], sigs: Sequence[Sig]
+) -> Curve:
 
     batch_size = len(Qs)
     if batch_size == 0:
@@ -506,47 +668,26 @@ def assert_batch_as_valid_(
         err_msg += f"and number of signatures ({len(sigs)})"
         raise BTClibValueError(err_msg)
 
-    if batch_size == 1:
-        assert_as_valid_(m_hashes[0], Qs[0], sigs[0], hf)
-        return None
-
     ec = sigs[0].ec
     if any(sig.ec != ec for sig in sigs):
         raise BTClibValueError("not the same curve for all signatures")
-    t = 0
-    scalars: List[int] = []
-    points: List[JacPoint] = []
-    for i, (msg_hash, Q, sig) in enumerate(zip(m_hashes, Qs, sigs)):
-        msg_hash = bytes_from_octets(msg_hash, hf().digest_size)
-
-        KJ = sig.r, ec.y_even(sig.r), 1
+    return ec
 
-        x_Q, y_Q = point_from_bip340pub_key(Q, ec)
-        QJ = x_Q, y_Q, 1
 
-        c = challenge_(msg_hash, x_Q, sig.r, ec, hf)
-
-        # rand in [1, n-1]
-        # deterministically generated using a CSPRNG seeded by a
-        # cryptographic hash (e.g., SHA256) of all inputs of the
-        # algorithm, or randomly generated independently for each
-        # run of the batch verification algorithm
-        rand = 1 if i == 0 else 1 + secrets.randbelow(ec.n - 1)
-        scalars.append(rand)
-        points.append(KJ)
-        scalars.append(rand * c % ec.n)
-        points.append(QJ)
-        t += rand * sig.s
+def assert_batch_as_valid_(
+    m_hashes: Sequence[Octets],
+    Qs: Sequence[BIP340PubKey],
+    sigs: Sequence[Sig],
+    hf: HashF = sha256,
+) -> None:
 
-    TJ = _mult(t, ec.GJ, ec)
-    RHSJ = _multi_mult(scalars, points, ec)
+    if len(Qs) == 1 and len(m_hashes) == len(sigs) == 1:
+        assert_as_valid_(m_hashes[0], Qs[0], sigs[0], hf)
+        return None
 
-    # return T == RHS, checked in Jacobian coordinates
-    RHSZ2 = RHSJ[2] * RHSJ[2]
-    TZ2 = TJ[2] * TJ[2]
-    if (TJ[0] * RHSZ2 % ec.p != RHSJ[0] * TZ2 % ec.p) or (
-        TJ[1] * RHSZ2 * RHSJ[2] % ec.p != RHSJ[1] * TZ2 * TJ[2] % ec.p
-    ):
+    ec = _assert_batch_args(m_hashes, Qs, sigs)
+    terms = [_batch_term_(*args, hf) for args in zip(m_hashes, Qs, sigs)]
+    if not _batch_check(terms, ec):
         raise BTClibRuntimeError("signature verification failed")
     return None
 
@@ -568,11 +709,34 @@ def batch_verify_(
     sigs: Sequence[Sig],
     hf: HashF = sha256,
 ) -> bool:
+    """Batch verification of BIP340 signatures.
+
+    The signature verification cache is used, if enabled
+    (see btclib.ecc.sigcache): only the signatures not in the cache
+    are batch verified and then added to it.
+    """
 
     # all kind of Exceptions are catched because
     # verify must always return a bool
     try:
-        assert_batch_as_valid_(m_hashes, Qs, sigs, hf)
+        cache = sigcache.get_cache()
+        if cache is None or not 0 < len(Qs) == len(m_hashes) == len(sigs):
+            assert_batch_as_valid_(m_hashes, Qs, sigs, hf)
+            return True
+        entries = [
+            _sigcache_entry(cache, msg_hash, Q, sig, hf)
+            for msg_hash, Q, sig in zip(m_hashes, Qs, sigs)
+        ]
+        missing = [i for i, entry in enumerate(entries) if entry not in cache]
+        if missing:
+            assert_batch_as_valid_(
+                [m_hashes[i] for i in missing],
+                [Qs[i] for i in missing],
+                [sigs[i] for i in missing],
+                hf,
+            )
+            for i in missing:
+                cache.add(entries[i])
     except Exception:  # pylint: disable=broad-except
         return False
 
@@ -589,3 +753,61 @@ def batch_verify(
 
     m_hashes = [reduce_to_hlen(msg, hf) for msg in ms]
     return batch_verify_(m_hashes, Qs, sigs, hf)
+
+
+def _blame(
+    terms: Sequence[Tuple[int, _BatchTerm]], ec: Curve, failed: bool = False
+) -> List[int]:
+    # bisect a failed batch, recursively looking for the invalid terms;
+    # failed is True when the batch is already known to be invalid
+
+    if not failed and _batch_check([term for _, term in terms], ec):
+        return []
+    if len(terms) == 1:
+        return [terms[0][0]]
+    mid = len(terms) // 2
+    invalid = _blame(terms[:mid], ec)
+    # if the first half is valid, the second half must be invalid
+    return invalid + _blame(terms[mid:], ec, not invalid)
+
+
+def batch_verify_with_blame_(
+    m_hashes: Sequence[Octets],
+    Qs: Sequence[BIP340PubKey],
+    sigs: Sequence[Sig],
+    hf: HashF = sha256,
+) -> List[int]:
+    """Batch verification of BIP340 signatures, blaming the invalid ones.
+
+    Return the (sorted) indexes of the invalid signatures,
+    an empty list if all signatures are valid.
+    A failed batch is recursively bisected:
+    k invalid signatures among n are located
+    with O(k log n) batch verifications.
+    """
+
+    ec = _assert_batch_args(m_hashes, Qs, sigs)
+    invalid: List[int] = []
+    terms: List[Tuple[int, _BatchTerm]] = []
+    for i, args in enumerate(zip(m_hashes, Qs, sigs)):
+        # all kind of Exceptions are catched because
+        # a malformed input just makes its own signature invalid
+        try:
+            terms.append((i, _batch_term_(*args, hf)))
+        except Exception:  # pylint: disable=broad-except
+            invalid.append(i)
+    if terms:
+        invalid += _blame(terms, ec)
+    return sorted(invalid)
+
+
+def batch_verify_with_blame(
+    ms: Sequence[Octets],
+    Qs: Sequence[BIP340PubKey],
+    sigs: Sequence[Sig],
+    hf: HashF = sha256,
+) -> List[int]:
+    "Batch verification of BIP340 signatures, blaming the invalid ones."
+
+    m_hashes = [reduce_to_hlen(msg, hf) for msg in ms]
+    return batch_verify_with_blame_(m_hashes, Qs, sigs, hf)
@@ -12,8 +12,9 @@
 
 """
 
+import functools
 import hashlib
-from typing import Callable, List, Tuple, Union
+from typing import Any, Callable, List, Tuple, Union
 
 from btclib.alias import HashF, Octets
 from btclib.ecc.curve import Curve, secp256k1
@@ -105,16 +106,41 @@ def merkle_root(data: List[bytes], hf: Callable[[Union[bytes, str]], bytes]) ->
     return data[0]
 
 
-def tagged_hash(tag: bytes, m: bytes, hf: HashF = hashlib.sha256) -> bytes:
+class TaggedHasher:
+    """BIP340 tagged hash with precomputed midstate.
+
+    TaggedHash(tag, m) = hf(hf(tag)||hf(tag)||m)
+
+    The hf(tag)||hf(tag) prefix (a full 64-byte block for SHA256)
+    is hashed only once: its midstate is copied for each message.
+    """
+
+    def __init__(self, tag: bytes, hf: HashF = hashlib.sha256) -> None:
 
-    h1 = hf()
-    h1.update(tag)
-    tag_hash = h1.digest()
+        self.tag = tag
+        h = hf()
+        h.update(tag)
+        tag_hash = h.digest()
+        self._midstate = hf()
+        self._midstate.update(tag_hash + tag_hash)
 
-    h2 = hf()
-    h2.update(tag_hash + tag_hash)
+    def new(self) -> Any:
+        "Return a new hash object, having already hashed the tag prefix."
+        return self._midstate.copy()
 
-    # it could be sped up by storing the above midstate
+    def hash(self, m: bytes) -> bytes:
+        "Return the tagged hash of the message."
 
-    h2.update(m)
-    return h2.digest()
+        h = self._midstate.copy()
+        h.update(m)
+        return h.digest()
+
+
+@functools.lru_cache()
+def tagged_hasher(tag: bytes, hf: HashF = hashlib.sha256) -> TaggedHasher:
+    "Return the (cached) TaggedHasher for the tag."
+    return TaggedHasher(tag, hf)
+
+
+def tagged_hash(tag: bytes, m: bytes, hf: HashF = hashlib.sha256) -> bytes:
+    return tagged_hasher(tag, hf).hash(m)
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Bitcoin Merkle trees: incremental root, inclusion proofs, and BIP37.
+
+The leaves are binary hashes (e.g. tx_id in internal byte order,
+i.e. reversed with respect to the usual hex representation).
+As in Bitcoin, at each level an odd last node is paired with itself.
+
+MerkleTree accepts leaves one at a time (or as a stream)
+keeping only O(log n) subtree roots for the root computation,
+as Bitcoin Core's legacy MerkleComputation;
+the full levels, needed for the inclusion proofs,
+are kept only if requested.
+
+PartialMerkleTree is the BIP37 (merkleblock) partial Merkle tree:
+
+https://github.com/bitcoin/bips/blob/master/bip-0037.mediawiki
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from btclib import var_int
+from btclib.alias import BinaryData
+from btclib.exceptions import BTClibValueError
+from btclib.hashes import hash256
+from btclib.utils import bytesio_from_binarydata
+
+# binary hash function, e.g. hash256
+HashB = Callable[[bytes], bytes]
+
+_HASH_LEN = 32
+
+# max number of transactions in a block: 4_000_000 / 60,
+# i.e. max block weight / min transaction weight
+MAX_TRANSACTIONS = 66_666
+
+
+class MerkleTree:
+    """Bitcoin Merkle tree, built incrementally.
+
+    Leaves are added with append or extend;
+    if keep_levels is True all the tree levels are kept,
+    allowing for inclusion proofs.
+
+    The tree is mutated (CVE-2012-2459) if two identical siblings
+    have been hashed together, e.g. because the last leaves
+    have been duplicated: such a tree has the same root
+    of the not duplicated one.
+    """
+
+    def __init__(
+        self,
+        leaves: Iterable[bytes] = (),
+        hf: HashB = hash256,
+        keep_levels: bool = False,
+    ) -> None:
+
+        self.hf = hf
+        self.mutated = False
+        self._count = 0
+        # _inner[level] is the root of the complete subtree
+        # of 2^level leaves waiting for its right sibling
+        self._inner: Dict[int, bytes] = {}
+        self._leaves: Optional[List[bytes]] = [] if keep_levels else None
+        self._levels: Optional[List[List[bytes]]] = None
+        self.extend(leaves)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, leaf: bytes) -> None:
+        "Add a leaf to the tree."
+
+        if len(leaf) != _HASH_LEN:
+            err_msg = f"invalid leaf length: {len(leaf)} bytes"
+            err_msg += f" instead of {_HASH_LEN}"
+            raise BTClibValueError(err_msg)
+
+        if self._leaves is not None:
+            self._leaves.append(leaf)
+            self._levels = None
+
+        self._count += 1
+        h = leaf
+        level = 0
+        # for each trailing zero bit of count, the completed subtree
+        # is hashed with its left sibling
+        while not self._count & (1 << level):
+            left = self._inner.pop(level)
+            self.mutated |= left == h
+            h = self.hf(left + h)
+            level += 1
+        self._inner[level] = h
+
+    def extend(self, leaves: Iterable[bytes]) -> None:
+        "Add the leaves to the tree."
+
+        for leaf in leaves:
+            self.append(leaf)
+
+    @property
+    def root(self) -> bytes:
+        "Return the Merkle root."
+
+        if self._count == 0:
+            raise BTClibValueError("empty Merkle tree")
+
+        count = self._count
+        level = 0
+        while not count & (1 << level):
+            level += 1
+        h = self._inner[level]
+        while count != 1 << level:
+            # h is the root of an odd last subtree:
+            # it is paired with itself, as if the level had one more node
+            h = self.hf(h + h)
+            count += 1 << level
+            level += 1
+            while not count & (1 << level):
+                h = self.hf(self._inner[level] + h)
+                level += 1
+        return h
+
+    @property
+    def levels(self) -> List[List[bytes]]:
+        "Return all the levels of the tree, from the leaves to the root."
+
+        if self._leaves is None:
+            raise BTClibValueError("Merkle tree levels not kept")
+        if self._count == 0:
+            raise BTClibValueError("empty Merkle tree")
+
+        if self._levels is None:
+            level = self._leaves
+            self._levels = [level]
+            while len(level) > 1:
+                if len(level) % 2:
+                    level = level + level[-1:]
+                level = [
+                    self.hf(level[i] + level[i + 1]) for i in range(0, len(level), 2)
+                ]
+                self._levels.append(level)
+        return self._levels
+
+    def proof(self, index: int) -> List[bytes]:
+        "Return the inclusion proof (bottom-up siblings) of the index-th leaf."
+
+        if not 0 <= index < self._count:
+            raise BTClibValueError(f"invalid leaf index: {index}")
+
+        siblings: List[bytes] = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            siblings.append(level[sibling] if sibling < len(level) else level[index])
+            index >>= 1
+        return siblings
+
+
+def root_from_proof(
+    leaf: bytes, index: int, proof: Sequence[bytes], hf: HashB = hash256
+) -> bytes:
+    "Return the Merkle root resulting from the inclusion proof of the leaf."
+
+    h = leaf
+    for sibling in proof:
+        h = hf(sibling + h) if index & 1 else hf(h + sibling)
+        index >>= 1
+    if index:
+        raise BTClibValueError("invalid leaf index for the proof length")
+    return h
+
+
+def verify_proof(
+    leaf: bytes, index: int, proof: Sequence[bytes], root: bytes, hf: HashB = hash256
+) -> bool:
+    "Verify the inclusion proof of the index-th leaf."
+
+    # all kind of Exceptions are catched because
+    # verify must always return a bool
+    try:
+        return root_from_proof(leaf, index, proof, hf) == root
+    except Exception:  # pylint: disable=broad-except
+        return False
+
+
+def _tree_width(n_leaves: int, height: int) -> int:
+    return (n_leaves + (1 << height) - 1) >> height
+
+
+def _tree_height(n_leaves: int) -> int:
+    height = 0
+    while _tree_width(n_leaves, height) > 1:
+        height += 1
+    return height
+
+
+@dataclass
+class PartialMerkleTree:
+    """BIP37 partial Merkle tree.
+
+    It proves the inclusion of the matched leaves among n_leaves,
+    with the hashes and the flag bits of a depth-first traversal.
+    """
+
+    n_leaves: int
+    hashes: List[bytes]
+    flags: List[bool]
+
+    def __init__(
+        self,
+        n_leaves: int = 0,
+        hashes: Optional[Sequence[bytes]] = None,
+        flags: Optional[Sequence[bool]] = None,
+        check_validity: bool = True,
+    ) -> None:
+
+        self.n_leaves = n_leaves
+        self.hashes = list(hashes) if hashes else []
+        self.flags = list(flags) if flags else []
+
+        if check_validity:
+            self.assert_valid()
+
+    @classmethod
+    def from_leaves(
+        cls: Type["PartialMerkleTree"],
+        leaves: Sequence[bytes],
+        matches: Sequence[bool],
+        hf: HashB = hash256,
+    ) -> "PartialMerkleTree":
+        "Return the partial Merkle tree proving the matched leaves."
+
+        if len(leaves) != len(matches):
+            err_msg = f"mismatch between number of leaves ({len(leaves)}) "
+            err_msg += f"and number of matches ({len(matches)})"
+            raise BTClibValueError(err_msg)
+        n_leaves = len(leaves)
+        levels = MerkleTree(leaves, hf, keep_levels=True).levels
+
+        hashes: List[bytes] = []
+        flags: List[bool] = []
+
+        def traverse(height: int, pos: int) -> None:
+            first = pos << height
+            parent_of_match = any(matches[first : first + (1 << height)])
+            flags.append(parent_of_match)
+            if height == 0 or not parent_of_match:
+                hashes.append(levels[height][pos])
+            else:
+                traverse(height - 1, pos * 2)
+                if pos * 2 + 1 < _tree_width(n_leaves, height - 1):
+                    traverse(height - 1, pos * 2 + 1)
+
+        traverse(_tree_height(n_leaves), 0)
+        return cls(n_leaves, hashes, flags)
+
+    def extract(self, hf: HashB = hash256) -> Tuple[bytes, List[Tuple[int, bytes]]]:
+        "Return the Merkle root and the (index, leaf) matched leaves."
+
+        self.assert_valid()
+
+        matched: List[Tuple[int, bytes]] = []
+        # number of used flags and hashes
+        used = [0, 0]
+
+        def traverse(height: int, pos: int) -> bytes:
+            if used[0] >= len(self.flags):
+                raise BTClibValueError("not enough flags")
+            parent_of_match = self.flags[used[0]]
+            used[0] += 1
+            if height == 0 or not parent_of_match:
+                if used[1] >= len(self.hashes):
+                    raise BTClibValueError("not enough hashes")
+                h = self.hashes[used[1]]
+                used[1] += 1
+                if height == 0 and parent_of_match:
+                    matched.append((pos, h))
+                return h
+            left = traverse(height - 1, pos * 2)
+            if pos * 2 + 1 < _tree_width(self.n_leaves, height - 1):
+                right = traverse(height - 1, pos * 2 + 1)
+                # CVE-2012-2459
+                if right == left:
+                    raise BTClibValueError("identical left and right hashes")
+            else:
+                right = left
+            return hf(left + right)
+
+        root = traverse(_tree_height(self.n_leaves), 0)
+        # all flags (up to the byte padding) and hashes must be used
+        if (used[0] + 7) // 8 != (len(self.flags) + 7) // 8:
+            raise BTClibValueError("unused flags")
+        if used[1] != len(self.hashes):
+            raise BTClibValueError("unused hashes")
+        return root, matched
+
+    def assert_valid(self) -> None:
+
+        if not 0 < self.n_leaves <= MAX_TRANSACTIONS:
+            raise BTClibValueError(f"invalid number of leaves: {self.n_leaves}")
+        if len(self.hashes) > self.n_leaves:
+            raise BTClibValueError(f"too many hashes: {len(self.hashes)}")
+        if len(self.flags) < len(self.hashes):
+            raise BTClibValueError(f"not enough flags: {len(self.flags)}")
+        for h in self.hashes:
+            if len(h) != _HASH_LEN:
+                err_msg = f"invalid hash length: {len(h)} bytes"
+                err_msg += f" instead of {_HASH_LEN}"
+                raise BTClibValueError(err_msg)
+
+    def serialize(self, check_validity: bool = True) -> bytes:
+        "Return the merkleblock serialization (without the block header)."
+
+        if check_validity:
+            self.assert_valid()
+
+        flag_bytes = bytearray((len(self.flags) + 7) // 8)
+        for i, flag in enumerate(self.flags):
+            flag_bytes[i // 8] |= flag << (i % 8)
+        return b"".join(
+            [
+                self.n_leaves.to_bytes(4, byteorder="little", signed=False),
+                var_int.serialize(len(self.hashes)),
+                b"".join(self.hashes),
+                var_int.serialize(len(flag_bytes)),
+                bytes(flag_bytes),
+            ]
+        )
+
+    @classmethod
+    def parse(
+        cls: Type["PartialMerkleTree"], data: BinaryData, check_validity: bool = True
+    ) -> "PartialMerkleTree":
+        "Return a PartialMerkleTree by parsing binary data."
+
+        stream = bytesio_from_binarydata(data)
+        n_leaves = int.from_bytes(stream.read(4), byteorder="little", signed=False)
+        n_hashes = var_int.parse(stream)
+        hashes = [stream.read(_HASH_LEN) for _ in range(n_hashes)]
+        flag_bytes = stream.read(var_int.parse(stream))
+        flags = [
+            bool(flag_bytes[i // 8] >> (i % 8) & 1) for i in range(len(flag_bytes) * 8)
+        ]
+        return cls(n_leaves, hashes, flags, check_validity)
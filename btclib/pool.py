@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Process pool for bulk operations.
+
+The items are split in contiguous shards, processed by a pool
+of worker processes, and the per-item results are returned
+in the original order (map_shards);
+alternatively, a possibly unbounded stream of items is processed
+one item at a time, with a bounded number of items in flight (imap).
+
+It is used e.g. for bulk signing (btclib.ecc) and block validation (btclib.tx).
+Each worker process builds the secp256k1 generator precomputed table
+once, at startup, and keeps it for all its tasks;
+standard curves are pickled by name (see Curve.__reduce_ex__),
+so curve objects and their tables are never serialized
+together with the items.
+"""
+
+import os
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from math import ceil
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from btclib.ecc.curve import secp256k1
+from btclib.exceptions import BTClibValueError
+
+# number of shards for each worker: more shards balance the load better,
+# fewer shards reduce the inter-process communication overhead
+SHARDS_PER_WORKER = 4
+
+_Item = TypeVar("_Item")
+_Result = TypeVar("_Result")
+
+
+def _init_worker() -> None:
+    "Warm up the worker process, building the generator table."
+    secp256k1.GJ_table  # pylint: disable=pointless-statement
+
+
+def map_shards(
+    func: Callable[..., List[_Result]],
+    items: Sequence[_Item],
+    args: Sequence[Any] = (),
+    workers: Optional[int] = None,
+    shard_size: Optional[int] = None,
+) -> List[_Result]:
+    """Return the concatenation of func(*args, shard) for all shards.
+
+    func must be a module-level function (i.e. picklable)
+    returning a list of results, one for each item of the shard.
+    workers defaults to the number of CPUs:
+    with a single worker the items are processed in-process.
+    """
+
+    workers = _workers(workers)
+
+    if workers == 1 or len(items) < 2:
+        return func(*args, items)
+
+    if shard_size is None:
+        shard_size = ceil(len(items) / (workers * SHARDS_PER_WORKER))
+    if shard_size < 1:
+        raise BTClibValueError(f"invalid shard size: {shard_size}")
+    shards = [items[i : i + shard_size] for i in range(0, len(items), shard_size)]
+
+    with _executor(workers) as executor:
+        results = executor.map(partial(func, *args), shards)
+        return [result for shard in results for result in shard]
+
+
+def imap(
+    func: Callable[..., _Result],
+    items: Iterable[_Item],
+    args: Sequence[Any] = (),
+    workers: Optional[int] = None,
+    window: Optional[int] = None,
+) -> Iterator[_Result]:
+    """Yield func(*args, item) for all items, in the items order.
+
+    func must be a module-level function (i.e. picklable).
+    The items are consumed lazily, one at a time, and at most window
+    (default: twice the number of workers) of them are in flight:
+    i.e. a slow consumer of the results provides back-pressure
+    to the producer of the items, bounding the memory usage.
+    workers defaults to the number of CPUs:
+    with a single worker the items are processed in-process.
+    """
+
+    workers = _workers(workers)
+    if window is None:
+        window = 2 * workers
+    if window < 1:
+        raise BTClibValueError(f"invalid window size: {window}")
+
+    if workers == 1:
+        for item in items:
+            yield func(*args, item)
+        return
+
+    with _executor(workers) as executor:
+        pending: Deque[Future] = deque()
+        for item in items:
+            if len(pending) == window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(func, *args, item))
+        while pending:
+            yield pending.popleft().result()
+
+
+def _workers(workers: Optional[int]) -> int:
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise BTClibValueError(f"invalid number of workers: {workers}")
+    return workers
+
+
+def _executor(workers: int) -> ProcessPoolExecutor:
+
+    # before python 3.7 the table is built at the first use
+    # by each worker, as no initializer is available
+    kwargs: Dict[str, Any] = {}
+    if sys.version_info >= (3, 7):
+        kwargs["initializer"] = _init_worker
+    return ProcessPoolExecutor(workers, **kwargs)
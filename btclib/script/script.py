@@ -24,6 +24,7 @@ from dataclasses import dataclass
 from typing import List, Sequence, Union
 
 from btclib.alias import BinaryData, Octets
+from btclib.change_tracking import ChangeTracked
 from btclib.exceptions import BTClibValueError
 from btclib.script.op_codes import (
     OP_CODE_NAMES,
@@ -99,7 +100,7 @@ def parse(stream: BinaryData, exit_on_op_success: bool = False) -> List[Command]
 
 
 @dataclass
-class Script:
+class Script(ChangeTracked):
     # Bitcoin script expressed as List[Command]
     # e.g. [OP_HASH160, script_h160, OP_EQUAL]
     # or Octets of its byte-encoded representation
@@ -118,7 +119,7 @@ class Script:
 
     def __init__(self, script: Octets = b"", check_validity: bool = True) -> None:
 
-        self.script = bytes_from_octets(script)
+        object.__setattr__(self, "script", bytes_from_octets(script))
         if check_validity:
             self.assert_valid()
 
@@ -338,7 +338,7 @@ class ScriptPubKey(Script):
         network: str = "mainnet",
         check_validity: bool = True,
     ) -> None:
-        self.network = network
+        object.__setattr__(self, "network", network)
         super().__init__(script, check_validity=False)
         if check_validity:
             self.assert_valid()
@@ -15,13 +15,13 @@ https://raghavsood.com/blog/2018/06/10/bitcoin-signature-types-sighash
 https://wiki.bitcoinsv.io/index.php/SIGHASH_flags
 """
 
-from copy import deepcopy
-from typing import List
+import hashlib
+from typing import Dict, List, Optional, Sequence
 
-from btclib import var_bytes
+from btclib import var_bytes, var_int
 from btclib.alias import Octets
 from btclib.exceptions import BTClibValueError
-from btclib.hashes import hash256, sha256, tagged_hash
+from btclib.hashes import hash256, sha256, tagged_hasher
 from btclib.script.script import Command, parse, serialize
 from btclib.script.script_pub_key import (
     ScriptPubKey,
@@ -35,6 +35,10 @@ from btclib.tx.tx import Tx
 from btclib.tx.tx_out import TxOut
 from btclib.utils import bytes_from_octets
 
+# cached tagged hashers, with precomputed midstates
+_TAP_SIGHASH = tagged_hasher(b"TapSighash")
+_TAP_LEAF = tagged_hasher(b"TapLeaf")
+
 DEFAULT = 0
 ALL = 1
 NONE = 2
@@ -52,6 +56,124 @@ SIG_HASH_TYPES = [
 ]
 
 
+class PrecomputedTxData:
+    """Transaction data shared by the sig_hash of all the inputs.
+
+    As Bitcoin Core's PrecomputedTransactionData,
+    it avoids the quadratic hashing of the transaction
+    when computing the BIP143 (segwit_v0) or BIP341 (taproot)
+    sig_hash of all its inputs.
+    The BIP341 amounts and script_pub_keys hashes are available
+    only if the prevouts (i.e. the TxOuts spent by the inputs)
+    are provided, or after the first taproot sig_hash
+    (with the amounts and script_pub_keys it has been provided with).
+
+    The hashes are lazily computed (and cached) on first access,
+    i.e. only those needed by the sig_hash types actually used;
+    they are recomputed if the transaction is changed afterwards.
+    """
+
+    def __init__(self, tx: Tx, prevouts: Optional[Sequence[TxOut]] = None) -> None:
+
+        self.tx = tx
+        self._memo: Dict[str, bytes] = {}
+        # pylint: disable=protected-access
+        self._tx_change = tx._latest_change()
+
+        # snapshot of the amounts and scripts spent by the inputs
+        self._amounts: Optional[List[int]] = None
+        self._scripts: Optional[List[bytes]] = None
+        if prevouts is not None:
+            amounts = [o.value for o in prevouts]
+            self._set_spent(amounts, [o.script_pub_key.script for o in prevouts])
+
+    def _set_spent(self, amounts: List[int], scripts: List[bytes]) -> None:
+
+        if self._amounts is None or self._scripts is None:
+            if len(amounts) != len(self.tx.vin):
+                err_msg = f"mismatch between number of prevouts ({len(amounts)}) "
+                err_msg += f"and number of inputs ({len(self.tx.vin)})"
+                raise BTClibValueError(err_msg)
+            self._amounts, self._scripts = amounts, scripts
+        elif amounts != self._amounts or scripts != self._scripts:
+            raise BTClibValueError("prevouts not matching the txdata ones")
+
+    def assert_valid(self, tx: Tx, prevouts: Optional[Sequence[TxOut]] = None) -> None:
+        """Assert that the txdata is for the transaction and prevouts.
+
+        The cached hashes are discarded if the transaction has changed.
+        """
+
+        if tx is not self.tx:
+            raise BTClibValueError("txdata not computed for this transaction")
+        tx_change = tx._latest_change()  # pylint: disable=protected-access
+        if tx_change != self._tx_change:
+            self._memo.clear()
+            self._tx_change = tx_change
+            if self._amounts is not None and len(self._amounts) != len(tx.vin):
+                err_msg = f"mismatch between number of prevouts ({len(self._amounts)}) "
+                err_msg += f"and number of inputs ({len(tx.vin)})"
+                raise BTClibValueError(err_msg)
+        if prevouts is not None:
+            amounts = [o.value for o in prevouts]
+            self._set_spent(amounts, [o.script_pub_key.script for o in prevouts])
+
+    # BIP341 single SHA256 hashes
+
+    @property
+    def sha_prevouts(self) -> bytes:
+        if "sha_prevouts" not in self._memo:
+            data = b"".join(i.prev_out.serialize() for i in self.tx.vin)
+            self._memo["sha_prevouts"] = sha256(data)
+        return self._memo["sha_prevouts"]
+
+    @property
+    def sha_sequences(self) -> bytes:
+        if "sha_sequences" not in self._memo:
+            data = b"".join(i.sequence.to_bytes(4, "little") for i in self.tx.vin)
+            self._memo["sha_sequences"] = sha256(data)
+        return self._memo["sha_sequences"]
+
+    @property
+    def sha_outputs(self) -> bytes:
+        if "sha_outputs" not in self._memo:
+            data = b"".join(o.serialize() for o in self.tx.vout)
+            self._memo["sha_outputs"] = sha256(data)
+        return self._memo["sha_outputs"]
+
+    @property
+    def sha_amounts(self) -> bytes:
+        if self._amounts is None:
+            raise BTClibValueError("missing prevouts")
+        if "sha_amounts" not in self._memo:
+            data = b"".join(amount.to_bytes(8, "little") for amount in self._amounts)
+            self._memo["sha_amounts"] = sha256(data)
+        return self._memo["sha_amounts"]
+
+    @property
+    def sha_script_pub_keys(self) -> bytes:
+        if self._scripts is None:
+            raise BTClibValueError("missing prevouts")
+        if "sha_script_pub_keys" not in self._memo:
+            data = b"".join(var_bytes.serialize(s) for s in self._scripts)
+            self._memo["sha_script_pub_keys"] = sha256(data)
+        return self._memo["sha_script_pub_keys"]
+
+    # BIP143 double SHA256 hashes
+
+    @property
+    def hash_prevouts(self) -> bytes:
+        return sha256(self.sha_prevouts)
+
+    @property
+    def hash_sequences(self) -> bytes:
+        return sha256(self.sha_sequences)
+
+    @property
+    def hash_outputs(self) -> bytes:
+        return sha256(self.sha_outputs)
+
+
 def assert_valid_hash_type(hash_type: int) -> None:
     if hash_type not in SIG_HASH_TYPES:
         raise BTClibValueError(f"invalid sig_hash type: {hex(hash_type)}")
@@ -90,50 +212,97 @@ def witness_v0_script(script_pub_key: Octets) -> List[bytes]:
 
 
 def legacy(script_: Octets, tx: Tx, vin_i: int, hash_type: int) -> bytes:
+    """Return the legacy sig_hash of the vin_i-th input.
+
+    The preimage is the serialization of a modified copy of the tx:
+    instead of copying and modifying the tx,
+    the modified fields are directly streamed into the hasher.
+    """
     script_ = bytes_from_octets(script_)
+    base_type = hash_type & 0x1F
 
-    new_tx = deepcopy(tx)
-    for txin in new_tx.vin:
-        txin.script_sig = b""
-    # TODO: delete sig from script_ (even if non standard)
-    new_tx.vin[vin_i].script_sig = script_
-    if hash_type & 0x1F == NONE:
-        new_tx.vout = []
-        for i, txin in enumerate(new_tx.vin):
-            if i != vin_i:
-                txin.sequence = 0
-
-    if hash_type & 0x1F == SINGLE:
+    if base_type == SINGLE and vin_i >= len(tx.vout):
         # sig_hash single bug
-        if vin_i >= len(new_tx.vout):
-            return (256 ** 31).to_bytes(32, byteorder="big", signed=False)
-        new_tx.vout = new_tx.vout[: vin_i + 1]
-        for txout in new_tx.vout[:-1]:
-            txout.script_pub_key = ScriptPubKey(b"")
-            txout.value = 0xFFFFFFFFFFFFFFFF
-        for i, txin in enumerate(new_tx.vin):
-            if i != vin_i:
-                txin.sequence = 0
-
-    if hash_type & 0x80:
-        new_tx.vin = [new_tx.vin[vin_i]]
-
-    preimage = new_tx.serialize(include_witness=False, check_validity=False)
-    preimage += hash_type.to_bytes(4, byteorder="little", signed=False)
+        return (256 ** 31).to_bytes(32, byteorder="big", signed=False)
 
-    return hash256(preimage)
+    hasher = hashlib.sha256()
+    hasher.update(tx.version.to_bytes(4, byteorder="little", signed=False))
+
+    if hash_type & ANYONECANPAY:
+        hasher.update(var_int.serialize(1))
+        tx_in = tx.vin[vin_i]
+        hasher.update(tx_in.prev_out.serialize(check_validity=False))
+        hasher.update(var_bytes.serialize(script_))
+        hasher.update(tx_in.sequence.to_bytes(4, byteorder="little", signed=False))
+    else:
+        hasher.update(var_int.serialize(len(tx.vin)))
+        empty_script = var_bytes.serialize(b"")
+        zero_sequence = (0).to_bytes(4, byteorder="little", signed=False)
+        for i, tx_in in enumerate(tx.vin):
+            hasher.update(tx_in.prev_out.serialize(check_validity=False))
+            if i == vin_i:
+                # TODO: delete sig from script_ (even if non standard)
+                hasher.update(var_bytes.serialize(script_))
+                sequence = tx_in.sequence.to_bytes(4, "little", signed=False)
+            else:
+                hasher.update(empty_script)
+                # other inputs' sequence is not committed to for NONE and SINGLE
+                if base_type in (NONE, SINGLE):
+                    sequence = zero_sequence
+                else:
+                    sequence = tx_in.sequence.to_bytes(4, "little", signed=False)
+            hasher.update(sequence)
+
+    if base_type == NONE:
+        hasher.update(var_int.serialize(0))
+    elif base_type == SINGLE:
+        hasher.update(var_int.serialize(vin_i + 1))
+        # previous outputs: -1 value and empty script_pub_key
+        blank_tx_out = b"\xff" * 8 + var_bytes.serialize(b"")
+        for _ in range(vin_i):
+            hasher.update(blank_tx_out)
+        hasher.update(tx.vout[vin_i].serialize(check_validity=False))
+    else:
+        hasher.update(var_int.serialize(len(tx.vout)))
+        for tx_out in tx.vout:
+            hasher.update(tx_out.serialize(check_validity=False))
+
+    hasher.update(tx.lock_time.to_bytes(4, byteorder="little", signed=False))
+    hasher.update(hash_type.to_bytes(4, byteorder="little", signed=False))
+
+    return hashlib.sha256(hasher.digest()).digest()
 
 
 # https://github.com/bitcoin/bitcoin/blob/4b30c41b4ebf2eb70d8a3cd99cf4d05d405eec81/test/functional/test_framework/script.py#L673
 def segwit_v0(
-    script_: Octets, tx: Tx, vin_i: int, hash_type: int, amount: int
+    script_: Octets,
+    tx: Tx,
+    vin_i: int,
+    hash_type: int,
+    amount: int,
+    txdata: Optional[PrecomputedTxData] = None,
+) -> bytes:
+
+    if txdata is None:
+        txdata = PrecomputedTxData(tx)
+    else:
+        txdata.assert_valid(tx)
+    return _segwit_v0(script_, tx, vin_i, hash_type, amount, txdata)
+
+
+def _segwit_v0(
+    script_: Octets,
+    tx: Tx,
+    vin_i: int,
+    hash_type: int,
+    amount: int,
+    txdata: PrecomputedTxData,
 ) -> bytes:
     script_ = bytes_from_octets(script_)
 
     hash_prev_outs = b"\x00" * 32
     if not hash_type & ANYONECANPAY:
-        hash_prev_outs = b"".join([vin.prev_out.serialize() for vin in tx.vin])
-        hash_prev_outs = hash256(hash_prev_outs)
+        hash_prev_outs = txdata.hash_prevouts
 
     hash_seqs = b"\x00" * 32
     if (
@@ -141,18 +310,11 @@ def segwit_v0(
         and (hash_type & 0x1F) != SINGLE
         and (hash_type & 0x1F) != NONE
     ):
-        hash_seqs = b"".join(
-            [
-                vin.sequence.to_bytes(4, byteorder="little", signed=False)
-                for vin in tx.vin
-            ]
-        )
-        hash_seqs = hash256(hash_seqs)
+        hash_seqs = txdata.hash_sequences
 
     hash_outputs = b"\x00" * 32
     if hash_type & 0x1F not in (SINGLE, NONE):
-        hash_outputs = b"".join([vout.serialize() for vout in tx.vout])
-        hash_outputs = hash256(hash_outputs)
+        hash_outputs = txdata.hash_outputs
     elif (hash_type & 0x1F) == SINGLE and vin_i < len(tx.vout):
         hash_outputs = hash256(tx.vout[vin_i].serialize())
 
@@ -182,8 +344,38 @@ def taproot(
     ext_flag: int,
     annex: bytes,
     message_extension: bytes,
+    txdata: Optional[PrecomputedTxData] = None,
+) -> bytes:
+
+    if txdata is None:
+        txdata = PrecomputedTxData(transaction)
+    else:
+        txdata.assert_valid(transaction)
+    # the amounts and scripts are hashed only once for all the inputs
+    txdata._set_spent(  # pylint: disable=protected-access
+        amounts, [s.script for s in scriptpubkeys]
+    )
+    return _taproot(
+        transaction, input_index, hashtype, ext_flag, annex, message_extension, txdata
+    )
+
+
+def _taproot(
+    transaction: Tx,
+    input_index: int,
+    hashtype: int,
+    ext_flag: int,
+    annex: bytes,
+    message_extension: bytes,
+    txdata: PrecomputedTxData,
 ) -> bytes:
 
+    # the amounts and scripts spent by the inputs
+    # pylint: disable=protected-access
+    amounts, scripts = txdata._amounts, txdata._scripts
+    if amounts is None or scripts is None:  # pragma: no cover
+        raise BTClibValueError("missing prevouts")
+
     if hashtype not in SIG_HASH_TYPES:
         raise BTClibValueError(f"Unknown hash type: {hashtype}")
     if hashtype & 0x03 == SINGLE and input_index >= len(transaction.vout):
@@ -195,25 +387,13 @@ def taproot(
     preimage += transaction.nLockTime.to_bytes(4, "little")
 
     if hashtype & 0x80 != ANYONECANPAY:
-        sha_prevouts = b""
-        sha_amounts = b""
-        sha_scriptpubkeys = b""
-        sha_sequences = b""
-        for i, vin in enumerate(transaction.vin):
-            sha_prevouts += vin.prev_out.serialize()
-            sha_amounts += amounts[i].to_bytes(8, "little")
-            sha_scriptpubkeys += var_bytes.serialize(scriptpubkeys[i].script)
-            sha_sequences += vin.nSequence.to_bytes(4, "little")
-        preimage += sha256(sha_prevouts)
-        preimage += sha256(sha_amounts)
-        preimage += sha256(sha_scriptpubkeys)
-        preimage += sha256(sha_sequences)
+        preimage += txdata.sha_prevouts
+        preimage += txdata.sha_amounts
+        preimage += txdata.sha_script_pub_keys
+        preimage += txdata.sha_sequences
 
     if hashtype & 0x03 not in [NONE, SINGLE]:
-        sha_outputs = b""
-        for vout in transaction.vout:
-            sha_outputs += vout.serialize()
-        preimage += sha256(sha_outputs)
+        preimage += txdata.sha_outputs
 
     annex_present = int(bool(annex))
     preimage += (2 * ext_flag + annex_present).to_bytes(1, "little")
@@ -221,7 +401,7 @@ def taproot(
     if hashtype & 0x80 == ANYONECANPAY:
         preimage += transaction.vin[input_index].prev_out.serialize()
         preimage += amounts[input_index].to_bytes(8, "little")
-        preimage += var_bytes.serialize(scriptpubkeys[input_index].script)
+        preimage += var_bytes.serialize(scripts[input_index])
         preimage += transaction.vin[input_index].nSequence.to_bytes(4, "little")
     else:
         preimage += input_index.to_bytes(4, "little")
@@ -235,42 +415,40 @@ def taproot(
 
     preimage += message_extension
 
-    sig_hash = tagged_hash(b"TapSighash", preimage)
+    sig_hash = _TAP_SIGHASH.hash(preimage)
     return sig_hash
 
 
-def from_tx(prevouts: List[TxOut], tx: Tx, vin_i: int, hash_type: int) -> bytes:
+def _from_tx(
+    prevouts: Sequence[TxOut],
+    tx: Tx,
+    vin_i: int,
+    hash_type: int,
+    txdata: PrecomputedTxData,
+) -> bytes:
 
     script = prevouts[vin_i].script_pub_key.script
 
     if is_p2tr(script):
         annex = b""
-        witness = tx.vin[vin_i].script_witness
-        if len(witness.stack) >= 2 and witness.stack[-1][0] == 0x50:
-            annex = witness.stack[-1]
-            witness.stack = witness.stack[:-1]
+        # the annex is removed from a copy, not from the tx witness
+        stack = tx.vin[vin_i].script_witness.stack
+        if len(stack) >= 2 and stack[-1][0] == 0x50:
+            annex = stack[-1]
+            stack = stack[:-1]
 
-        if len(witness.stack) == 0:
+        if len(stack) == 0:
             raise BTClibValueError("Empty stack")
 
         ext = b""
-        if len(witness.stack) > 1:
-            leaf_version = witness.stack[-1][0] & 0xFE
+        if len(stack) > 1:
+            leaf_version = stack[-1][0] & 0xFE
             preimage = leaf_version.to_bytes(1, "big")
-            preimage += var_bytes.serialize(witness.stack[-2])
-            tapleaf_hash = tagged_hash(b"TapLeaf", preimage)
+            preimage += var_bytes.serialize(stack[-2])
+            tapleaf_hash = _TAP_LEAF.hash(preimage)
             ext = tapleaf_hash + b"\x00\xff\xff\xff\xff"
 
-        return taproot(
-            tx,
-            vin_i,
-            [x.value for x in prevouts],
-            [x.script_pub_key for x in prevouts],
-            hash_type,
-            int(bool(ext)),
-            annex,
-            ext,
-        )
+        return _taproot(tx, vin_i, hash_type, int(bool(ext)), annex, ext, txdata)
 
     # handle all p2sh-wrapped scripts
     if is_p2sh(script):
@@ -278,15 +456,60 @@ def from_tx(prevouts: List[TxOut], tx: Tx, vin_i: int, hash_type: int) -> bytes:
 
     if is_p2wpkh(script):
         script_ = witness_v0_script(script)[0]
-        return segwit_v0(script_, tx, vin_i, hash_type, prevouts[vin_i].value)
+        return _segwit_v0(script_, tx, vin_i, hash_type, prevouts[vin_i].value, txdata)
 
     if is_p2wsh(script):
         # the real script is contained in the witness
         script_ = witness_v0_script(tx.vin[vin_i].script_witness.stack[-1])[0]
-        return segwit_v0(script_, tx, vin_i, hash_type, prevouts[vin_i].value)
+        return _segwit_v0(script_, tx, vin_i, hash_type, prevouts[vin_i].value, txdata)
 
     if is_p2tr(script):
         raise BTClibValueError("Taproot scripts cannot be wrapped in p2sh")
 
     script_ = legacy_script(script)[0]
     return legacy(script_, tx, vin_i, hash_type)
+
+
+def from_tx(
+    prevouts: List[TxOut],
+    tx: Tx,
+    vin_i: int,
+    hash_type: int,
+    txdata: Optional[PrecomputedTxData] = None,
+) -> bytes:
+    """Return the sig_hash of the vin_i-th input.
+
+    When computing the sig_hash of many inputs of the same transaction,
+    txdata (i.e. PrecomputedTxData(tx, prevouts)) should be provided:
+    see also sig_hashes.
+    """
+
+    if txdata is None:
+        txdata = PrecomputedTxData(tx, prevouts)
+    else:
+        txdata.assert_valid(tx, prevouts)
+    return _from_tx(prevouts, tx, vin_i, hash_type, txdata)
+
+
+def sig_hashes(
+    tx: Tx, prevouts: Sequence[TxOut], hash_types: Sequence[int]
+) -> List[bytes]:
+    """Return the sig_hash of all the inputs.
+
+    The i-th sig_hash is for the i-th input, spending the i-th prevout
+    with the i-th hash type:
+    the transaction data shared by all the inputs
+    (see PrecomputedTxData) is computed only once,
+    while the transaction is left untouched.
+    """
+
+    if not len(tx.vin) == len(prevouts) == len(hash_types):
+        err_msg = f"mismatch between number of inputs ({len(tx.vin)}), "
+        err_msg += f"prevouts ({len(prevouts)}), and hash types ({len(hash_types)})"
+        raise BTClibValueError(err_msg)
+
+    txdata = PrecomputedTxData(tx, prevouts)
+    return [
+        _from_tx(prevouts, tx, i, hash_type, txdata)
+        for i, hash_type in enumerate(hash_types)
+    ]
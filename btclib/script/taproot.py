@@ -17,7 +17,7 @@ from btclib import var_bytes
 from btclib.alias import Octets
 from btclib.ecc.curve import Curve, mult, secp256k1
 from btclib.exceptions import BTClibValueError
-from btclib.hashes import tagged_hash
+from btclib.hashes import tagged_hasher
 from btclib.script.script import serialize
 from btclib.to_prv_key import PrvKey, int_from_prv_key
 from btclib.to_pub_key import Key, pub_keyinfo_from_key
@@ -30,6 +30,11 @@ from btclib.utils import bytes_from_octets
 # TaprootScriptTree = List[Union[Any, TaprootLeaf]]
 TaprootScriptTree = Any
 
+# cached tagged hashers, with precomputed midstates
+_TAP_LEAF = tagged_hasher(b"TapLeaf")
+_TAP_BRANCH = tagged_hasher(b"TapBranch")
+_TAP_TWEAK = tagged_hasher(b"TapTweak")
+
 
 def tree_helper(script_tree) -> Tuple[Any, bytes]:
     if len(script_tree) == 1:
@@ -37,7 +42,7 @@ def tree_helper(script_tree) -> Tuple[Any, bytes]:
         leaf_version = leaf_version & 0xFE
         preimage = leaf_version.to_bytes(1, "big")
         preimage += var_bytes.serialize(serialize(script))
-        h = tagged_hash(b"TapLeaf", preimage)
+        h = _TAP_LEAF.hash(preimage)
         return ([((leaf_version, script), bytes())], h)
     left, left_h = tree_helper(script_tree[0])
     right, right_h = tree_helper(script_tree[1])
@@ -45,7 +50,7 @@ def tree_helper(script_tree) -> Tuple[Any, bytes]:
     info += [(leaf, c + left_h) for leaf, c in right]
     if right_h < left_h:
         left_h, right_h = right_h, left_h
-    return (info, tagged_hash(b"TapBranch", left_h + right_h))
+    return (info, _TAP_BRANCH.hash(left_h + right_h))
 
 
 def output_pubkey(
@@ -63,8 +68,8 @@ def output_pubkey(
     if script_tree:
         _, h = tree_helper(script_tree)
     else:
-        h = tagged_hash(b"TapTweak", pubkey)
-    t = int.from_bytes(tagged_hash(b"TapTweak", pubkey + h), "big")
+        h = _TAP_TWEAK.hash(pubkey)
+    t = int.from_bytes(_TAP_TWEAK.hash(pubkey + h), "big")
     # edge case that cannot be reproduced in the test suite
     if t >= ec.n:
         raise BTClibValueError("Invalid script tree hash")  # pragma: no cover
@@ -83,10 +88,10 @@ def output_prvkey(
     if script_tree:
         _, h = tree_helper(script_tree)
     else:
-        h = tagged_hash(b"TapTweak", P[0].to_bytes(32, "big"))
+        h = _TAP_TWEAK.hash(P[0].to_bytes(32, "big"))
     has_even_y = ec.y_even(P[0]) == P[1]
     internal_prvkey = internal_prvkey if has_even_y else ec.n - internal_prvkey
-    t = int.from_bytes(tagged_hash(b"TapTweak", P[0].to_bytes(32, "big") + h), "big")
+    t = int.from_bytes(_TAP_TWEAK.hash(P[0].to_bytes(32, "big") + h), "big")
     # edge case that cannot be reproduced in the test suite
     if t >= ec.n:
         raise BTClibValueError("Invalid script tree hash")  # pragma: no cover
@@ -122,15 +127,15 @@ def check_output_pubkey(
         raise BTClibValueError("Invalid control block length")
     leaf_version = control[0] & 0xFE
     preimage = leaf_version.to_bytes(1, "big") + var_bytes.serialize(script)
-    k = tagged_hash(b"TapLeaf", preimage)
+    k = _TAP_LEAF.hash(preimage)
     for j in range(m):
         e = control[33 + 32 * j : 65 + 32 * j]
         if k < e:
-            k = tagged_hash(b"TapBranch", k + e)
+            k = _TAP_BRANCH.hash(k + e)
         else:
-            k = tagged_hash(b"TapBranch", e + k)
+            k = _TAP_BRANCH.hash(e + k)
     p_bytes = control[1:33]
-    t_bytes = tagged_hash(b"TapTweak", p_bytes + k)
+    t_bytes = _TAP_TWEAK.hash(p_bytes + k)
     p = int.from_bytes(p_bytes, "big")
     t = int.from_bytes(t_bytes, "big")
     # edge case that cannot be reproduced in the test suite
@@ -15,19 +15,23 @@ from typing import Dict, List, Mapping, Optional, Sequence, Type
 
 from btclib import var_bytes, var_int
 from btclib.alias import BinaryData, Octets
+from btclib.change_tracking import ChangeTracked, ChangeTrackedList
 from btclib.utils import bytes_from_octets, bytesio_from_binarydata
 
 
 @dataclass
-class Witness:
+class Witness(ChangeTracked):
     stack: List[bytes]
 
+    _tracked_lists = ("stack",)
+
     def __init__(
         self, stack: Optional[Sequence[Octets]] = None, check_validity: bool = True
     ) -> None:
 
         # https://docs.python.org/3/tutorial/controlflow.html#default-argument-values
-        self.stack = [bytes_from_octets(element) for element in stack] if stack else []
+        stack = [bytes_from_octets(element) for element in stack] if stack else []
+        object.__setattr__(self, "stack", ChangeTrackedList(stack))
 
         if check_validity:
             self.assert_valid()
@@ -35,6 +39,12 @@ class Witness:
     def __len__(self) -> int:
         return len(self.stack)
 
+    @property
+    def size(self) -> int:
+        "Return the Witness serialization length, without serializing it."
+        out = var_int.size(len(self.stack))
+        return out + sum(var_int.size(len(w)) + len(w) for w in self.stack)
+
     def assert_valid(self) -> None:
         for stack_element in self.stack:
             bytes(stack_element)
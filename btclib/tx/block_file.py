@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Bitcoin Core block files (blk*.dat) reader.
+
+A block file is a sequence of records, each one made of
+the 4-byte network magic, the 4-byte little endian block size,
+and the serialized block;
+preallocated files are padded with zeros after the last record.
+
+Since Bitcoin Core 28.0 the block files are obfuscated,
+XOR-ing each byte with the blocks/xor.dat key
+(repeated from the beginning of the file):
+the records are de-obfuscated on the fly, while
+the unobfuscated files (i.e. with no or all-zero key) are read without copies.
+
+The files are memory-mapped and the blocks are yielded one at a time
+with their file offset and size: the record following a block
+starts at offset + size, which can be used to resume reading
+from there:
+
+    >>> from btclib.tx.block_file import block_files, read_block_file
+    >>> for filename in block_files("~/.bitcoin/blocks"):
+    ...     for offset, size, header in read_block_file(filename, mode="header"):
+    ...         pass
+"""
+
+import glob
+import mmap
+import os
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from btclib.alias import Octets
+from btclib.exceptions import BTClibValueError
+from btclib.network import NETWORKS
+from btclib.tx.block_header import BlockHeader
+from btclib.tx.blocks import Block
+from btclib.utils import bytes_from_octets
+
+# network magic and block size
+_RECORD_HEADER_SIZE = 8
+
+_MODES = ("block", "header", "raw")
+
+# obfuscation key file, in the blocks directory
+_XOR_KEY_FILENAME = "xor.dat"
+
+
+def block_files(blocks_dir: str) -> List[str]:
+    "Return the blk*.dat files of a blocks directory, in file number order."
+
+    blocks_dir = os.path.expanduser(blocks_dir)
+    filenames = glob.glob(os.path.join(blocks_dir, "blk[0-9]*.dat"))
+    return sorted(filenames, key=lambda f: int(os.path.basename(f)[3:-4]))
+
+
+def _xor(data: memoryview, key: bytes, offset: int) -> bytes:
+    "Return the data XOR-ed with the key repeated from file offset 0."
+
+    size = len(data)
+    i = offset % len(key)
+    key_stream = (key[i:] + key[:i]) * (size // len(key) + 1)
+    xor = int.from_bytes(data, "big") ^ int.from_bytes(key_stream[:size], "big")
+    return xor.to_bytes(size, "big")
+
+
+def read_xor_key(blocks_dir: str) -> bytes:
+    "Return the obfuscation key of a blocks directory (empty if missing)."
+
+    filename = os.path.join(os.path.expanduser(blocks_dir), _XOR_KEY_FILENAME)
+    if not os.path.isfile(filename):
+        return b""
+    with open(filename, "rb") as file_:
+        return file_.read()
+
+
+def read_block_file(
+    filename: str,
+    start: int = 0,
+    network: str = "mainnet",
+    mode: str = "block",
+    check_validity: bool = True,
+    xor_key: Optional[Octets] = None,
+) -> Iterator[Tuple[int, int, Any]]:
+    """Yield (offset, size, item) for each block in the file.
+
+    offset and size are the file offset and the size
+    of the serialized block, while the item is:
+
+    - for the "block" mode: the parsed Block
+    - for the "header" mode: the parsed BlockHeader only
+    - for the "raw" mode: a memoryview of the serialized block,
+      without copies (e.g. to be scanned with LazyTx),
+      or the de-obfuscated bytes for an obfuscated file
+
+    start is the file offset of the first record to be read,
+    i.e. 0 or the offset + size of an already read block.
+
+    xor_key is the obfuscation key:
+    if not provided, it is read from the xor.dat file
+    in the block file directory, if any.
+    """
+
+    if mode not in _MODES:
+        raise BTClibValueError(f"unknown mode: {mode}")
+    magic = NETWORKS[network].magic_bytes[::-1]
+    filename = os.path.expanduser(filename)
+    if xor_key is None:
+        key = read_xor_key(os.path.dirname(filename))
+    else:
+        key = bytes_from_octets(xor_key)
+    obfuscated = any(key)
+
+    with open(filename, "rb") as file_:
+        if os.fstat(file_.fileno()).st_size == 0:
+            return
+        mm = mmap.mmap(file_.fileno(), 0, access=mmap.ACCESS_READ)
+
+    buf = memoryview(mm)
+
+    def read(pos: int, size: int) -> Union[memoryview, bytes]:
+        data = buf[pos : pos + size]
+        return _xor(data, key, pos) if obfuscated else data
+
+    try:
+        pos = start
+        while pos + _RECORD_HEADER_SIZE <= len(buf):
+            record_header = read(pos, _RECORD_HEADER_SIZE)
+            record_magic = record_header[:4]
+            if record_magic == bytes(4):
+                # preallocated zero padding
+                break
+            if record_magic != magic:
+                err_msg = f"invalid magic bytes at offset {pos}: "
+                err_msg += f"{bytes(record_magic).hex()}"
+                raise BTClibValueError(err_msg)
+            size = int.from_bytes(record_header[4:], "little", signed=False)
+            pos += _RECORD_HEADER_SIZE
+            if pos + size > len(buf):
+                raise BTClibValueError(f"truncated block at offset {pos}")
+
+            if mode == "raw":
+                yield pos, size, read(pos, size)
+            elif mode == "header":
+                header = bytes(read(pos, 80))
+                yield pos, size, BlockHeader.parse(header, check_validity)
+            else:
+                data = bytes(read(pos, size))
+                yield pos, size, Block.parse(data, check_validity)
+            pos += size
+    finally:
+        buf.release()
+        try:
+            mm.close()
+        # raw memoryviews still referenced by the caller:
+        # the map is closed when they are garbage collected
+        except BufferError:  # pragma: no cover
+            pass
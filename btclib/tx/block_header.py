@@ -92,6 +92,12 @@ class BlockHeader:
         power_term = pow(256, genesis_exponent - self.bits[0])
         return significand * power_term
 
+    @property
+    def size(self) -> int:
+        "Return the BlockHeader serialization length."
+        # version, previous_block_hash, merkle_root, time, bits, and nonce
+        return 4 + _HF_LEN + 32 + 4 + 4 + 4
+
     @property
     def hash(self) -> bytes:
         "Return the reversed hash of the BlockHeader."
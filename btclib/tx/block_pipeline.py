@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Multi-process block parsing and validation pipeline.
+
+Raw blocks are fanned out to a pool of worker processes
+(see btclib.pool.imap) that parse and validate them,
+computing their transaction ids:
+only compact BlockSummary results are sent back, in the blocks order.
+
+The raw blocks are consumed lazily, with a bounded number of blocks
+in flight, e.g. directly from the block files:
+
+    >>> from btclib.tx.block_file import block_files, read_block_file
+    >>> from btclib.tx.block_pipeline import process_blocks
+    >>> raw_blocks = (
+    ...     raw
+    ...     for filename in block_files("~/.bitcoin/blocks")
+    ...     for _, _, raw in read_block_file(filename, mode="raw")
+    ... )
+    >>> for summary in process_blocks(raw_blocks):
+    ...     pass
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Union
+
+from btclib.hashes import hash256
+from btclib.pool import imap
+from btclib.tx.blocks import Block
+
+
+@dataclass
+class BlockSummary:
+    "Compact result of the parsing and validation of a block."
+
+    hash: bytes
+    previous_block_hash: bytes
+    size: int
+    weight: int = 0
+    tx_ids: List[bytes] = field(default_factory=list)
+    # None for valid blocks, otherwise the parsing or validation error
+    error: Optional[str] = None
+
+
+def summarize_block(data: bytes, check_validity: bool = True) -> BlockSummary:
+    "Return the BlockSummary of a serialized block."
+
+    # available even if the block cannot be parsed
+    block_hash = hash256(data[:80])[::-1]
+    previous_block_hash = data[4:36][::-1]
+    summary = BlockSummary(block_hash, previous_block_hash, len(data))
+    # all kind of Exceptions are catched because
+    # the error is reported in the summary
+    try:
+        block = Block.parse(data, check_validity=False)
+        if check_validity:
+            block.assert_valid()
+        summary.weight = block.weight
+        summary.tx_ids = [tx.id for tx in block.transactions]
+    except Exception as e:  # pylint: disable=broad-except
+        summary.error = f"{type(e).__name__}: {e}"
+    return summary
+
+
+def _summarize_block(check_validity: bool, data: bytes) -> BlockSummary:
+    return summarize_block(data, check_validity)
+
+
+def process_blocks(
+    raw_blocks: Iterable[Union[bytes, memoryview]],
+    workers: Optional[int] = None,
+    window: Optional[int] = None,
+    check_validity: bool = True,
+) -> Iterator[BlockSummary]:
+    """Yield the BlockSummary of each raw block, in the raw blocks order.
+
+    At most window (default: twice the number of workers)
+    blocks are in flight at any time.
+    workers defaults to the number of CPUs:
+    with a single worker the blocks are processed in-process.
+    """
+
+    # memoryviews (e.g. of memory-mapped files) cannot be pickled
+    blocks = (bytes(raw_block) for raw_block in raw_blocks)
+    return imap(_summarize_block, blocks, (check_validity,), workers, window)
@@ -21,7 +21,8 @@ from typing import Any, Dict, List, Mapping, Optional, Sequence, Type
 from btclib import var_bytes, var_int
 from btclib.alias import BinaryData
 from btclib.exceptions import BTClibValueError
-from btclib.hashes import hash256, merkle_root
+from btclib.hashes import hash256
+from btclib.merkle import MerkleTree
 from btclib.script.script import decode_num
 from btclib.tx.block_header import BlockHeader
 from btclib.tx.tx import Tx
@@ -35,6 +36,9 @@ if sys.version_info.minor == 6:  # pragma: no cover
 
 _HF = hash256
 
+# OP_RETURN, 36-byte push, and the 0xaa21a9ed witness commitment header
+_WITNESS_COMMITMENT_HEADER = bytes.fromhex("6a24aa21a9ed")
+
 
 @dataclass
 class Block:
@@ -43,7 +47,9 @@ class Block:
 
     @property
     def size(self) -> int:
-        return len(self.serialize(check_validity=False))
+        "Return the Block serialization length, without serializing it."
+        out = self.header.size + var_int.size(len(self.transactions))
+        return out + sum(t.size for t in self.transactions)
 
     @property
     def weight(self) -> int:
@@ -116,15 +122,51 @@ class Block:
         return any(tx.is_segwit() for tx in self.transactions)
 
     def assert_valid_merkle_root(self) -> None:
-        data = [
-            tx.serialize(include_witness=False, check_validity=False)
-            for tx in self.transactions
-        ]
-        merkle_root_ = merkle_root(data, _HF)[::-1]
+        tree = MerkleTree((tx.id[::-1] for tx in self.transactions), _HF)
+        merkle_root_ = tree.root[::-1]
         if merkle_root_ != self.header.merkle_root:
             err_msg = f"invalid merkle root: {self.header.merkle_root.hex()}"
             err_msg += f" instead of: {merkle_root_.hex()}"
             raise BTClibValueError(err_msg)
+        # CVE-2012-2459
+        if tree.mutated:
+            raise BTClibValueError("mutated merkle tree: duplicated transactions")
+
+    def assert_valid_witness_commitment(self) -> None:
+        """Assert the validity of the BIP141 witness commitment.
+
+        The commitment, required only if the block has segwit transactions,
+        is in the last coinbase output with the witness commitment header:
+        hash256(witness_root||witness_reserved_value),
+        where witness_root is the Merkle root of the transaction hashes
+        (i.e. wtxid), with a zero hash for the coinbase,
+        and witness_reserved_value is the coinbase witness.
+        """
+
+        if not self.has_segwit_tx():
+            return
+
+        coinbase = self.transactions[0]
+        scripts = [tx_out.script_pub_key.script for tx_out in coinbase.vout]
+        commitments = [
+            script[6:38]
+            for script in scripts
+            if len(script) >= 38 and script[:6] == _WITNESS_COMMITMENT_HEADER
+        ]
+        if not commitments:
+            raise BTClibValueError("missing witness commitment")
+
+        stack = coinbase.vin[0].script_witness.stack
+        if len(stack) != 1 or len(stack[0]) != 32:
+            raise BTClibValueError("invalid coinbase witness reserved value")
+
+        leaves = [b"\x00" * 32] + [tx.hash[::-1] for tx in self.transactions[1:]]
+        witness_root = MerkleTree(leaves, _HF).root
+        commitment = _HF(witness_root + stack[0])
+        if commitment != commitments[-1]:
+            err_msg = f"invalid witness commitment: {commitments[-1].hex()}"
+            err_msg += f" instead of: {commitment.hex()}"
+            raise BTClibValueError(err_msg)
 
     def assert_valid(self) -> None:
 
@@ -137,6 +179,7 @@ class Block:
             transaction.assert_valid()
 
         self.assert_valid_merkle_root()
+        self.assert_valid_witness_commitment()
 
     def serialize(
         self, include_witness: bool = True, check_validity: bool = True
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Lazy, zero-copy, transaction (LazyTx) view over binary data.
+
+Tx.parse eagerly builds the whole object graph (TxIn, OutPoint, Witness,
+TxOut, and the script bytes copies).
+LazyTx instead scans the serialized transaction once,
+only recording the offsets of its fields in a memoryview:
+the fields are decoded on access, while
+id, hash, size, and weight are computed from the buffer slices.
+
+E.g. to scan transactions for a given script_pub_key
+without materializing them:
+
+    >>> from btclib.tx.lazy_tx import LazyTx
+    >>> tx_hex = "01000000010000000000000000000000000000000000000000000000000000000000000000ffffffff0704ffff001d0104ffffffff0100f2052a0100000043410496b538e853519c726a2c91e61ec11600ae1390813a627c66fb8be7947be63c52da7589379515d4e0a604f8141781e62294721166bf621e73a82cbf2342c858eeac00000000"
+    >>> tx = LazyTx(tx_hex)
+    >>> tx.value(0)
+    5000000000
+    >>> tx.id.hex()
+    '0e3e2357e806b6cdb1f70b54c3a3a17b6714ee1f0e68bebb44a74b1efd512098'
+
+LazyTx can also be a view at a given offset of a larger buffer
+(e.g. a block), with end being the offset of the first byte after it.
+"""
+
+from hashlib import sha256
+from math import ceil
+from typing import (
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from btclib.alias import Octets
+from btclib.exceptions import BTClibRuntimeError
+from btclib.script.witness import Witness
+from btclib.tx.out_point import OutPoint
+from btclib.tx.tx import Tx
+from btclib.tx.tx_in import TxIn
+from btclib.tx.tx_out import TxOut
+from btclib.utils import bytes_from_octets
+
+# binary data LazyTx can be a view of
+Buffer = Union[Octets, bytearray, memoryview]
+
+T = TypeVar("T")
+
+
+def _var_int(buf: memoryview, pos: int) -> Tuple[int, int]:
+    "Return the var_int at pos and the position after it."
+
+    i = buf[pos]
+    if i < 0xFD:
+        return i, pos + 1
+    size = {0xFD: 2, 0xFE: 4, 0xFF: 8}[i]
+    end = pos + 1 + size
+    return int.from_bytes(buf[pos + 1 : end], byteorder="little", signed=False), end
+
+
+class _LazySequence(Sequence[T], Generic[T]):
+    "Read-only sequence whose items are decoded on access."
+
+    def __init__(self, length: int, item: Callable[[int], T]) -> None:
+        self._length = length
+        self._item = item
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, i: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, i: slice) -> List[T]:
+        ...
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(i, slice):
+            return [self._item(j) for j in range(*i.indices(self._length))]
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("index out of range")
+        return self._item(i)
+
+
+class LazyTx:
+    """Transaction view decoding its fields only on access.
+
+    vin and vout are read-only sequences of TxIn and TxOut
+    decoded (with a copy of their data only) at each access;
+    value and script_pub_key provide the output fields without copies.
+    """
+
+    def __init__(self, data: Buffer, offset: int = 0) -> None:
+
+        if isinstance(data, str):
+            data = bytes_from_octets(data)
+        buf = memoryview(data).cast("B")
+        self._buf = buf
+        self.start = offset
+
+        try:
+            pos = offset + 4
+            self.segwit = buf[pos] == 0 and buf[pos + 1] == 1
+            if self.segwit:
+                pos += 2
+
+            # start of the vin and vout data, as in the serialization without witness
+            self._vin_vout_start = pos
+            n, pos = _var_int(buf, pos)
+            # _vin_pos[i] is the offset of the i-th input, the last one its end
+            self._vin_pos = [pos]
+            for _ in range(n):
+                script_len, pos = _var_int(buf, pos + 36)
+                pos += script_len + 4
+                self._vin_pos.append(pos)
+
+            n, pos = _var_int(buf, pos)
+            self._vout_pos = [pos]
+            for _ in range(n):
+                script_len, pos = _var_int(buf, pos + 8)
+                pos += script_len
+                self._vout_pos.append(pos)
+
+            self._wit_pos: Optional[List[int]] = None
+            if self.segwit:
+                self._wit_pos = [pos]
+                for _ in range(len(self._vin_pos) - 1):
+                    n, pos = _var_int(buf, pos)
+                    for _ in range(n):
+                        item_len, pos = _var_int(buf, pos)
+                        pos += item_len
+                    self._wit_pos.append(pos)
+        except (IndexError, KeyError) as e:
+            raise BTClibRuntimeError("not enough binary data") from e
+
+        self.end = pos + 4
+        if self.end > len(buf):
+            raise BTClibRuntimeError("not enough binary data")
+
+        self.vin: Sequence[TxIn] = _LazySequence(len(self._vin_pos) - 1, self._tx_in)
+        self.vout: Sequence[TxOut] = _LazySequence(
+            len(self._vout_pos) - 1, self._tx_out
+        )
+
+    def _int(self, pos: int, size: int) -> int:
+        return int.from_bytes(self._buf[pos : pos + size], "little", signed=False)
+
+    @property
+    def version(self) -> int:
+        return self._int(self.start, 4)
+
+    @property
+    def lock_time(self) -> int:
+        return self._int(self.end - 4, 4)
+
+    def _tx_in(self, i: int) -> TxIn:
+        # built with its witness, as reassigning it would be a TxIn change
+        end = self._vin_pos[i + 1]
+        script_sig_start = _var_int(self._buf, self._vin_pos[i] + 36)[1]
+        script_sig = bytes(self._buf[script_sig_start : end - 4])
+        sequence = self._int(end - 4, 4)
+        return TxIn(self.prev_out(i), script_sig, sequence, self.witness(i))
+
+    def _tx_out(self, i: int) -> TxOut:
+        return TxOut.parse(bytes(self._buf[self._vout_pos[i] : self._vout_pos[i + 1]]))
+
+    def prev_out(self, i: int) -> OutPoint:
+        "Return the OutPoint of the i-th input."
+        return OutPoint.parse(
+            bytes(self._buf[self._vin_pos[i] : self._vin_pos[i] + 36])
+        )
+
+    def witness(self, i: int) -> Witness:
+        "Return the Witness of the i-th input."
+        if self._wit_pos is None:
+            return Witness()
+        return Witness.parse(bytes(self._buf[self._wit_pos[i] : self._wit_pos[i + 1]]))
+
+    def value(self, i: int) -> int:
+        "Return the value of the i-th output."
+        return self._int(self._vout_pos[i], 8)
+
+    def script_pub_key(self, i: int) -> memoryview:
+        "Return the script_pub_key of the i-th output, without copying it."
+        start = _var_int(self._buf, self._vout_pos[i] + 8)[1]
+        return self._buf[start : self._vout_pos[i + 1]]
+
+    def _hash256(self, *slices: memoryview) -> bytes:
+        hasher = sha256()
+        for s in slices:
+            hasher.update(s)
+        return sha256(hasher.digest()).digest()[::-1]
+
+    @property
+    def id(self) -> bytes:
+        "Return the transaction id."
+        if not self.segwit:
+            return self.hash
+        return self._hash256(
+            self._buf[self.start : self.start + 4],
+            self._buf[self._vin_vout_start : self._vout_pos[-1]],
+            self._buf[self.end - 4 : self.end],
+        )
+
+    @property
+    def hash(self) -> bytes:
+        "Return the transaction hash, i.e. the hash of the whole data."
+        return self._hash256(self._buf[self.start : self.end])
+
+    @property
+    def size(self) -> int:
+        return self.end - self.start
+
+    def _base_size(self) -> int:
+        if self._wit_pos is None:
+            return self.size
+        return self.size - 2 - (self._wit_pos[-1] - self._wit_pos[0])
+
+    @property
+    def vsize(self) -> int:
+        return ceil(self.weight / 4)
+
+    @property
+    def weight(self) -> int:
+        return self._base_size() * 3 + self.size
+
+    def serialize(self) -> bytes:
+        "Return a copy of the transaction data."
+        return bytes(self._buf[self.start : self.end])
+
+    def to_tx(self, check_validity: bool = True) -> Tx:
+        "Return the fully decoded Tx."
+        return Tx.parse(self.serialize(), check_validity)
@@ -18,13 +18,14 @@ from dataclasses import dataclass
 from typing import Any, Dict, Mapping, Type, Union
 
 from btclib.alias import BinaryData, Octets
+from btclib.change_tracking import ChangeTracked
 from btclib.exceptions import BTClibValueError
 from btclib.utils import bytes_from_octets, bytesio_from_binarydata
 
 
 # FIXME make it frozen
 @dataclass
-class OutPoint:
+class OutPoint(ChangeTracked):
     tx_id: bytes
     vout: int
 
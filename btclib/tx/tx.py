@@ -14,6 +14,14 @@
 Dataclass encapsulating version, lock_time,
 vin (List[TxIn]), and vout (List[TxOut]).
 
+The id and hash properties are memoized,
+as they require the transaction serialization;
+size and weight are computed from the field lengths
+(i.e. without serializing) and memoized too.
+The memoized values are invalidated by any in-place change
+of the transaction, including its TxIn, TxOut, and Witness objects
+and its vin and vout lists (see btclib.change_tracking).
+
 https://en.bitcoin.it/wiki/Transaction
 https://learnmeabitcoin.com/guide/coinbase-transaction
 https://bitcoin.stackexchange.com/questions/20721/what-is-the-format-of-the-coinbase-transaction
@@ -33,6 +41,7 @@ from typing import Any, Dict, List, Mapping, Optional, Sequence, Type, Union
 
 from btclib import var_int
 from btclib.alias import BinaryData
+from btclib.change_tracking import ChangeTracked, ChangeTrackedList
 from btclib.exceptions import BTClibValueError
 from btclib.hashes import hash256
 from btclib.script.witness import Witness
@@ -44,7 +53,7 @@ _SEGWIT_MARKER = b"\x00\x01"
 
 
 @dataclass
-class Tx:
+class Tx(ChangeTracked):
     # 4 bytes, _signed_ little endian
     version: int
     # 0	Not locked
@@ -57,6 +66,8 @@ class Tx:
     vin: List[TxIn]
     vout: List[TxOut]
 
+    _tracked_lists = ("vin", "vout")
+
     # TODO: add fee property when a tx fetcher will be available
 
     @property
@@ -72,9 +83,11 @@ class Tx:
     @property
     def id(self) -> bytes:
         "Return the transaction id."
-        serialized_ = self.serialize(include_witness=False, check_validity=False)
-        hash256_ = hash256(serialized_)
-        return hash256_[::-1]
+        memo = self._memo()
+        if "id" not in memo:
+            serialized_ = self.serialize(include_witness=False, check_validity=False)
+            memo["id"] = hash256(serialized_)[::-1]
+        return memo["id"]
 
     @property
     def hash(self) -> bytes:
@@ -82,14 +95,41 @@ class Tx:
 
         It differs from tx_id for witness transactions.
         """
-        serialized_ = self.serialize(include_witness=True, check_validity=False)
-        hash256_ = hash256(serialized_)
-        return hash256_[::-1]
+        memo = self._memo()
+        if "hash" not in memo:
+            if self.is_segwit():
+                serialized_ = self.serialize(include_witness=True, check_validity=False)
+                memo["hash"] = hash256(serialized_)[::-1]
+            else:
+                # same serialization with or without witness
+                memo["hash"] = self.id
+        return memo["hash"]
+
+    def _base_size(self) -> int:
+        "Return the serialization length without witness."
+        memo = self._memo()
+        if "base_size" not in memo:
+            # 4-byte version and 4-byte lock_time
+            memo["base_size"] = (
+                8
+                + var_int.size(len(self.vin))
+                + sum(tx_in.size for tx_in in self.vin)
+                + var_int.size(len(self.vout))
+                + sum(tx_out.size for tx_out in self.vout)
+            )
+        return memo["base_size"]
 
     @property
     def size(self) -> int:
         "Return the transaction size."
-        return len(self.serialize(include_witness=True, check_validity=False))
+        memo = self._memo()
+        if "size" not in memo:
+            size = self._base_size()
+            if self.is_segwit():
+                size += len(_SEGWIT_MARKER)
+                size += sum(tx_in.script_witness.size for tx_in in self.vin)
+            memo["size"] = size
+        return memo["size"]
 
     @property
     def vsize(self) -> int:
@@ -101,9 +141,7 @@ class Tx:
 
     @property
     def weight(self) -> int:
-        no_wit = len(self.serialize(include_witness=False, check_validity=False)) * 3
-        wit = len(self.serialize(include_witness=True, check_validity=False))
-        return no_wit + wit
+        return self._base_size() * 3 + self.size
 
     @property
     def vwitness(self) -> List[Witness]:
@@ -116,6 +154,13 @@ class Tx:
     def is_coinbase(self) -> bool:
         return len(self.vin) == 1 and self.vin[0].is_coinbase()
 
+    def _latest_change(self) -> int:
+        return max(
+            super()._latest_change(),
+            max((tx_in._latest_change() for tx_in in self.vin), default=0),
+            max((tx_out._latest_change() for tx_out in self.vout), default=0),
+        )
+
     def __init__(
         self,
         version: int = 1,
@@ -125,11 +170,11 @@ class Tx:
         check_validity: bool = True,
     ) -> None:
 
-        self.version = version
-        self.lock_time = lock_time
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "lock_time", lock_time)
         # https://docs.python.org/3/tutorial/controlflow.html#default-argument-values
-        self.vin = list(vin) if vin else []
-        self.vout = list(vout) if vout else []
+        object.__setattr__(self, "vin", ChangeTrackedList(vin or []))
+        object.__setattr__(self, "vout", ChangeTrackedList(vout or []))
 
         if check_validity:
             self.assert_valid()
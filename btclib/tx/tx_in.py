@@ -16,8 +16,9 @@ Dataclass encapsulating prev_out, script_sig, sequence, and script_witness.
 from dataclasses import dataclass, field
 from typing import Any, Dict, Mapping, Type
 
-from btclib import var_bytes
+from btclib import var_bytes, var_int
 from btclib.alias import BinaryData, Octets
+from btclib.change_tracking import ChangeTracked
 from btclib.exceptions import BTClibValueError
 from btclib.script.witness import Witness
 from btclib.tx.out_point import OutPoint
@@ -27,7 +28,7 @@ TX_IN_COMPARES_WITNESS = True
 
 
 @dataclass
-class TxIn:
+class TxIn(ChangeTracked):
     prev_out: OutPoint
     script_sig: bytes
     # If all TxIns have final (0xffffffff) sequence numbers
@@ -59,6 +60,23 @@ class TxIn:
         "Return the nSequence int for compatibility with CTxIn."
         return self.sequence
 
+    def _latest_change(self) -> int:
+        return max(
+            self._change,
+            self.prev_out._latest_change(),
+            self.script_witness._latest_change(),
+        )
+
+    @property
+    def size(self) -> int:
+        """Return the TxIn serialization length, without serializing it.
+
+        As for the serialization, the script_witness is not included.
+        """
+        # 32-byte prev_out.tx_id, 4-byte prev_out.vout, and 4-byte sequence
+        script_sig_size = len(self.script_sig)
+        return 40 + var_int.size(script_sig_size) + script_sig_size
+
     def __init__(
         self,
         prev_out: OutPoint = OutPoint(),
@@ -68,10 +86,10 @@ class TxIn:
         check_validity: bool = True,
     ) -> None:
 
-        self.prev_out = prev_out
-        self.script_sig = bytes_from_octets(script_sig)
-        self.sequence = sequence
-        self.script_witness = script_witness
+        object.__setattr__(self, "prev_out", prev_out)
+        object.__setattr__(self, "script_sig", bytes_from_octets(script_sig))
+        object.__setattr__(self, "sequence", sequence)
+        object.__setattr__(self, "script_witness", script_witness)
 
         if check_validity:
             self.assert_valid()
@@ -17,16 +17,17 @@ Dataclass encapsulating value and script_pub_key
 from dataclasses import dataclass
 from typing import Any, Dict, Mapping, Type, Union
 
-from btclib import var_bytes
+from btclib import var_bytes, var_int
 from btclib.alias import BinaryData, Octets, String
 from btclib.amount import btc_from_sats, sats_from_btc
+from btclib.change_tracking import ChangeTracked
 from btclib.script.script_pub_key import ScriptPubKey
 from btclib.utils import bytes_from_octets, bytesio_from_binarydata
 
 
 # FIXME make it frozen
 @dataclass
-class TxOut:
+class TxOut(ChangeTracked):
     # 8 bytes, unsigned little endian
     value: int  # denominated in satoshi
     script_pub_key: ScriptPubKey
@@ -41,6 +42,16 @@ class TxOut:
         "Return the scriptPubKey bytes for compatibility with CTxOut."
         return self.script_pub_key.script
 
+    def _latest_change(self) -> int:
+        return max(self._change, self.script_pub_key._latest_change())
+
+    @property
+    def size(self) -> int:
+        "Return the TxOut serialization length, without serializing it."
+        # 8-byte value
+        script_size = len(self.script_pub_key.script)
+        return 8 + var_int.size(script_size) + script_size
+
     def __init__(
         self,
         value: int,
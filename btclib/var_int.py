@@ -53,6 +53,22 @@ def parse(stream: BinaryData) -> int:
     return int.from_bytes(stream.read(8), byteorder="little", signed=False)
 
 
+def size(i: int) -> int:
+    "Return the length of the var_int bytes encoding of an integer."
+
+    if i < 0x00:
+        raise BTClibValueError(f"negative integer: {i}")
+    if i < 0xFD:
+        return 1
+    if i <= 0xFFFF:
+        return 3
+    if i <= 0xFFFFFFFF:
+        return 5
+    if i <= 0xFFFFFFFFFFFFFFFF:
+        return 9
+    raise BTClibValueError(f"integer too big for var_int encoding: '{hex_string(i)}'")
+
+
 def serialize(i: int) -> bytes:
     "Return the var_int bytes encoding of an integer."
 
@@ -35,6 +35,7 @@ setup(
         "dataclasses>=0.8; python_version<'3.7'",
         "dataclasses_json",
     ],
+    extras_require={"gmpy2": ["gmpy2"]},
     keywords=(
         "bitcoin cryptography elliptic-curves ecdsa schnorr RFC-6979 "
         "bip32 bip39 electrum base58 bech32 segwit message-signing "
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"Tests for the `btclib.ecc.backend` module."
+
+import secrets
+
+import pytest
+
+from btclib.ecc import backend, dsa, ssa
+from btclib.ecc.curve import CURVES, _double_mult, _mult, mult, multi_mult
+from btclib.ecc.number_theory import mod_inv, mod_sqrt
+from btclib.exceptions import BTClibValueError
+
+
+def test_backends() -> None:
+    assert "python" in backend.BACKENDS
+    default = backend.get_backend()
+    assert default in backend.BACKENDS
+
+    ec = CURVES["secp256k1"]
+    ec2 = CURVES["secp256r1"]
+    q = secrets.randbelow(ec.n - 1) + 1
+    msg = "backend".encode()
+
+    results = []
+    try:
+        for name in backend.BACKENDS:
+            backend.set_backend(name)
+            assert backend.get_backend() == name
+            QJ = _mult(q, ec.GJ, ec)
+            q2J = _mult(q, QJ, ec)
+            double_mult_J = _double_mult(q, QJ, q, ec.GJ, ec)
+            sig_dsa = dsa.sign(msg, q)
+            sig_ssa = ssa.sign(msg, q, q)
+            assert dsa.verify(msg, dsa.gen_keys(q)[1], sig_dsa)
+            assert ssa.verify(msg, ssa.gen_keys(q)[1], sig_ssa)
+            ints = [mod_inv(q, ec.n), mod_sqrt(4, ec.p), mod_sqrt(4, ec2.p)]
+            for x in (*ints, *QJ, *q2J, *double_mult_J):
+                assert type(x) is int  # pylint: disable=unidiomatic-typecheck
+            result = [
+                *ints,
+                QJ,
+                q2J,
+                double_mult_J,
+                mult(q, ec=ec2),
+                mult(q, mult(q, ec=ec2), ec2),
+                multi_mult([q, 2 * q], [ec.G, ec.aff_from_jac(QJ)], ec),
+                sig_dsa,
+                sig_ssa,
+            ]
+            with pytest.raises(BTClibValueError, match="No inverse for "):
+                mod_inv(ec.n, ec.n)
+            results.append(result)
+    finally:
+        backend.set_backend(default)
+
+    assert all(result == results[0] for result in results)
+
+    with pytest.raises(BTClibValueError, match="unknown or unavailable backend: "):
+        backend.set_backend("not a backend")
+    assert backend.get_backend() == default
@@ -16,8 +16,22 @@ from typing import Dict
 import pytest
 
 from btclib.alias import INF, INFJ
-from btclib.ecc.curve import CURVES, Curve, double_mult, mult, multi_mult, secp256k1
-from btclib.ecc.curve_group import jac_from_aff
+from btclib.ecc import backend
+from btclib.ecc.curve import (
+    CURVES,
+    FIXED_BASE_W,
+    Curve,
+    _double_mult,
+    _double_mult_vartime,
+    _mult,
+    _mult_vartime,
+    double_mult,
+    mult,
+    multi_mult,
+    secp256k1,
+)
+from btclib.ecc.curve_group import _double_mult as _double_mult_shamir
+from btclib.ecc.curve_group import jac_from_aff, mult_fixed_window
 from btclib.ecc.number_theory import mod_sqrt
 from btclib.ecc.pedersen import second_generator
 from btclib.exceptions import BTClibTypeError, BTClibValueError
@@ -120,6 +134,13 @@ def test_aff_jac_conversions() -> None:
         with pytest.raises(BTClibValueError, match="INF has no y-coordinate"):
             ec.y_aff_from_jac(INFJ)
 
+        QJ2 = ec.double_jac(QJ)
+        points = [QJ, INFJ, QJ2, ec.GJ, ec.negate_jac(QJ2), INFJ]
+        expected = [ec.aff_from_jac(PJ) for PJ in points]
+        assert ec.aff_from_jac_batch(points) == expected
+        assert ec.aff_from_jac_batch([INFJ]) == [INF]
+        assert ec.aff_from_jac_batch([]) == []
+
 
 def test_add_double_aff() -> None:
     "Test self-consistency of add and double in affine coordinates."
@@ -167,6 +188,53 @@ def test_add_double_jac() -> None:
         assert ec.jac_equality(ec.add_jac(INFJ, ec.negate_jac(INFJ)), INFJ)
 
 
+def test_add_mixed() -> None:
+    "Test consistency of mixed coordinates and Jacobian additions."
+    for ec in all_curves.values():
+
+        # add G and the infinity point
+        assert ec.jac_equality(ec.add_mixed(ec.GJ, INF), ec.GJ)
+        assert ec.jac_equality(ec.add_mixed(INFJ, ec.G), ec.GJ)
+        assert ec.jac_equality(ec.add_mixed(INFJ, INF), INFJ)
+
+        # double G
+        GJ2 = ec.add_mixed(ec.GJ, ec.G)
+        assert ec.jac_equality(GJ2, ec.double_jac(ec.GJ))
+
+        # add G and minus G
+        assert ec.jac_equality(ec.add_mixed(ec.GJ, ec.negate(ec.G)), INFJ)
+
+        # add 2G (Z≠1) and G
+        GJ3 = ec.add_mixed(GJ2, ec.G)
+        assert ec.jac_equality(GJ3, ec.add_jac(GJ2, ec.GJ))
+        assert ec.jac_equality(
+            ec.add_mixed(GJ3, ec.aff_from_jac(GJ3)), ec.double_jac(GJ3)
+        )
+
+
+def test_group_law_a0() -> None:
+    "Test the a=0 dedicated formulas against the generic ones."
+    for ec in all_curves.values():
+        if ec._a != 0:  # pylint: disable=protected-access
+            continue
+        # pylint: disable=protected-access
+        # just a random point, not INF
+        q = 1 + secrets.randbelow(ec.n - 1)
+        QJ = _mult(q, ec.GJ, ec)
+        Q = ec.aff_from_jac(QJ)
+        QJ2 = ec._double_jac(QJ)
+        for PJ in (INFJ, ec.GJ, QJ, QJ2, ec.negate_jac(QJ)):
+            P = ec.aff_from_jac(PJ)
+            assert ec.jac_equality(ec.double_jac(PJ), ec._double_jac(PJ))
+            for RJ in (INFJ, QJ, QJ2):
+                SJ = ec._add_jac(PJ, RJ)
+                assert ec.jac_equality(ec.add_jac(PJ, RJ), SJ)
+                assert ec.jac_equality(ec.add_jac(RJ, PJ), SJ)
+                assert ec.jac_equality(ec.add_mixed(RJ, P), SJ)
+            assert ec.jac_equality(ec.add_mixed(PJ, Q), ec.add_jac(PJ, QJ))
+            assert ec.jac_equality(ec.add_mixed(PJ, INF), PJ)
+
+
 def test_add_double_aff_jac() -> None:
     "Test consistency between affine and Jacobian add/double methods."
     for ec in all_curves.values():
@@ -426,3 +494,51 @@ def test_double_mult() -> None:
     # FIXME
     # T = multi_mult([-5, 1], [H, G])
     # assert T == exp
+
+
+def test_mult_dispatcher() -> None:
+    assert secp256k1.glv
+    assert not any(ec.glv for ec in low_card_curves.values())
+    assert [ec.name for ec in CURVES.values() if ec.glv] == ["secp256k1"]
+
+    for ec in (secp256k1, CURVES["secp256r1"], CURVES["bpp256r1"]):
+        HJ = jac_from_aff(second_generator(ec))
+        for _ in range(4):
+            u = secrets.randbelow(ec.n)
+            v = secrets.randbelow(ec.n)
+            RJ = _mult(u, HJ, ec)
+            assert ec.jac_equality(RJ, mult_fixed_window(u, HJ, ec))
+            RJ = _double_mult(u, HJ, v, ec.GJ, ec)
+            assert ec.jac_equality(RJ, _double_mult_shamir(u, HJ, v, ec.GJ, ec))
+            RJ = _mult_vartime(u, HJ, ec)
+            assert ec.jac_equality(RJ, mult_fixed_window(u, HJ, ec))
+            RJ = _double_mult_vartime(u, HJ, v, ec.GJ, ec)
+            assert ec.jac_equality(RJ, _double_mult_shamir(u, HJ, v, ec.GJ, ec))
+            RJ = _double_mult_vartime(u, HJ, v, HJ, ec)
+            assert ec.jac_equality(RJ, _double_mult_shamir(u, HJ, v, HJ, ec))
+            RJ = _double_mult(u, HJ, v, HJ, ec)
+            assert ec.jac_equality(RJ, _double_mult_shamir(u, HJ, v, HJ, ec))
+
+    for mult_func in (_mult, _mult_vartime):
+        with pytest.raises(BTClibValueError, match="negative m: "):
+            mult_func(-1, secp256k1.GJ, secp256k1)
+    for double_mult_func in (_double_mult, _double_mult_vartime):
+        err_msg = "negative first coefficient: "
+        with pytest.raises(BTClibValueError, match=err_msg):
+            double_mult_func(-1, secp256k1.GJ, 1, secp256k1.GJ, secp256k1)
+        err_msg = "negative second coefficient: "
+        with pytest.raises(BTClibValueError, match=err_msg):
+            double_mult_func(1, secp256k1.GJ, -1, secp256k1.GJ, secp256k1)
+
+
+def test_GJ_table() -> None:
+    ec = Curve(13, 0, 2, (1, 9), 19, 1, False)
+    # pylint: disable=protected-access
+    assert not ec._GJ_tables
+    T = ec.GJ_table
+    assert ec._GJ_tables == {backend.get_backend(): T}
+    assert ec.GJ_table is T
+    assert len(T[0]) == 2 ** FIXED_BASE_W
+    for m in range(-ec.n + 1, 2 * ec.n):
+        R = ec.aff_from_jac(mult_fixed_window(m % ec.n, ec.GJ, ec))
+        assert mult(m, ec=ec) == mult(m, ec.G, ec) == R
@@ -10,21 +10,27 @@
 
 "Tests for the `btclib.curve_group` module."
 
+import copy
 import secrets
 
 import pytest
 
-from btclib.alias import INF, INFJ
+from btclib.alias import INF, INFJ, JacPoint
 from btclib.ecc.curve import secp256k1
 from btclib.ecc.curve_group import (
     MAX_W,
+    PIPPENGER_THRESHOLD,
+    CurveGroup,
     _double_mult,
     _mult,
     _multi_mult,
+    _multi_mult_bos_coster,
+    _multi_mult_pippenger,
     cached_multiples,
     jac_from_aff,
     mult_aff,
     mult_base_3,
+    mult_fixed_base,
     mult_fixed_window,
     mult_fixed_window_cached,
     mult_jac,
@@ -32,6 +38,7 @@ from btclib.ecc.curve_group import (
     mult_recursive_aff,
     mult_recursive_jac,
     multiples,
+    multiples_fixed_base,
 )
 from btclib.ecc.pedersen import second_generator
 from btclib.exceptions import BTClibValueError
@@ -345,6 +352,45 @@ def test_mult_fixed_window_cached() -> None:
             assert ec.jac_equality(K1, mult_jac(k1, ec.GJ, ec))
 
 
+def test_mult_fixed_base() -> None:
+    for w in range(1, MAX_W + 2):
+        for ec in low_card_curves.values():
+            T = multiples_fixed_base(ec.GJ, ec.nlen, ec, w)
+            assert len(T[0]) == 2 ** w
+            # affine table, suitable for mixed addition
+            assert all(ec.is_on_curve(P) for P in T[-1])
+            assert ec.jac_equality(mult_fixed_base(0, T, ec), INFJ)
+            assert ec.jac_equality(mult_fixed_base(1, T, ec), ec.GJ)
+
+            PJ = mult_fixed_base(2, T, ec)
+            assert ec.jac_equality(PJ, ec.add_jac(ec.GJ, ec.GJ))
+
+            PJ = mult_fixed_base(ec.n - 1, T, ec)
+            assert ec.jac_equality(ec.negate_jac(ec.GJ), PJ)
+            assert ec.jac_equality(ec.add_jac(PJ, ec.GJ), INFJ)
+            assert ec.jac_equality(mult_fixed_base(ec.n, T, ec), INFJ)
+
+            for k1 in range(ec.n):
+                K1 = mult_fixed_base(k1, T, ec)
+                assert ec.jac_equality(K1, mult_jac(k1, ec.GJ, ec))
+
+            with pytest.raises(BTClibValueError, match="negative m: "):
+                mult_fixed_base(-1, T, ec)
+
+            err_msg = "m too big for the precomputed table: "
+            with pytest.raises(BTClibValueError, match=err_msg):
+                mult_fixed_base(2 ** (w * len(T)), T, ec)
+
+    with pytest.raises(BTClibValueError, match="non positive w: "):
+        multiples_fixed_base(ec.GJ, ec.nlen, ec, 0)
+
+    ec = secp256k1
+    T = multiples_fixed_base(ec.GJ, ec.nlen, ec, MAX_W)
+    for _ in range(4):
+        m = secrets.randbelow(ec.n)
+        assert ec.jac_equality(mult_fixed_base(m, T, ec), _mult(m, ec.GJ, ec))
+
+
 def test_assorted_jac_mult() -> None:
     ec = ec23_31
     H = second_generator(ec)
@@ -408,6 +454,43 @@ def test_assorted_jac_mult() -> None:
         _double_mult(1, HJ, -5, ec.GJ, ec)
 
 
+def test_multi_mult() -> None:
+    ec = ec23_31
+    H = second_generator(ec)
+    HJ = jac_from_aff(H)
+    # mix of affine (Z=1) and Jacobian (Z≠1) points
+    points = [ec.GJ, HJ, ec.double_jac(ec.GJ), INFJ] * PIPPENGER_THRESHOLD
+    for size in (1, 2, PIPPENGER_THRESHOLD - 1, PIPPENGER_THRESHOLD, len(points)):
+        scalars = [secrets.randbelow(ec.n) for _ in range(size)]
+        expected = INFJ
+        for k, PJ in zip(scalars, points):
+            expected = ec.add_jac(expected, _mult(k, PJ, ec))
+        for multi_mult in (_multi_mult, _multi_mult_bos_coster, _multi_mult_pippenger):
+            assert ec.jac_equality(multi_mult(scalars, points[:size], ec), expected)
+        assert ec.jac_equality(
+            _multi_mult_pippenger([0] * size, points[:size], ec), INFJ
+        )
+
+    ec = secp256k1
+    H = second_generator(ec)
+    HJ = jac_from_aff(H)
+    # unbalanced coefficients
+    scalars = [2 ** 200, 1, 3]
+    points = [ec.GJ, HJ, ec.GJ]
+    expected = ec.add_jac(_mult(2 ** 200 + 3, ec.GJ, ec), HJ)
+    for multi_mult in (_multi_mult_bos_coster, _multi_mult_pippenger):
+        assert ec.jac_equality(multi_mult(scalars, points, ec), expected)
+
+    err_msg = "mismatch between number of scalars and points: "
+    for multi_mult in (_multi_mult, _multi_mult_bos_coster, _multi_mult_pippenger):
+        with pytest.raises(BTClibValueError, match=err_msg):
+            multi_mult([1, 2, 3], [ec.GJ, HJ], ec)
+    err_msg = "negative coefficient: "
+    for multi_mult in (_multi_mult_bos_coster, _multi_mult_pippenger):
+        with pytest.raises(BTClibValueError, match=err_msg):
+            multi_mult([1, -2], [ec.GJ, HJ], ec)
+
+
 def test_jac_equality() -> None:
 
     ec = ec23_31
@@ -430,3 +513,31 @@ def test_INF() -> None:
         secp256k1.y(INF[0])
     with pytest.raises(BTClibValueError, match="invalid x-coordinate: "):
         secp256k1.y(INF[0] + secp256k1.n)
+
+
+def test_a0_group_law() -> None:
+    ec = secp256k1
+    Q = mult_aff(secrets.randbelow(ec.n - 1) + 1, ec.G, ec)
+    QJ, GJ = jac_from_aff(Q), jac_from_aff(ec.G)
+
+    # a copy dispatches to the a=0 formulas on its own parameters
+    ec_group = copy.copy(CurveGroup(ec.p, 0, 7))
+    for P, R in ((Q, ec.G), (Q, Q), (Q, ec.negate(Q)), (INF, Q), (Q, INF)):
+        PJ = INFJ if P == INF else jac_from_aff(P)
+        RJ = INFJ if R == INF else jac_from_aff(R)
+        expected = ec.add_aff(P, R)
+        assert ec_group.aff_from_jac(ec_group.add_jac(PJ, RJ)) == expected
+        assert ec_group.aff_from_jac(ec_group.add_mixed(PJ, R)) == expected
+    assert ec_group.aff_from_jac(ec_group.double_jac(QJ)) == ec.add_aff(Q, Q)
+
+    # subclasses can override the group law
+    class CountingCurveGroup(CurveGroup):
+        calls = 0
+
+        def add_jac(self, Q: JacPoint, R: JacPoint) -> JacPoint:
+            self.calls += 1
+            return super().add_jac(Q, R)
+
+    counting_group = CountingCurveGroup(ec.p, 0, 7)
+    assert counting_group.add_jac(QJ, GJ) == ec.add_jac(QJ, GJ)
+    assert counting_group.calls == 1
@@ -9,16 +9,24 @@
 
 "Tests for the `btclib.curve_group_2` module."
 
+import secrets
+
 import pytest
 
 from btclib.alias import INFJ
 from btclib.ecc.curve import secp256k1
-from btclib.ecc.curve_group import _mult
+from btclib.ecc.curve_group import _double_mult, _mult, jac_from_aff
 from btclib.ecc.curve_group_2 import (
+    LAMBDA,
+    double_mult_endomorphism_secp256k1,
     mult_endomorphism_secp256k1,
+    mult_fixed_window_endomorphism_secp256k1,
     mult_sliding_window,
     mult_w_NAF,
+    multi_mult_w_NAF,
+    multiplier_decomposer,
 )
+from btclib.ecc.pedersen import second_generator
 from btclib.exceptions import BTClibValueError
 from tests.ecc.test_curve import low_card_curves
 
@@ -107,5 +115,121 @@ def test_mult_endomorphism_secp256k1() -> None:
     assert ec.jac_equality(ec.add_jac(PJ, ec.GJ), INFJ)
     assert ec.jac_equality(mult_endomorphism_secp256k1(ec.n, ec.GJ, ec), INFJ)
 
-    with pytest.raises(ValueError, match="negative m: "):
+    with pytest.raises(BTClibValueError, match="negative m: "):
         mult_endomorphism_secp256k1(-1, ec.GJ, ec)
+
+    with pytest.raises(BTClibValueError, match="not the secp256k1 curve group"):
+        mult_endomorphism_secp256k1(1, ec23_31.GJ, ec23_31)
+
+    for _ in range(16):
+        m = secrets.randbelow(2 * ec.n)
+        PJ = mult_endomorphism_secp256k1(m, ec.GJ, ec)
+        assert ec.jac_equality(PJ, _mult(m % ec.n, ec.GJ, ec))
+
+
+def test_mult_fixed_window_endomorphism_secp256k1() -> None:
+    ec = secp256k1
+    mult_ct = mult_fixed_window_endomorphism_secp256k1
+    for w in range(1, 7):
+        assert ec.jac_equality(mult_ct(0, ec.GJ, ec, w), INFJ)
+        assert ec.jac_equality(mult_ct(0, INFJ, ec, w), INFJ)
+
+        assert ec.jac_equality(mult_ct(1, INFJ, ec, w), INFJ)
+        assert ec.jac_equality(mult_ct(1, ec.GJ, ec, w), ec.GJ)
+
+        PJ = mult_ct(2, ec.GJ, ec, w)
+        assert ec.jac_equality(PJ, ec.add_jac(ec.GJ, ec.GJ))
+
+        PJ = mult_ct(ec.n - 1, ec.GJ, ec, w)
+        assert ec.jac_equality(ec.negate_jac(ec.GJ), PJ)
+        assert ec.jac_equality(mult_ct(ec.n, ec.GJ, ec, w), INFJ)
+
+        m = secrets.randbelow(ec.n)
+        PJ = mult_ct(m, ec.GJ, ec, w)
+        assert ec.jac_equality(PJ, _mult(m, ec.GJ, ec))
+
+        with pytest.raises(BTClibValueError, match="negative m: "):
+            mult_ct(-1, ec.GJ, ec, w)
+
+        with pytest.raises(BTClibValueError, match="non positive w: "):
+            mult_ct(1, ec.GJ, ec, -w)
+
+    with pytest.raises(BTClibValueError, match="not the secp256k1 curve group"):
+        mult_ct(1, ec23_31.GJ, ec23_31)
+
+    HJ = jac_from_aff(second_generator(ec))
+    for _ in range(16):
+        m = secrets.randbelow(2 * ec.n)
+        PJ = mult_ct(m, HJ, ec)
+        assert ec.jac_equality(PJ, mult_endomorphism_secp256k1(m, HJ, ec))
+
+
+def test_multi_mult_w_NAF() -> None:
+    for w in range(2, 7):
+        for ec in low_card_curves.values():
+            HJ = jac_from_aff(second_generator(ec))
+            assert ec.jac_equality(multi_mult_w_NAF([], [], ec, w), INFJ)
+            for u in range(ec.n):
+                RJ = multi_mult_w_NAF([u], [ec.GJ], ec, w)
+                assert ec.jac_equality(RJ, _mult(u, ec.GJ, ec))
+                v = secrets.randbelow(ec.n)
+                RJ = multi_mult_w_NAF([u, v], [HJ, ec.GJ], ec, w)
+                assert ec.jac_equality(RJ, _double_mult(u, HJ, v, ec.GJ, ec))
+                RJ = multi_mult_w_NAF([u, v], [INFJ, ec.GJ], ec, w)
+                assert ec.jac_equality(RJ, _mult(v, ec.GJ, ec))
+
+    ec = secp256k1
+    HJ = jac_from_aff(second_generator(ec))
+    u = secrets.randbelow(ec.n)
+    v = secrets.randbelow(ec.n)
+    RJ = multi_mult_w_NAF([u, v], [HJ, ec.GJ], ec)
+    assert ec.jac_equality(RJ, _double_mult(u, HJ, v, ec.GJ, ec))
+
+    err_msg = "mismatch between number of scalars and points: "
+    with pytest.raises(BTClibValueError, match=err_msg):
+        multi_mult_w_NAF([1], [ec.GJ, HJ], ec)
+    with pytest.raises(BTClibValueError, match="negative coefficient"):
+        multi_mult_w_NAF([1, -1], [ec.GJ, HJ], ec)
+    with pytest.raises(BTClibValueError, match="w too low: "):
+        multi_mult_w_NAF([1], [ec.GJ], ec, 1)
+
+
+def test_multiplier_decomposer() -> None:
+    ec = secp256k1
+    for m in (
+        0,
+        1,
+        2,
+        ec.n - 1,
+        ec.n,
+        LAMBDA,
+        *(secrets.randbelow(ec.n) for _ in range(16)),
+    ):
+        m1, m2 = multiplier_decomposer(m, ec)
+        assert (m1 + m2 * LAMBDA - m) % ec.n == 0
+        # half-length scalars
+        assert abs(m1).bit_length() <= 129
+        assert abs(m2).bit_length() <= 129
+
+    with pytest.raises(BTClibValueError, match="negative m: "):
+        multiplier_decomposer(-1, ec)
+
+
+def test_double_mult_endomorphism_secp256k1() -> None:
+    ec = secp256k1
+    HJ = jac_from_aff(second_generator(ec))
+    for u, v in ((0, 0), (1, 0), (0, 1), (ec.n - 1, 1), (ec.n, ec.n - 1)):
+        RJ = double_mult_endomorphism_secp256k1(u, HJ, v, ec.GJ, ec)
+        assert ec.jac_equality(RJ, _double_mult(u % ec.n, HJ, v % ec.n, ec.GJ, ec))
+    for _ in range(16):
+        u = secrets.randbelow(ec.n)
+        v = secrets.randbelow(ec.n)
+        RJ = double_mult_endomorphism_secp256k1(u, HJ, v, ec.GJ, ec)
+        assert ec.jac_equality(RJ, _double_mult(u, HJ, v, ec.GJ, ec))
+    RJ = double_mult_endomorphism_secp256k1(1, INFJ, 1, ec.GJ, ec)
+    assert ec.jac_equality(RJ, ec.GJ)
+
+    with pytest.raises(BTClibValueError, match="negative first coefficient: "):
+        double_mult_endomorphism_secp256k1(-1, HJ, 1, ec.GJ, ec)
+    with pytest.raises(BTClibValueError, match="negative second coefficient: "):
+        double_mult_endomorphism_secp256k1(1, HJ, -1, ec.GJ, ec)
@@ -12,6 +12,7 @@
 
 import secrets
 from hashlib import sha1
+from typing import List
 
 import pytest
 from coincurve._libsecp256k1 import (  # type: ignore # pylint: disable=no-name-in-module
@@ -19,10 +20,11 @@ from coincurve._libsecp256k1 import (  # type: ignore # pylint: disable=no-name-
     lib,
 )
 
-from btclib.alias import INF
-from btclib.ecc import dsa
+from btclib.alias import INF, Point
+from btclib.ecc import bms, dsa
 from btclib.ecc.curve import CURVES, Curve, double_mult, mult
 from btclib.ecc.curve_group import _mult
+from btclib.ecc.key_pair import KeyPair
 from btclib.ecc.number_theory import mod_inv
 from btclib.ecc.sec_point import bytes_from_point, point_from_octets
 from btclib.exceptions import BTClibRuntimeError, BTClibValueError
@@ -321,3 +323,85 @@ def test_sign_input_type() -> None:
     sig = dsa.sign(msg, q)
     dsa.assert_as_valid(msg, Q, sig)
     dsa.assert_as_valid(msg, Q, sig.serialize())
+
+
+def test_batch_validation() -> None:
+
+    ms = [f"msg {i}".encode() for i in range(8)]
+    keys = [dsa.gen_keys(i)[1] for i in range(1, 9)]
+    sigs = [dsa.sign(m, i) for i, m in enumerate(ms, 1)]
+    # the recovery id is the index of the key among the recovered ones
+    recids = [
+        dsa.recover_pub_keys(m, sig).index(Q) for m, Q, sig in zip(ms, keys, sigs)
+    ]
+    dsa.assert_batch_as_valid(ms, keys, sigs, recids)
+    assert dsa.batch_verify(ms, keys, sigs, recids)
+    # bms.Sig recovery flag
+    bms_sig = bms.sign(ms[0], 1)
+    magic_msg = bms.magic_message(ms[0])
+    recid = bms_sig.rf - 27 & 0b11
+    assert dsa.batch_verify([magic_msg], keys[:1], [bms_sig.dsa_sig], [recid])
+    # serialized signatures, missing recovery ids
+    ders = [sig.serialize() for sig in sigs]
+    assert dsa.batch_verify(ms, keys, ders, recids[:4] + [None] * 4)
+    assert dsa.batch_verify(ms, keys, sigs)
+
+    # the batch is valid if and only if all its signatures are valid
+    def _all_valid(
+        ms: List[bytes], keys: List[Point], sigs: List[dsa.Sig], lower_s: bool = True
+    ) -> bool:
+        return all(
+            dsa.verify(m, key, sig, lower_s) for m, key, sig in zip(ms, keys, sigs)
+        )
+
+    # valid signatures with wrong recovery ids
+    wrong = recids[:3] + [recids[3] ^ 1] + recids[4:]
+    dsa.assert_batch_as_valid(ms, keys, sigs, wrong)
+    assert dsa.batch_verify(ms, keys, sigs, wrong) == _all_valid(ms, keys, sigs)
+    for recid in (-1, 4):
+        wrong = [recid] + recids[1:]
+        assert dsa.batch_verify(ms, keys, sigs, wrong) == _all_valid(ms, keys, sigs)
+    # wrong key, with and without recovery id
+    keys[5] = keys[4]
+    assert not _all_valid(ms, keys, sigs)
+    assert not dsa.batch_verify(ms, keys, sigs, recids)
+    assert not dsa.batch_verify(ms, keys, sigs)
+    with pytest.raises(BTClibRuntimeError, match="signature verification failed"):
+        dsa.assert_batch_as_valid(ms, keys, sigs, recids)
+    keys[5] = dsa.gen_keys(6)[1]
+    # high s
+    high_s_sigs = sigs[:2] + [dsa.Sig(sigs[2].r, sigs[2].ec.n - sigs[2].s)] + sigs[3:]
+    assert not _all_valid(ms, keys, high_s_sigs)
+    assert not dsa.batch_verify(ms, keys, high_s_sigs, recids)
+    assert _all_valid(ms, keys, high_s_sigs, lower_s=False)
+    for high_s_recids in (recids, recids[:2] + [recids[2] ^ 1] + recids[3:]):
+        assert dsa.batch_verify(ms, keys, high_s_sigs, high_s_recids, lower_s=False)
+
+    with pytest.raises(BTClibValueError, match="no signatures provided"):
+        dsa.assert_batch_as_valid([], [], [])
+    err_msg = "mismatch between number of pub_keys "
+    for args in ((ms[1:], keys, sigs), (ms, keys, sigs[1:])):
+        with pytest.raises(BTClibValueError, match=err_msg):
+            dsa.assert_batch_as_valid(*args)
+    with pytest.raises(BTClibValueError, match=err_msg):
+        dsa.assert_batch_as_valid(ms, keys, sigs, recids[1:])
+    # signatures on different curves are verified individually
+    sig = dsa.Sig(sigs[1].r, sigs[1].s, CURVES["secp256r1"], check_validity=False)
+    assert not dsa.batch_verify(ms[:2], keys[:2], [sigs[0], sig], recids[:2])
+
+
+def test_sign_batch() -> None:
+
+    ms = [f"msg {i}".encode() for i in range(5)]
+    q = 0xA1
+    sigs = [dsa.sign(m, q) for m in ms]
+    assert dsa.sign_batch(ms, q) == sigs
+    assert dsa.sign_batch(ms, KeyPair(q), workers=2) == sigs
+    m_hashes = [reduce_to_hlen(m) for m in ms]
+    assert dsa.sign_batch_(m_hashes, q, lower_s=False) == [
+        dsa.sign_(m, q, lower_s=False) for m in m_hashes
+    ]
+    assert dsa.sign_batch([], q) == []
+
+    with pytest.raises(BTClibValueError, match="invalid size: 31 bytes instead of 32"):
+        dsa.sign_batch_([m_hashes[0][:-1]], q)
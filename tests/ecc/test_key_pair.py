@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"Tests for the `btclib.ecc.key_pair` module."
+
+import pytest
+
+from btclib.b58 import p2pkh, wif_from_prv_key
+from btclib.ecc import bms, dsa, ssa
+from btclib.ecc.curve import CURVES, mult
+from btclib.ecc.key_pair import KeyPair
+from btclib.exceptions import BTClibValueError
+from btclib.hashes import reduce_to_hlen
+
+
+def test_key_pair() -> None:
+
+    for q in (1, 2, 0xA1):
+        key_pair = KeyPair(q)
+        assert key_pair.q == q
+        assert key_pair.Q == mult(q)
+        assert key_pair.odd_y == (key_pair.Q[1] % 2 == 1)
+        q_bip340, x_Q = ssa.gen_keys(q)
+        assert key_pair.q_bip340 == q_bip340
+        assert key_pair.x_Q == x_Q
+        assert key_pair.x_only == x_Q.to_bytes(32, byteorder="big", signed=False)
+        assert hex(q) not in repr(key_pair)
+        assert (key_pair.network, key_pair.compressed) == ("mainnet", True)
+
+    key_pair = KeyPair(wif_from_prv_key(1, "testnet", False))
+    assert key_pair.q == 1
+    assert (key_pair.network, key_pair.compressed) == ("testnet", False)
+
+    ec = CURVES["secp256r1"]
+    key_pair = KeyPair(b"\x01" * 32, ec)
+    assert key_pair.Q == mult(key_pair.q, ec.G, ec)
+    assert (key_pair.network, key_pair.compressed) == ("mainnet", True)
+
+    assert 0 < KeyPair().q < CURVES["secp256k1"].n
+
+
+def test_signing() -> None:
+
+    msg = "Satoshi Nakamoto".encode()
+    msg_hash = reduce_to_hlen(msg)
+    for q in (1, 2, 0xA1):
+        key_pair = KeyPair(q)
+
+        assert dsa.sign(msg, key_pair) == dsa.sign(msg, q)
+        assert dsa.sign_(msg_hash, key_pair) == dsa.sign_(msg_hash, q)
+
+        assert ssa.sign(msg, key_pair, 3) == ssa.sign(msg, q, 3)
+        assert ssa.sign_(msg_hash, key_pair, 3) == ssa.sign_(msg_hash, q, 3)
+        assert ssa.verify(msg, key_pair.x_only, ssa.sign(msg, key_pair))
+
+        assert bms.sign(msg, key_pair) == bms.sign(msg, q)
+
+    wif = wif_from_prv_key(1, "testnet", False)
+    sig = bms.sign(msg, KeyPair(wif))
+    assert sig == bms.sign(msg, wif)
+    assert bms.verify(msg, p2pkh(wif), sig)
+
+    key_pair = KeyPair(1, CURVES["secp256r1"])
+    err_msg = "ec / key pair "
+    with pytest.raises(BTClibValueError, match=err_msg):
+        dsa.sign(msg, key_pair)
+    with pytest.raises(BTClibValueError, match=err_msg):
+        ssa.sign(msg, key_pair)
+    with pytest.raises(BTClibValueError, match=err_msg):
+        bms.sign(msg, key_pair)
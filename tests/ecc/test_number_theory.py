@@ -12,7 +12,7 @@
 
 import pytest
 
-from btclib.ecc.number_theory import mod_inv, mod_sqrt, tonelli
+from btclib.ecc.number_theory import mod_inv, mod_inv_batch, mod_sqrt, tonelli
 from btclib.exceptions import BTClibValueError
 
 primes = [
@@ -86,6 +86,22 @@ def test_mod_inv() -> None:
                     mod_inv(a, m)
 
 
+def test_mod_inv_batch() -> None:
+    assert mod_inv_batch([], 7) == []
+    for p in primes:
+        a = list(range(1, min(p, 500)))
+        assert mod_inv_batch(a, p) == [mod_inv(x, p) for x in a]
+        a = [x + p for x in a[::-1]]
+        assert mod_inv_batch(a, p) == [mod_inv(x, p) for x in a]
+        with pytest.raises(BTClibValueError, match="No inverse for 0 mod"):
+            mod_inv_batch([1, p, 2], p)
+
+    m = 12
+    assert mod_inv_batch([1, 5, 7, 11], m) == [1, 5, 7, 11]
+    with pytest.raises(BTClibValueError, match="No inverse for 3 mod 12"):
+        mod_inv_batch([1, 5, 3, 2], m)
+
+
 def test_mod_sqrt() -> None:
     for p in primes[:30]:  # exhaustable only for small p
         has_root = {0, 1}
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"Tests for the `btclib.ecc.parallel` module."
+
+import pickle
+from typing import List
+
+import pytest
+
+from btclib.b58 import p2pkh
+from btclib.ecc import bms, dsa, ssa
+from btclib.ecc.curve import CURVES, SEC2v2, secp256k1
+from btclib.ecc.parallel import Item, verify_many
+from btclib.exceptions import BTClibValueError
+
+
+def test_curve_pickle() -> None:
+    # standard curves are pickled by name
+    for ec in (secp256k1, CURVES["secp256r1"]):
+        assert pickle.loads(pickle.dumps(ec)) is ec
+    sig = dsa.sign(b"Satoshi Nakamoto", 1)
+    assert pickle.loads(pickle.dumps(sig)).ec is secp256k1
+    # other curves are pickled by value
+    ec = SEC2v2["secp256k1"]
+    ec2 = pickle.loads(pickle.dumps(ec))
+    assert ec2 is not ec
+    assert repr(ec2) == repr(ec)
+
+
+def test_verify_many() -> None:
+    msgs = [f"msg {i}".encode() for i in range(6)]
+    dsa_items: List[Item] = []
+    ssa_items: List[Item] = []
+    bms_items: List[Item] = []
+    for i, msg in enumerate(msgs, 1):
+        dsa_items.append((msg, dsa.gen_keys(i)[1], dsa.sign(msg, i)))
+        ssa_items.append((msg, ssa.gen_keys(i)[1], ssa.sign(msg, i).serialize()))
+        bms_items.append((msg, p2pkh(dsa.gen_keys(i)[1]), bms.sign(msg, i)))
+    # invalid items: wrong message, wrong key, malformed signature
+    for items in (dsa_items, ssa_items, bms_items):
+        items[1] = (msgs[0],) + items[1][1:]
+        items[2] = (items[2][0], items[3][1], items[2][2])
+        items[4] = items[4][:2] + (b"\x00",)
+    expected = [True, False, False, True, False, True]
+
+    for scheme, items in (("dsa", dsa_items), ("ssa", ssa_items), ("bms", bms_items)):
+        assert verify_many(items, 1, scheme) == expected
+        assert verify_many(items, 2, scheme) == expected
+        assert verify_many(items, 2, scheme, shard_size=4) == expected
+
+    assert verify_many([], 2) == []
+    assert verify_many(dsa_items[:1], 2) == [True]
+
+    with pytest.raises(BTClibValueError, match="unknown signature scheme: "):
+        verify_many(dsa_items, 1, "ecdsa")
+    with pytest.raises(BTClibValueError, match="invalid number of workers: "):
+        verify_many(dsa_items, 0)
+    with pytest.raises(BTClibValueError, match="invalid shard size: "):
+        verify_many(dsa_items, 2, shard_size=0)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"Tests for the `btclib.ecc.sigcache` module."
+
+from hashlib import sha512
+
+import pytest
+
+from btclib.b58 import p2pkh
+from btclib.ecc import bms, dsa, sigcache, ssa
+from btclib.ecc.sigcache import ENTRY_SIZE, SigCache
+from btclib.exceptions import BTClibValueError
+from btclib.hashes import reduce_to_hlen
+
+
+def test_sigcache() -> None:
+    cache = SigCache(3 * ENTRY_SIZE)
+    assert cache.max_size == 3 * ENTRY_SIZE
+    assert len(cache) == 0
+
+    entries = [cache.entry(b"test", i.to_bytes(1, "big")) for i in range(4)]
+    assert entries[0] == cache.entry(b"test", b"\x00")
+    # length prefixed data
+    assert cache.entry(b"ab", b"c") != cache.entry(b"a", b"bc")
+    # salted entries
+    assert entries[0] != SigCache().entry(b"test", b"\x00")
+
+    for entry in entries[:3]:
+        assert entry not in cache
+        cache.add(entry)
+    assert entries[0] in cache  # now the most recently used
+    cache.add(entries[3])  # evicts entries[1]
+    assert len(cache) == 3
+    assert entries[1] not in cache
+    assert all(entry in cache for entry in (entries[0], entries[2], entries[3]))
+    assert cache.stats() == {
+        "hits": 4,
+        "misses": 4,
+        "entries": 3,
+        "max_entries": 3,
+        "max_size": 3 * ENTRY_SIZE,
+    }
+
+    cache.max_size = ENTRY_SIZE
+    assert len(cache) == 1
+    assert entries[3] in cache
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == cache.misses == 0
+
+    with pytest.raises(BTClibValueError, match="too small cache size: "):
+        cache.max_size = ENTRY_SIZE - 1
+
+
+def test_enable_disable() -> None:
+    assert sigcache.get_cache() is None
+    try:
+        cache = sigcache.enable(ENTRY_SIZE * 10)
+        assert sigcache.get_cache() is cache
+        assert cache.max_size == ENTRY_SIZE * 10
+    finally:
+        sigcache.disable()
+    assert sigcache.get_cache() is None
+
+
+def test_cached_verification() -> None:
+    msg = "Satoshi Nakamoto".encode()
+    msg_fake = "Craig Wright".encode()
+    dsa_prv_key, dsa_pub_key = dsa.gen_keys(1)
+    dsa_sig = dsa.sign(msg, dsa_prv_key)
+    ssa_prv_key, ssa_pub_key = ssa.gen_keys(1)
+    ssa_sig = ssa.sign(msg, ssa_prv_key)
+    addr = p2pkh(dsa_pub_key)
+    bms_sig = bms.sign(msg, dsa_prv_key)
+
+    try:
+        cache = sigcache.enable()
+        for _ in range(2):
+            assert dsa.verify(msg, dsa_pub_key, dsa_sig)
+            assert dsa.verify(msg, dsa_pub_key, dsa_sig.serialize())
+            assert not dsa.verify(msg_fake, dsa_pub_key, dsa_sig)
+            assert not dsa.verify(msg, dsa_pub_key, dsa_sig, hf=sha512)
+            assert ssa.verify(msg, ssa_pub_key, ssa_sig)
+            assert ssa.verify(msg, ssa_pub_key, ssa_sig.serialize())
+            assert not ssa.verify(msg_fake, ssa_pub_key, ssa_sig)
+            assert bms.verify(msg, addr, bms_sig)
+            assert bms.verify(msg, addr.encode(), bms_sig.b64encode())
+            assert not bms.verify(msg_fake, addr, bms_sig)
+        # valid signatures are cached at first verification,
+        # invalid ones are never cached
+        assert len(cache) == 3
+        assert cache.hits == 9
+        assert cache.misses == 11
+
+        m_hashes = [reduce_to_hlen(m) for m in (msg, msg_fake, msg)]
+        Qs = [ssa_pub_key, ssa.gen_keys(2)[1], ssa.gen_keys(3)[1]]
+        sigs = [
+            ssa_sig,
+            ssa.sign_(m_hashes[1], 2),
+            ssa.sign_(m_hashes[2], 3),
+        ]
+        cache.clear()
+        assert ssa.batch_verify_(m_hashes[:1], Qs[:1], sigs[:1])
+        assert cache.stats()["misses"] == 1
+        # only the missing entries are verified
+        assert ssa.batch_verify_(m_hashes, Qs, sigs)
+        assert cache.hits == 1
+        assert cache.misses == 3
+        assert len(cache) == 3
+        assert ssa.batch_verify_(m_hashes, Qs, sigs)
+        assert cache.hits == 4
+
+        assert not ssa.batch_verify_(m_hashes, Qs[1:], sigs[1:])
+        assert not ssa.batch_verify_(m_hashes[1:], Qs, sigs[1:])
+        assert not ssa.batch_verify_([], [], [])
+        assert not ssa.batch_verify_(m_hashes[1::-1] + m_hashes[2:], Qs, sigs)
+        assert len(cache) == 3
+    finally:
+        sigcache.disable()
@@ -22,6 +22,7 @@ from btclib.alias import INF, Point, String
 from btclib.bip32.bip32 import BIP32KeyData
 from btclib.ecc import ssa
 from btclib.ecc.curve import CURVES, double_mult, mult
+from btclib.ecc.key_pair import KeyPair
 from btclib.ecc.number_theory import mod_inv
 from btclib.ecc.pedersen import second_generator
 from btclib.ecc.sec_point import bytes_from_point
@@ -95,6 +96,19 @@ def test_signature() -> None:
         ssa.sign_(m_bytes, q, sig.ec.n)
 
 
+def test_inf_key() -> None:
+    "Test the verification when K = sG - eQ is the infinity point."
+
+    ec = CURVES["secp256k1"]
+    q, x_Q = ssa.gen_keys()
+    QJ = ssa.point_from_bip340pub_key(x_Q, ec) + (1,)
+    c = 1 + secrets.randbelow(ec.n - 1)
+    s = c * q % ec.n
+    err_msg = "signature verification failed"
+    with pytest.raises(BTClibRuntimeError, match=err_msg):
+        ssa._assert_as_valid_(c, QJ, x_Q, s, ec)  # pylint: disable=protected-access
+
+
 def test_bip340_vectors() -> None:
     """BIP340 (Schnorr) test vectors.
 
@@ -711,3 +725,41 @@ def test_threshold() -> None:
     # ADDITIONAL PHASE: reconstruction of the private key ###
     secret = (omega1 * alpha1 + omega3 * alpha3) % ec.n
     assert (q1 + q2 + q3) % ec.n in (secret, ec.n - secret)
+
+
+def test_batch_verify_with_blame() -> None:
+
+    ms = [f"msg {i}".encode() for i in range(9)]
+    Qs = [ssa.gen_keys(i)[1] for i in range(1, 10)]
+    sigs = [ssa.sign(m, i) for i, m in enumerate(ms, 1)]
+    assert ssa.batch_verify_with_blame(ms, Qs, sigs) == []
+    assert ssa.batch_verify_with_blame(ms[:1], Qs[:1], sigs[:1]) == []
+
+    # wrong message, swapped keys, invalid key
+    ms[2] = ms[0]
+    Qs[5], Qs[6] = Qs[6], Qs[5]
+    Qs[8] = 0
+    assert not ssa.batch_verify(ms, Qs, sigs)
+    assert ssa.batch_verify_with_blame(ms, Qs, sigs) == [2, 5, 6, 8]
+    assert ssa.batch_verify_with_blame(ms[8:], Qs[8:], sigs[8:]) == [0]
+
+    err_msg = "mismatch between number of pub_keys "
+    with pytest.raises(BTClibValueError, match=err_msg):
+        ssa.batch_verify_with_blame(ms[1:], Qs, sigs)
+    err_msg = "no signatures provided"
+    with pytest.raises(BTClibValueError, match=err_msg):
+        ssa.batch_verify_with_blame([], [], [])
+
+
+def test_sign_batch() -> None:
+
+    ms = [f"msg {i}".encode() for i in range(5)]
+    q, x_Q = ssa.gen_keys(0xA1)
+    for sigs in (ssa.sign_batch(ms, q), ssa.sign_batch(ms, KeyPair(q), workers=2)):
+        assert len(sigs) == len(ms)
+        assert all(ssa.verify(m, x_Q, sig) for m, sig in zip(ms, sigs))
+    assert ssa.sign_batch([], q) == []
+
+    m_hash = reduce_to_hlen(ms[0])
+    with pytest.raises(BTClibValueError, match="invalid size: 31 bytes instead of 32"):
+        ssa.sign_batch_([m_hash[:-1]], q)
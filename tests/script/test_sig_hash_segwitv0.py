@@ -13,6 +13,9 @@
 test vector at https://github.com/bitcoin/bips/blob/master/bip-0143.mediawiki
 """
 
+import pytest
+
+from btclib.exceptions import BTClibValueError
 from btclib.script import sig_hash
 from btclib.script.witness import Witness
 from btclib.tx.tx import Tx
@@ -34,6 +37,59 @@ def test_native_p2wpkh() -> None:
         "c37af31116d1b27caf68aae9e3ac82f1477929014d5b917657d0eb49478cb670"
     )
 
+    txdata = sig_hash.PrecomputedTxData(tx, [utxo_0, utxo_1])
+    for hash_type in sig_hash.SIG_HASH_TYPES[1:]:
+        assert sig_hash.from_tx(
+            [utxo_0, utxo_1], tx, 1, hash_type, txdata
+        ) == sig_hash.from_tx([utxo_0, utxo_1], tx, 1, hash_type)
+
+    # only the hashes required by the sig_hash type are computed
+    # pylint: disable=protected-access
+    txdata = sig_hash.PrecomputedTxData(tx, [utxo_0, utxo_1])
+    sig_hash.from_tx(
+        [utxo_0, utxo_1], tx, 1, sig_hash.NONE | sig_hash.ANYONECANPAY, txdata
+    )
+    assert not txdata._memo
+    sig_hash.from_tx([utxo_0, utxo_1], tx, 1, sig_hash.SINGLE, txdata)
+    assert list(txdata._memo) == ["sha_prevouts"]
+
+    err_msg = "mismatch between number of prevouts "
+    with pytest.raises(BTClibValueError, match=err_msg):
+        sig_hash.PrecomputedTxData(tx, [utxo_0])
+
+    txdata = sig_hash.PrecomputedTxData(tx, [utxo_0, utxo_1])
+    err_msg = "txdata not computed for this transaction"
+    with pytest.raises(BTClibValueError, match=err_msg):
+        sig_hash.from_tx([utxo_0, utxo_1], Tx.parse(tx_bytes), 1, sig_hash.ALL, txdata)
+    err_msg = "prevouts not matching the txdata ones"
+    with pytest.raises(BTClibValueError, match=err_msg):
+        sig_hash.from_tx([utxo_1, utxo_0], tx, 1, sig_hash.ALL, txdata)
+
+    # the hashes are recomputed if the transaction is changed
+    sig_hash.from_tx([utxo_0, utxo_1], tx, 1, sig_hash.ALL, txdata)
+    tx.vin[0].sequence = 0xFFFFFFFF
+    assert sig_hash.from_tx(
+        [utxo_0, utxo_1], tx, 1, sig_hash.ALL, txdata
+    ) == sig_hash.from_tx([utxo_0, utxo_1], tx, 1, sig_hash.ALL)
+    assert sig_hash.from_tx([utxo_0, utxo_1], tx, 1, sig_hash.ALL) != hash_
+    tx.vin.pop()
+    err_msg = "mismatch between number of prevouts "
+    with pytest.raises(BTClibValueError, match=err_msg):
+        sig_hash.from_tx([utxo_0, utxo_1], tx, 0, sig_hash.ALL, txdata)
+    tx = Tx.parse(tx_bytes)
+
+    # legacy and segwit_v0 inputs
+    hash_types = [sig_hash.ALL, sig_hash.SINGLE | sig_hash.ANYONECANPAY]
+    hashes = sig_hash.sig_hashes(tx, [utxo_0, utxo_1], hash_types)
+    assert hashes == [
+        sig_hash.from_tx([utxo_0, utxo_1], tx, i, hash_type)
+        for i, hash_type in enumerate(hash_types)
+    ]
+
+    err_msg = "mismatch between number of inputs "
+    with pytest.raises(BTClibValueError, match=err_msg):
+        sig_hash.sig_hashes(tx, [utxo_0, utxo_1], [sig_hash.ALL])
+
 
 def test_wrapped_p2wpkh() -> None:
     tx_bytes = "0100000001db6b1b20aa0fd7b23880be2ecbd4a98130974cf4748fb66092ac4d3ceb1a54770100000000feffffff02b8b4eb0b000000001976a914a457b684d7f0d539a46a45bbc043f35b59d0d96388ac0008af2f000000001976a914fd270b1ee6abcaea97fea7ad0402e8bd8ad6d77c88ac92040000"
@@ -64,6 +64,27 @@ def test_valid_taproot_key_path() -> None:
                 assert sighash_type != 0
 
             msg_hash = sig_hash.from_tx(prevouts, tx, index, sighash_type)
+            txdata = sig_hash.PrecomputedTxData(tx, prevouts)
+            assert msg_hash == sig_hash.from_tx(
+                prevouts, tx, index, sighash_type, txdata
+            )
+            # the annex is not removed from the tx
+            assert tx.vin[index].script_witness == Witness(x["success"]["witness"])
+
+            # all the inputs at once, if they all are taproot ones
+            if all(
+                is_p2tr(prevout.script_pub_key.script) and tx_in.script_witness.stack
+                for prevout, tx_in in zip(prevouts, tx.vin)
+            ):
+                hash_types = [sig_hash.ALL] * len(tx.vin)
+                hash_types[index] = sighash_type
+                hashes = sig_hash.sig_hashes(tx, prevouts, hash_types)
+                assert hashes[index] == msg_hash
+                assert hashes == [
+                    sig_hash.from_tx(prevouts, tx, i, hash_type)
+                    for i, hash_type in enumerate(hash_types)
+                ]
+                assert tx.vin[index].script_witness == Witness(x["success"]["witness"])
 
             pub_key = type_and_payload(prevouts[index].script_pub_key.script)[1]
 
@@ -147,6 +168,26 @@ def test_valid_taproot_script_path() -> None:
 
     ssa.assert_as_valid_(msg_hash, pub_key, signature)
 
+    # txdata without prevouts: the amounts and scripts are hashed once
+    amounts = [prevout.value for prevout in prevouts]
+    script_pub_keys = [prevout.script_pub_key for prevout in prevouts]
+    txdata = sig_hash.PrecomputedTxData(tx)
+    with pytest.raises(BTClibValueError, match="missing prevouts"):
+        txdata.sha_amounts  # pylint: disable=pointless-statement
+    for hash_type in (sig_hash.ALL, sig_hash.SINGLE):
+        assert sig_hash.taproot(
+            tx, index, amounts, script_pub_keys, hash_type, 0, b"", b"", txdata
+        ) == sig_hash.taproot(
+            tx, index, amounts, script_pub_keys, hash_type, 0, b"", b""
+        )
+    err_msg = "prevouts not matching the txdata ones"
+    with pytest.raises(BTClibValueError, match=err_msg):
+        sig_hash.taproot(
+            tx, index, amounts[::-1], script_pub_keys, 0, 0, b"", b"", txdata
+        )
+    with pytest.raises(BTClibValueError, match=err_msg):
+        sig_hash.from_tx(prevouts[::-1], tx, index, 0, txdata)
+
 
 def test_valid_sighash_type() -> None:
 
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"Tests for the `btclib.change_tracking` module."
+
+import copy
+import pickle
+
+from btclib.change_tracking import ChangeTrackedList
+from btclib.script.witness import Witness
+from btclib.tx.out_point import OutPoint
+from btclib.tx.tx_in import TxIn
+
+# pylint: disable=protected-access
+
+
+def test_change_tracking() -> None:
+    witness = Witness([b"\x01"])
+    assert isinstance(witness.stack, ChangeTrackedList)
+    # creating objects is not a change
+    assert witness._latest_change() == 0
+
+    changes = [witness._latest_change()]
+    witness.stack.append(b"\x02")
+    changes.append(witness._latest_change())
+    witness.stack[0] = b"\x00"
+    changes.append(witness._latest_change())
+    del witness.stack[-1]
+    changes.append(witness._latest_change())
+    witness.stack.sort(reverse=True)
+    changes.append(witness._latest_change())
+    # reassigned lists are tracked too
+    witness.stack = [b"\x01"]
+    assert isinstance(witness.stack, ChangeTrackedList)
+    changes.append(witness._latest_change())
+    witness.stack.append(b"\x02")
+    changes.append(witness._latest_change())
+    assert changes == sorted(set(changes))
+
+    # the latest change of the components is propagated
+    tx_in = TxIn(OutPoint(b"\x01" * 32, 0), script_witness=Witness())
+    latest_change = tx_in._latest_change()
+    tx_in.script_witness.stack.append(b"\x01")
+    assert tx_in._latest_change() > latest_change
+    latest_change = tx_in._latest_change()
+    tx_in.prev_out.vout = 1
+    assert tx_in._latest_change() > latest_change
+    # replacing a component with an older one is a change too
+    latest_change = tx_in._latest_change()
+    tx_in.script_witness = Witness()
+    assert tx_in._latest_change() > latest_change
+
+    # changes of unrelated objects do not affect the latest change
+    latest_change = tx_in._latest_change()
+    witness.stack.append(b"\x03")
+    assert tx_in._latest_change() == latest_change
+
+    # non-tracked list attributes are not converted
+    tx_in.script_sig = [b"\x01"]  # type: ignore
+    assert type(tx_in.script_sig) is list  # pylint: disable=unidiomatic-typecheck
+
+    # copies have no changes
+    for witness_copy in (copy.deepcopy(witness), pickle.loads(pickle.dumps(witness))):
+        assert witness_copy == witness
+        assert isinstance(witness_copy.stack, ChangeTrackedList)
+        assert witness_copy._latest_change() == 0
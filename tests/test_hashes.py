@@ -10,7 +10,9 @@
 
 "Tests for the `btclib.hashes` module."
 
-from btclib.hashes import hash160, hash256
+from hashlib import sha256, sha512
+
+from btclib.hashes import TaggedHasher, hash160, hash256, tagged_hash, tagged_hasher
 from tests.test_to_key import (
     net_unaware_compressed_pub_keys,
     net_unaware_uncompressed_pub_keys,
@@ -29,6 +31,24 @@ def test_hash160_hash256() -> None:
         hash256(hexstring)
 
 
+def test_tagged_hash() -> None:
+    for hf in (sha256, sha512):
+        for tag in (b"TapLeaf", b"BIP0340/challenge"):
+            for msg in (b"", b"\x00" * 32, b"Satoshi Nakamoto" * 10):
+                tag_hash = hf(tag).digest()
+                expected = hf(tag_hash + tag_hash + msg).digest()
+                assert tagged_hash(tag, msg, hf) == expected
+                hasher = TaggedHasher(tag, hf)
+                assert hasher.hash(msg) == expected
+                # the midstate is not modified
+                assert hasher.hash(msg) == expected
+                h = hasher.new()
+                h.update(msg)
+                assert h.digest() == expected
+    assert tagged_hasher(b"TapLeaf", sha256) is tagged_hasher(b"TapLeaf", sha256)
+    assert tagged_hasher(b"TapLeaf", sha512) is not tagged_hasher(b"TapLeaf", sha256)
+
+
 # def test_fingerprint() -> None:
 #
 #     seed = "bfc4cbaad0ff131aa97fa30a48d09ae7df914bcc083af1e07793cd0a7c61a03f65d622848209ad3366a419f4718a80ec9037df107d8d12c19b83202de00a40ad"
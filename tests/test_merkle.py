@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"Tests for the `btclib.merkle` module."
+
+import pytest
+
+from btclib.exceptions import BTClibValueError
+from btclib.hashes import hash256, merkle_root
+from btclib.merkle import MerkleTree, PartialMerkleTree, root_from_proof, verify_proof
+
+
+def test_merkle_tree() -> None:
+
+    for n in range(1, 34):
+        data = [i.to_bytes(2, byteorder="big", signed=False) for i in range(n)]
+        leaves = [hash256(item) for item in data]
+        root = merkle_root(data, hash256)
+
+        tree = MerkleTree(leaves)
+        assert len(tree) == n
+        assert tree.root == root
+        assert not tree.mutated
+        with pytest.raises(BTClibValueError, match="Merkle tree levels not kept"):
+            tree.proof(0)
+
+        # incremental
+        tree = MerkleTree(keep_levels=True)
+        for leaf in leaves:
+            tree.append(leaf)
+        assert tree.root == root
+        assert tree.levels[0] == leaves
+        assert tree.levels[-1] == [root]
+        for i, leaf in enumerate(leaves):
+            proof = tree.proof(i)
+            assert root_from_proof(leaf, i, proof) == root
+            assert verify_proof(leaf, i, proof, root)
+            assert not verify_proof(leaves[i - 1], i, proof, root) or n == 1
+        assert not verify_proof(leaves[0], 2 ** len(tree.proof(0)), tree.proof(0), root)
+        for i in (-1, n):
+            with pytest.raises(BTClibValueError, match="invalid leaf index: "):
+                tree.proof(i)
+
+    # CVE-2012-2459: same root for duplicated last leaves
+    leaves = [hash256(i.to_bytes(1, byteorder="big")) for i in range(3)]
+    tree = MerkleTree(leaves + leaves[-1:])
+    assert tree.root == MerkleTree(leaves).root
+    assert tree.mutated
+
+    with pytest.raises(BTClibValueError, match="empty Merkle tree"):
+        MerkleTree().root  # pylint: disable=expression-not-assigned
+    with pytest.raises(BTClibValueError, match="invalid leaf length: "):
+        MerkleTree([b"\x00" * 31])
+
+
+def test_partial_merkle_tree() -> None:
+
+    n = 13
+    leaves = [hash256(i.to_bytes(1, byteorder="big")) for i in range(n)]
+    root = MerkleTree(leaves).root
+    for matched in ([], [0], [12], [3, 4, 11], list(range(n))):
+        matches = [i in matched for i in range(n)]
+        tree = PartialMerkleTree.from_leaves(leaves, matches)
+        assert len(tree.hashes) <= n
+        assert tree.extract() == (root, [(i, leaves[i]) for i in matched])
+        tree2 = PartialMerkleTree.parse(tree.serialize())
+        assert tree2.extract() == tree.extract()
+        assert tree2.serialize() == tree.serialize()
+
+    tree = PartialMerkleTree.from_leaves(leaves, [i == 3 for i in range(n)])
+    with pytest.raises(BTClibValueError, match="mismatch between number of leaves "):
+        PartialMerkleTree.from_leaves(leaves, [True])
+
+    invalid_trees = {
+        "invalid number of leaves: ": (0, tree.hashes, tree.flags),
+        "too many hashes: ": (1, tree.hashes, tree.flags),
+        "not enough flags: ": (n, tree.hashes, tree.flags[:2]),
+        "invalid hash length: ": (n, [b"\x00"], tree.flags),
+    }
+    for err_msg, args in invalid_trees.items():
+        with pytest.raises(BTClibValueError, match=err_msg):
+            PartialMerkleTree(*args)
+
+    invalid_trees = {
+        "unused hashes": (n, tree.hashes + tree.hashes[:1], tree.flags),
+        "not enough hashes": (n, tree.hashes[:-1], tree.flags),
+        "not enough flags": (n, tree.hashes, tree.flags[:-1]),
+        "unused flags": (n, tree.hashes, tree.flags + [False] * 8),
+        "identical left and right hashes": (
+            n,
+            [leaves[0], leaves[0]],
+            [True, True, True, True, True, False],
+        ),
+    }
+    for err_msg, args in invalid_trees.items():
+        with pytest.raises(BTClibValueError, match=err_msg):
+            PartialMerkleTree(*args).extract()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"Tests for the `btclib.pool` module."
+
+from typing import Iterator, List, Sequence
+
+import pytest
+
+from btclib.exceptions import BTClibValueError
+from btclib.pool import imap, map_shards
+
+
+def _scale(factor: int, items: Sequence[int]) -> List[int]:
+    return [factor * item for item in items]
+
+
+def test_map_shards() -> None:
+
+    items = list(range(10))
+    expected = [3 * item for item in items]
+    assert map_shards(_scale, items, (3,), 1) == expected
+    assert map_shards(_scale, items, (3,), 2) == expected
+    assert map_shards(_scale, items, (3,), 2, shard_size=3) == expected
+    assert map_shards(_scale, [], (3,), 2) == []
+
+    with pytest.raises(BTClibValueError, match="invalid number of workers: "):
+        map_shards(_scale, items, (3,), 0)
+    with pytest.raises(BTClibValueError, match="invalid shard size: "):
+        map_shards(_scale, items, (3,), 2, shard_size=0)
+
+
+def _mul(factor: int, item: int) -> int:
+    return factor * item
+
+
+def test_imap() -> None:
+
+    items = list(range(10))
+    expected = [3 * item for item in items]
+    assert list(imap(_mul, items, (3,), 1)) == expected
+    assert list(imap(_mul, iter(items), (3,), 2)) == expected
+    assert list(imap(_mul, iter(items), (3,), 2, window=1)) == expected
+    assert not list(imap(_mul, [], (3,), 2))
+
+    # the items are consumed lazily, with back-pressure:
+    # no more than window + yielded results items are pulled
+    pulled = 0
+
+    def counting_items() -> Iterator[int]:
+        nonlocal pulled
+        for item in items:
+            pulled += 1
+            yield item
+
+    window = 3
+    for workers in (1, 2):
+        pulled = 0
+        results = imap(_mul, counting_items(), (3,), workers, window)
+        for yielded, expected_result in enumerate(expected[:5], 1):
+            assert next(results) == expected_result
+            assert pulled <= window + yielded
+        assert list(results) == expected[5:]
+        assert pulled == len(items)
+
+    with pytest.raises(BTClibValueError, match="invalid number of workers: "):
+        next(imap(_mul, items, (3,), 0))
+    with pytest.raises(BTClibValueError, match="invalid window size: "):
+        next(imap(_mul, items, (3,), 2, window=0))
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"Tests for the `btclib.tx.block_file` module."
+
+from os import path
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from btclib import var_int
+from btclib.exceptions import BTClibValueError
+from btclib.network import NETWORKS
+from btclib.tx.block_file import block_files, read_block_file, read_xor_key
+from btclib.tx.blocks import Block
+from btclib.tx.lazy_tx import LazyTx
+
+MAGIC = NETWORKS["mainnet"].magic_bytes[::-1]
+
+
+def _blocks() -> List[bytes]:
+    blocks = []
+    for fname in ("block_1.bin", "block_170.bin", "block_481824_complete.bin"):
+        filename = path.join(path.dirname(__file__), "_data", fname)
+        with open(filename, "rb") as file_:
+            blocks.append(file_.read())
+    return blocks
+
+
+def _record(block: bytes, magic: bytes = MAGIC) -> bytes:
+    return magic + len(block).to_bytes(4, "little") + block
+
+
+def test_read_block_file(tmp_path: Path) -> None:
+    blocks = _blocks()
+    filename = str(tmp_path / "blk00000.dat")
+    with open(filename, "wb") as file_:
+        file_.write(b"".join(_record(block) for block in blocks))
+        # preallocated zero padding
+        file_.write(bytes(1000))
+
+    results = list(read_block_file(filename))
+    assert [Block.parse(block) for block in blocks] == [r[2] for r in results]
+    assert [len(block) for block in blocks] == [r[1] for r in results]
+    assert results[0][0] == 8
+
+    # resume after the first block
+    offset, size, _ = results[0]
+    resumed = list(read_block_file(filename, offset + size, mode="header"))
+    assert [r[:2] for r in resumed] == [r[:2] for r in results[1:]]
+    assert [r[2] for r in resumed] == [r[2].header for r in results[1:]]
+
+    # zero-copy raw blocks
+    for (offset, size, raw), block in zip(
+        read_block_file(filename, mode="raw"), blocks
+    ):
+        assert raw == block
+        n = var_int.parse(bytes(raw[80:89]))
+        lazy_tx = LazyTx(raw, 80 + var_int.size(n))
+        assert lazy_tx.id == Block.parse(block).transactions[0].id
+
+    with pytest.raises(BTClibValueError, match="unknown mode: "):
+        next(read_block_file(filename, mode="lazy"))
+
+
+def _obfuscate(data: bytes, key: bytes) -> bytes:
+    key_stream = key * (len(data) // len(key) + 1)
+    return bytes(b ^ k for b, k in zip(data, key_stream))
+
+
+def test_obfuscated_block_file(tmp_path: Path) -> None:
+    blocks = _blocks()
+    data = b"".join(_record(block) for block in blocks) + bytes(1000)
+    plain_filename = str(tmp_path / "blk00000.dat")
+    with open(plain_filename, "wb") as file_:
+        file_.write(data)
+    expected = list(read_block_file(plain_filename))
+
+    # Bitcoin Core >= 28.0 obfuscated blocks directory
+    xor_key = bytes.fromhex("a1b2c3d4e5f60718")
+    blocks_dir = tmp_path / "blocks"
+    blocks_dir.mkdir()
+    with open(blocks_dir / "xor.dat", "wb") as file_:
+        file_.write(xor_key)
+    filename = str(blocks_dir / "blk00000.dat")
+    with open(filename, "wb") as file_:
+        file_.write(_obfuscate(data, xor_key))
+    assert read_xor_key(str(blocks_dir)) == xor_key
+    assert read_xor_key(str(tmp_path)) == b""
+
+    assert list(read_block_file(filename)) == expected
+    # the key can also be provided explicitly
+    other_filename = str(tmp_path / "blk00001.dat")
+    with open(other_filename, "wb") as file_:
+        file_.write(_obfuscate(data, xor_key))
+    assert list(read_block_file(other_filename, xor_key=xor_key.hex())) == expected
+    with pytest.raises(BTClibValueError, match="invalid magic bytes at offset 0: "):
+        list(read_block_file(other_filename))
+
+    # resume after the first block, with an offset not multiple of the key size
+    offset, size, _ = expected[0]
+    assert (offset + size) % len(xor_key)
+    resumed = list(read_block_file(filename, offset + size, mode="header"))
+    assert [r[2] for r in resumed] == [r[2].header for r in expected[1:]]
+
+    raws = [raw for _, _, raw in read_block_file(filename, mode="raw")]
+    assert raws == blocks
+    assert all(isinstance(raw, bytes) for raw in raws)
+
+    # all-zero key: zero-copy memoryviews
+    with open(tmp_path / "xor.dat", "wb") as file_:
+        file_.write(bytes(8))
+    _, _, raw = next(read_block_file(plain_filename, mode="raw"))
+    assert isinstance(raw, memoryview)
+    assert raw == blocks[0]
+
+
+def test_exceptions(tmp_path: Path) -> None:
+    block = _blocks()[0]
+
+    filename = str(tmp_path / "blk00000.dat")
+    open(filename, "wb").close()
+    assert not list(read_block_file(filename))
+
+    with open(filename, "wb") as file_:
+        file_.write(_record(block) + _record(block)[:-1])
+    with pytest.raises(BTClibValueError, match="truncated block at offset "):
+        list(read_block_file(filename))
+
+    with open(filename, "wb") as file_:
+        file_.write(_record(block, NETWORKS["testnet"].magic_bytes[::-1]))
+    with pytest.raises(BTClibValueError, match="invalid magic bytes at offset 0: "):
+        list(read_block_file(filename))
+    assert list(read_block_file(filename, network="testnet"))
+
+
+def test_block_files(tmp_path: Path) -> None:
+    for i in (0, 2, 10, 1):
+        open(tmp_path / f"blk{i:05}.dat", "wb").close()
+    open(tmp_path / "rev00000.dat", "wb").close()
+    filenames = [path.basename(f) for f in block_files(str(tmp_path))]
+    assert filenames == [f"blk{i:05}.dat" for i in (0, 1, 2, 10)]
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"Tests for the `btclib.tx.block_pipeline` module."
+
+from os import path
+from typing import List, Union
+
+from btclib.tx.block_pipeline import BlockSummary, process_blocks, summarize_block
+from btclib.tx.blocks import Block
+
+
+def _blocks() -> List[bytes]:
+    blocks = []
+    for fname in ("block_1.bin", "block_170.bin", "block_481824_complete.bin"):
+        filename = path.join(path.dirname(__file__), "_data", fname)
+        with open(filename, "rb") as file_:
+            blocks.append(file_.read())
+    return blocks
+
+
+def test_summarize_block() -> None:
+    for data in _blocks():
+        block = Block.parse(data)
+        summary = summarize_block(data)
+        assert summary.error is None
+        assert summary.hash == block.header.hash
+        assert summary.previous_block_hash == block.header.previous_block_hash
+        assert summary.size == block.size
+        assert summary.weight == block.weight
+        assert summary.tx_ids == [tx.id for tx in block.transactions]
+
+    # invalid merkle root
+    block = Block.parse(_blocks()[1])
+    block.transactions[1].lock_time = 1
+    data = block.serialize(check_validity=False)
+    summary = summarize_block(data)
+    assert summary.error is not None
+    assert summary.error.startswith("BTClibValueError: invalid merkle root: ")
+    assert summarize_block(data, check_validity=False).error is None
+
+    # truncated block
+    summary = summarize_block(_blocks()[0][:100])
+    assert summary.error is not None
+    assert summary.tx_ids == []
+
+
+def test_process_blocks() -> None:
+    blocks = _blocks()
+    expected = [summarize_block(data) for data in blocks]
+    # memoryviews too, as yielded by read_block_file(mode="raw")
+    raw_blocks: List[Union[bytes, memoryview]] = [
+        blocks[0],
+        memoryview(blocks[1]),
+        blocks[2],
+    ] * 2
+    for workers in (1, 2):
+        for window in (None, 1):
+            results = list(process_blocks(raw_blocks, workers, window))
+            assert all(isinstance(r, BlockSummary) for r in results)
+            assert results == expected * 2
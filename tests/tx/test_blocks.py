@@ -233,6 +233,7 @@ def test_block_481824() -> None:
         assert 0 <= header.difficulty - 888_171_856_257 < 1
         assert header == BlockHeader.parse(header.serialize())
         assert header == BlockHeader.from_dict(header.to_dict())
+        assert header.size == len(header.serialize()) == 80
 
         if i:  # segwit nodes see the witness data
             assert block.has_segwit_tx()
@@ -278,3 +279,39 @@ def test_dataclasses_json_dict() -> None:
     with open(filename, "w", encoding="ascii") as file_:
         json.dump(block_header_d, file_, indent=4)
     assert block_header_data == BlockHeader.from_dict(block_header_d)
+
+
+def test_witness_commitment() -> None:
+
+    fname = "block_481824_complete.bin"
+    filename = path.join(path.dirname(__file__), "_data", fname)
+    with open(filename, "rb") as file_:
+        block = Block.parse(file_.read())
+    block.assert_valid_witness_commitment()
+
+    coinbase = block.transactions[0]
+    stack = coinbase.vin[0].script_witness.stack
+    stack[0] = b"\x01" * 32
+    with pytest.raises(BTClibValueError, match="invalid witness commitment: "):
+        block.assert_valid_witness_commitment()
+    stack.pop()
+    err_msg = "invalid coinbase witness reserved value"
+    with pytest.raises(BTClibValueError, match=err_msg):
+        block.assert_valid_witness_commitment()
+    coinbase.vout.pop()
+    with pytest.raises(BTClibValueError, match="missing witness commitment"):
+        block.assert_valid_witness_commitment()
+
+
+def test_mutated_merkle_tree() -> None:
+
+    fname = "block_200000.bin"
+    filename = path.join(path.dirname(__file__), "_data", fname)
+    with open(filename, "rb") as file_:
+        block = Block.parse(file_.read())
+
+    # 388 transactions: the subtree root of the last 4 is paired
+    # with itself, so duplicating them gives the same merkle root
+    block.transactions += block.transactions[-4:]
+    with pytest.raises(BTClibValueError, match="mutated merkle tree: "):
+        block.assert_valid_merkle_root()
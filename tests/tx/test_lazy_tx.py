@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2020-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"Tests for the `btclib.tx.lazy_tx` module."
+
+from os import path
+
+import pytest
+
+from btclib import var_int
+from btclib.exceptions import BTClibRuntimeError
+from btclib.script.witness import Witness
+from btclib.tx.blocks import Block
+from btclib.tx.lazy_tx import LazyTx
+
+
+def test_block_481824() -> None:
+    filename = path.join(path.dirname(__file__), "_data", "block_481824_complete.bin")
+    with open(filename, "rb") as file_:
+        block_bytes = file_.read()
+    block = Block.parse(block_bytes)
+
+    # lazy scan of the block transactions
+    n = var_int.parse(block_bytes[80:])
+    offset = 80 + len(var_int.serialize(n))
+    lazy_txs = []
+    for _ in range(n):
+        lazy_tx = LazyTx(block_bytes, offset)
+        lazy_txs.append(lazy_tx)
+        offset = lazy_tx.end
+    assert offset == len(block_bytes)
+
+    for lazy_tx, tx in zip(lazy_txs, block.transactions):
+        assert lazy_tx.segwit == tx.is_segwit()
+        assert lazy_tx.id == tx.id
+        assert lazy_tx.hash == tx.hash
+        assert lazy_tx.size == tx.size
+        assert lazy_tx.vsize == tx.vsize
+        assert lazy_tx.weight == tx.weight
+        assert lazy_tx.version == tx.version
+        assert lazy_tx.lock_time == tx.lock_time
+        assert len(lazy_tx.vin) == len(tx.vin)
+        assert len(lazy_tx.vout) == len(tx.vout)
+
+    # a segwit transaction with many inputs and outputs
+    i = max(
+        (i for i, tx in enumerate(block.transactions) if tx.is_segwit()),
+        key=lambda i: len(block.transactions[i].vin) + len(block.transactions[i].vout),
+    )
+    lazy_tx, tx = lazy_txs[i], block.transactions[i]
+    assert lazy_tx.segwit
+    assert lazy_tx.id != lazy_tx.hash
+    assert lazy_tx.vin[0] == tx.vin[0]
+    assert lazy_tx.vin[-1] == tx.vin[-1]
+    assert lazy_tx.vin[:] == tx.vin
+    # decoding the inputs is not a change of them
+    assert all(
+        tx_in._latest_change() == 0  # pylint: disable=protected-access
+        for tx_in in lazy_tx.vin[:]
+    )
+    assert lazy_tx.vout[:] == tx.vout
+    assert lazy_tx.prev_out(0) == tx.vin[0].prev_out
+    assert lazy_tx.witness(0) == tx.vin[0].script_witness
+    for i, tx_out in enumerate(tx.vout):
+        assert lazy_tx.value(i) == tx_out.value
+        assert lazy_tx.script_pub_key(i) == tx_out.script_pub_key.script
+    assert lazy_tx.to_tx() == tx
+    assert lazy_tx.serialize() == tx.serialize(include_witness=True)
+
+    with pytest.raises(IndexError, match="index out of range"):
+        lazy_tx.vin[len(tx.vin)]  # pylint: disable=pointless-statement
+
+    # from a memoryview, with no witness
+    legacy_tx = block.transactions[0].serialize(include_witness=False)
+    lazy_tx = LazyTx(memoryview(legacy_tx))
+    assert not lazy_tx.segwit
+    assert lazy_tx.id == lazy_tx.hash == block.transactions[0].id
+    assert lazy_tx.witness(0) == Witness()
+    assert lazy_tx.weight == lazy_tx.size * 4
+
+
+def test_exceptions() -> None:
+    tx_hex = "01000000010000000000000000000000000000000000000000000000000000000000000000ffffffff0704ffff001d0104ffffffff0100f2052a0100000043410496b538e853519c726a2c91e61ec11600ae1390813a627c66fb8be7947be63c52da7589379515d4e0a604f8141781e62294721166bf621e73a82cbf2342c858eeac00000000"
+    tx_bytes = bytes.fromhex(tx_hex)
+    assert LazyTx(tx_hex).end == len(tx_bytes)
+
+    # missing lock_time
+    with pytest.raises(BTClibRuntimeError, match="not enough binary data"):
+        LazyTx(tx_bytes[:-4])
+    # truncated input
+    with pytest.raises(BTClibRuntimeError, match="not enough binary data"):
+        LazyTx(tx_bytes[:20])
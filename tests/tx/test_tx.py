@@ -16,7 +16,10 @@ from os import path
 import pytest
 
 from btclib.exceptions import BTClibValueError
+from btclib.hashes import hash256
 from btclib.script.witness import Witness
+from btclib.tx.block_header import BlockHeader
+from btclib.tx.blocks import Block
 from btclib.tx.tx import Tx
 from btclib.tx.tx_in import OutPoint, TxIn
 from btclib.tx.tx_out import TxOut
@@ -276,6 +279,90 @@ def test_single_witness() -> None:
     assert any(bool(w) for w in tx.vwitness)
     assert not tx.is_coinbase()
 
+    # sizes computed without serializing
+    assert tx.vin[0].size == len(tx.vin[0].serialize())
+    assert witness.size == len(witness.serialize())
+    assert all(tx_out.size == len(tx_out.serialize()) for tx_out in tx.vout)
+    assert tx.size == len(tx.serialize(include_witness=True))
+    base_size = tx._base_size()  # pylint: disable=protected-access
+    assert base_size == len(tx.serialize(include_witness=False))
+
+
+def test_memoized_properties() -> None:
+    # 4e52f7848dab7dd89ef7ba477939574198a170bfcb2fb34355c69f5e0169f63c
+    tx_bytes = "010000000001019bdea7abb2fa14dead47dd14d03cf82212a25b6096a8da6b14feec3658dbcf9d0100000000ffffffff02a02526000000000017a914f987c321394968be164053d352fc49763b2be55c874361610000000000220020701a8d401c84fb13e6baf169d59684e17abd9fa216c8cc5b9fc63d622ff8c58d04004730440220421fbbedf2ee096d6289b99973509809d5e09589040d5e0d453133dd11b2f78a02205686dbdb57e0c44e49421e9400dd4e931f1655332e8d078260c9295ba959e05d014730440220398f141917e4525d3e9e0d1c6482cb19ca3188dc5516a3a5ac29a0f4017212d902204ea405fae3a58b1fc30c5ad8ac70a76ab4f4d876e8af706a6a7b4cd6fa100f44016952210375e00eb72e29da82b89367947f29ef34afb75e8654f6ea368e0acdfd92976b7c2103a1b26313f430c4b15bb1fdce663207659d8cac749a0e53d70eff01874496feff2103c96d495bfdd5ba4145e3e046fee45e84a8a48ad05bd8dbb395c011a32cf9f88053ae00000000"
+    tx = Tx.parse(tx_bytes)
+    assert tx.weight == 758
+    assert tx.size == 380
+    tx_id = tx.id
+    hash_ = tx.hash
+    assert tx.id is tx_id
+    # changes of other transactions do not invalidate the memoized values
+    other_tx = Tx.parse(tx_bytes)
+    other_tx.vin[0].script_witness.stack.pop()
+    other_tx.lock_time = 1
+    assert tx.id is tx_id
+    assert tx.hash is hash_
+
+    # field assignment invalidates the memoized values
+    tx.lock_time = 1
+    assert tx.id != tx_id
+    assert tx.hash != hash_
+    assert tx.weight == 758
+    tx.lock_time = 0
+    assert tx.id == tx_id
+    assert tx.hash == hash_
+
+    # in-place changes invalidate the memoized values too
+    def hash_reference(tx: Tx, include_witness: bool = True) -> bytes:
+        return hash256(tx.serialize(include_witness))[::-1]
+
+    witness = tx.vin[0].script_witness
+    tx.vin[0].script_witness = Witness()
+    assert tx.hash == tx.id == tx_id
+    assert (tx.size, tx.weight) == (126, 4 * 126)
+    tx.vin[0].script_witness = witness
+    assert tx.hash == hash_
+    assert tx.weight == 758
+
+    witness.stack.append(b"\x01")
+    assert tx.hash == hash_reference(tx)
+    assert tx.size == 380 + 2
+    witness.stack.pop()
+    assert tx.hash == hash_
+
+    tx.vout[0].value += 1
+    assert tx.id == hash_reference(tx, include_witness=False)
+    tx.vout[0].value -= 1
+    assert tx.id == tx_id
+
+    tx.vin[0].prev_out.vout = 0
+    assert tx.id == hash_reference(tx, include_witness=False)
+    tx.vin[0].prev_out.vout = 1
+    assert tx.id == tx_id
+
+    tx.vin.append(TxIn(tx.vin[0].prev_out, b"", 0xFFFFFFFF))
+    assert tx.hash == hash_reference(tx)
+    assert tx.size == len(tx.serialize(include_witness=True))
+    assert tx.weight == 758 + 4 * 41 + 1
+    del tx.vin[1]
+    tx.vout.extend(tx.vout)
+    assert tx.id == hash_reference(tx, include_witness=False)
+    assert tx.size == len(tx.serialize(include_witness=True))
+    tx.vout[2:] = []
+    assert tx.hash == hash_
+    assert tx.weight == 758
+
+    tx.vin = [TxIn(tx.vin[0].prev_out, b"", 0xFFFFFFFF, witness)]
+    assert tx.hash == hash_
+    assert tx.weight == 758
+
+    # the blocks inherit the updated transaction sizes
+    block = Block(BlockHeader.parse(bytes(80), check_validity=False), [tx], False)
+    size, weight = block.size, block.weight
+    witness.stack.append(b"\x01")
+    assert (block.size, block.weight) == (size + 2, weight + 2)
+
 
 def test_double_witness() -> None:
     tx_bytes = "01000000000102322d4f05c3a4f78e97deda01bd8fc5ff96777b62c8f2daa72b02b70fa1e3e1051600000017160014e123a5263695be634abf3ad3456b4bf15f09cc6afffffffffdfee6e881f12d80cbcd6dc54c3fe390670678ebd26c3ae2dd129f41882e3efc25000000171600145946c8c3def6c79859f01b34ad537e7053cf8e73ffffffff02c763ac050000000017a9145ffd6df9bd06dedb43e7b72675388cbfc883d2098727eb180a000000001976a9145f9e96f739198f65d249ea2a0336e9aa5aa0c7ed88ac024830450221009b364c1074c602b2c5a411f4034573a486847da9c9c2467596efba8db338d33402204ccf4ac0eb7793f93a1b96b599e011fe83b3e91afdc4c7ab82d765ce1da25ace01210334d50996c36638265ad8e3cd127506994100dd7f24a5828155d531ebaf736e160247304402200c6dd55e636a2e4d7e684bf429b7800a091986479d834a8d462fbda28cf6f8010220669d1f6d963079516172f5061f923ef90099136647b38cc4b3be2a80b820bdf90121030aa2a1c2344bc8f38b7a726134501a2a45db28df8b4bee2df4428544c62d731400000000"